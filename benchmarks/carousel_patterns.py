@@ -0,0 +1,153 @@
+"""
+Carousel pattern construction benchmark.
+
+Measures the cost of creating patterns (combinator calls), the query time of a typical
+live-coded chain of combinators with constant arguments, the memory allocated by the work
+done for each frame of the carousel clock (`onsets_only()` plus the query of a frame of a
+few typical patterns), the frame time of ten players sharing a subtree, with and
+without shared queries, the query time of dense boolean structures (struct, mask) and of
+many-layer patterns (layer, superimpose, jux) and the frame time of long sequences (64-step
+mini-notation strings), alternations (<a b c>, a | b | c) and randomised patterns, and
+the cost of a sample of perlin noise.
+
+Usage: python benchmarks/carousel_patterns.py [iterations]
+"""
+
+from shrimp.Systems.Carousel import Pattern, TimeSpan, n, s, pure, rev, stack, irand, shared_queries
+from shrimp.Systems.Carousel import perlin, saw
+import tracemalloc
+import time
+import sys
+
+
+def run(iterations: int = 100_000) -> None:
+    query = lambda span: []
+    start = time.perf_counter()
+    for _ in range(iterations):
+        Pattern(query)
+    elapsed = time.perf_counter() - start
+    print(f"Pattern():          {elapsed / iterations * 1e6:.2f} µs")
+
+    pattern = s("bd [cp cp] hh*4")
+    start = time.perf_counter()
+    for _ in range(iterations):
+        pattern.fast(2)
+    elapsed = time.perf_counter() - start
+    print(f"pattern.fast(2):    {elapsed / iterations * 1e6:.2f} µs")
+
+    chain = (
+        s("bd*2 [sn cp] hh*4")
+        .n("0 1 2")
+        .fast(2)
+        .late(0.125)
+        .sometimes_by(0.3, lambda p: p.fast(2))
+        .slow(1.5)
+        .early(0.25)
+    )
+    cycles = max(1, iterations // 1000)
+    start = time.perf_counter()
+    for cycle in range(cycles):
+        chain.query(TimeSpan(cycle, cycle + 1))
+    elapsed = time.perf_counter() - start
+    print(f"chain query:        {elapsed / cycles * 1e6:.1f} µs/cycle")
+
+    patterns = [
+        s("bd [cp cp] <hh sn>").n(irand(8).segment(4)),
+        stack(s("bd*4"), n("0 3 5 7").fast(2)),
+        n("<0 3 5 7>*8").off(0.125, lambda p: p + n(12)),
+    ]
+    frames, frame = max(1, iterations // 100), 1 / 32
+    start = time.perf_counter()
+    for i in range(frames):
+        for pattern in patterns:
+            pattern.onsets_only().query(TimeSpan(i * frame, (i + 1) * frame))
+    elapsed = time.perf_counter() - start
+    print(f"frame ({len(patterns)} patterns): {elapsed / frames * 1e6:.1f} µs")
+
+    structures = {
+        'pure(1).struct("t*16")': pure(1).struct("t*16"),
+        "pure(1).struct([1] * 16)": pure(1).struct([1] * 16),
+        'pure(1).fast(16).mask("t*16")': pure(1).fast(16).mask("t*16"),
+        's("bd").struct("t*16")': s("bd").struct("t*16"),
+    }
+    for label, pattern in structures.items():
+        start = time.perf_counter()
+        for cycle in range(cycles):
+            pattern.query(TimeSpan(cycle, cycle + 1))
+        elapsed = time.perf_counter() - start
+        print(f"{label + ':':31} {elapsed / cycles * 1e6:.1f} µs/cycle")
+
+    base = s("bd*2 [sn cp] hh*4").n("0 1 2")
+    layered = {
+        "layer (8 layers)": base.layer(*[lambda p, i=i: p.gain(1 - i / 10) for i in range(8)]),
+        "superimpose x3": base.superimpose(lambda p: p.speed(2))
+        .superimpose(lambda p: p.late(0.125))
+        .superimpose(lambda p: p.fast(2)),
+        "jux(rev)": base.jux(rev),
+    }
+    for label, pattern in layered.items():
+        start = time.perf_counter()
+        for cycle in range(cycles):
+            pattern.query(TimeSpan(cycle, cycle + 1))
+        elapsed = time.perf_counter() - start
+        print(f"{label + ':':31} {elapsed / cycles * 1e6:.1f} µs/cycle")
+
+    sequences = {
+        "64 steps": n(" ".join(str(i % 12) for i in range(64))),
+        "64 steps, nested": n(" ".join(f"[{i % 12} {i % 7}]" for i in range(64))),
+        "<a b c d>*8": s("<bd sn hh cp>*8"),
+        "a | b | c": s("bd*2 sn | hh*8 | [cp cp] bd"),
+        "degrade (hh*16?)": s("hh*16?"),
+        "sometimes_by(0.3)": s("hh*16").sometimes_by(0.3, lambda p: p.speed(2)),
+    }
+    for label, pattern in sequences.items():
+        start = time.perf_counter()
+        for i in range(frames):
+            pattern.onsets_only().query(TimeSpan(i * frame, (i + 1) * frame))
+        elapsed = time.perf_counter() - start
+        print(f"{label + ':':31} {elapsed / frames * 1e6:.1f} µs/frame")
+
+    noises = {"perlin()": perlin(), "perlin(saw() * 4)": perlin(saw() * 4)}
+    for label, pattern in noises.items():
+        start = time.perf_counter()
+        for i in range(frames):
+            pattern.query(TimeSpan(i * frame, (i + 1) * frame))
+        elapsed = time.perf_counter() - start
+        print(f"{label + ':':31} {elapsed / frames * 1e6:.1f} µs/sample")
+
+    # Ten players built from the same subtree, as re-evaluated in a live set
+    players = [
+        stack(s("bd*4 [~ bd] sn*2"), s("hh*16").n(irand(8)), n("<0 3 5 7>*8").fast(2))
+        .slow(2)
+        .every(i + 2, lambda p: p.fast(2))
+        for i in range(10)
+    ]
+    for shared in (False, True):
+        start = time.perf_counter()
+        for i in range(frames):
+            span = TimeSpan(i * frame, (i + 1) * frame)
+            if shared:
+                with shared_queries():
+                    for player in players:
+                        player.onsets_only().query(span)
+            else:
+                for player in players:
+                    player.onsets_only().query(span)
+        elapsed = time.perf_counter() - start
+        label = "shared" if shared else "separate"
+        print(f"10 players, {label + ':':9} {elapsed / frames * 1e6:.1f} µs/frame")
+
+    tracemalloc.start()
+    peaks = []
+    for i in range(frames):
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+        for pattern in patterns:
+            pattern.onsets_only().query(TimeSpan(i * frame, (i + 1) * frame))
+        peaks.append(tracemalloc.get_traced_memory()[1] - base)
+    tracemalloc.stop()
+    print(f"frame peak memory:  {sum(peaks) / len(peaks) / 1024:.1f} KiB")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
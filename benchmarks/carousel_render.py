@@ -0,0 +1,58 @@
+"""
+Carousel multi-process rendering benchmark.
+
+Renders a large set of heavy patterns (stacked, layered and randomised) for a number of
+cycles, first serially in this process as the clock thread does, then with the process
+pool render backend for an increasing number of workers, and prints the rendering rate
+in cycles/s (one cycle = one cycle of every pattern of the set).
+
+Usage: python benchmarks/carousel_render.py [cycles] [patterns]
+"""
+
+from shrimp.Systems.Carousel.Render import ProcessRenderer, compile_source
+from shrimp.Systems.Carousel.TimeSpan import TimeSpan
+import time
+import sys
+import os
+
+SOURCES = [
+    "stack(s('bd*4 [~ bd] sn*2'), s('hh*16').gain(rand().range(0.5, 1)),"
+    " n('<0 3 5 7>*8').off(0.125, lambda p: p + n(12))).jux(rev) >> out(superdirt)",
+    "s('[bd sn]*8').n(irand(12).segment(32)).every(3, lambda p: p.fast(2)) >> out(superdirt)",
+    "n('0 1 2 3 4 5 6 7 8 9 10 11 12 13 14 15').fast(4).degrade_by(0.3)"
+    ".superimpose(lambda p: p.early(0.25) + n(7)) >> out(superdirt)",
+]
+
+
+def run(cycles: int = 32, patterns: int = 30) -> None:
+    sources = [SOURCES[i % len(SOURCES)] + f".gain({1 + i / 1000})" for i in range(patterns)]
+    targets = {"superdirt": None}
+
+    compiled = [compile_source(source, targets) for source in sources]
+    start = time.perf_counter()
+    for cycle in range(cycles):
+        for pattern in compiled:
+            list(pattern.onsets_only().query(TimeSpan(cycle, cycle + 1)))
+    elapsed = time.perf_counter() - start
+    print(f"{patterns} patterns, serial:    {cycles / elapsed:,.1f} cycles/s")
+
+    workers = 1
+    while workers <= (os.cpu_count() or 1):
+        renderer = ProcessRenderer(workers=workers, targets=targets, lookahead=workers)
+        for i, source in enumerate(sources):
+            renderer.set_source(f"d{i}", source)
+        # Warm up: spawn the workers and compile the sources
+        for i in range(patterns):
+            renderer.events(f"d{i}", 0, 1, timeout=None)
+        start = time.perf_counter()
+        for cycle in range(1, cycles + 1):
+            for i in range(patterns):
+                renderer.events(f"d{i}", cycle, cycle + 1, timeout=None)
+        elapsed = time.perf_counter() - start
+        renderer.close()
+        print(f"{patterns} patterns, {workers:2} workers: {cycles / elapsed:,.1f} cycles/s")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    run(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,67 @@
+"""
+Event ring handoff benchmark.
+
+A producer process pushes encoded /dirt/play events to the consumer (this process),
+through the shared memory event ring, then through a multiprocessing.Queue of pickled
+(deadline, target, address, arguments) tuples for comparison. Prints the handoff rate
+in events/s.
+
+Usage: python benchmarks/event_ring.py [events]
+"""
+
+from shrimp.IO.ring import EventRing
+from shrimp.IO.osc import _encode_arguments
+import multiprocessing
+import time
+import sys
+
+ARGUMENTS = ["s", "superpiano", "n", 60, "orbit", 0, "cps", 0.5625, "cycle", 12.25]
+
+
+def produce_ring(name: str, events: int) -> None:
+    ring = EventRing(name=name)
+    blob = _encode_arguments(ARGUMENTS)
+    for i in range(events):
+        while not ring.push(i * 0.001, 0, 0, blob):
+            time.sleep(0)
+    ring.close()
+
+
+def produce_queue(queue: multiprocessing.Queue, events: int) -> None:
+    for i in range(events):
+        queue.put((i * 0.001, 0, 0, ARGUMENTS))
+
+
+def run(events: int = 200_000) -> None:
+    context = multiprocessing.get_context("spawn")
+    received = 0
+
+    def count(deadline, target, address, blob):
+        nonlocal received
+        received += 1
+
+    ring = EventRing(capacity=4096)
+    producer = context.Process(target=produce_ring, args=(ring.name, events))
+    producer.start()
+    start = time.perf_counter()
+    while received < events:
+        if not ring.drain(count):
+            time.sleep(0)
+    elapsed = time.perf_counter() - start
+    producer.join()
+    ring.close()
+    print(f"event ring:            {events / elapsed:,.0f} events/s")
+
+    queue = context.Queue(maxsize=4096)
+    producer = context.Process(target=produce_queue, args=(queue, events))
+    producer.start()
+    start = time.perf_counter()
+    for _ in range(events):
+        queue.get()
+    elapsed = time.perf_counter() - start
+    producer.join()
+    print(f"multiprocessing.Queue: {events / elapsed:,.0f} events/s")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
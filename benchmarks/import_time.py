@@ -0,0 +1,59 @@
+"""
+Startup time benchmark.
+
+Starts the interactive session (`from shrimp import *`) in a fresh interpreter with
+`python -X importtime` and reports the wall-clock time, the cumulative import time of
+the session and of the headless entry point (shrimp.core), and the slowest imports.
+With --shell, the REPL (ptpython) is imported as well, which is what it takes to get
+to the prompt. The target is 200 ms to the prompt.
+
+Usage: python benchmarks/import_time.py [--shell] [runs]
+"""
+
+import subprocess
+import statistics
+import time
+import sys
+
+TARGET = 0.2
+
+
+def import_once(shell: bool) -> tuple[float, dict[str, int]]:
+    """Import shrimp in a new interpreter, returning the wall-clock time and the
+    cumulative import time of each module in microseconds."""
+    code = "from shrimp import *; import ptpython.repl" if shell else "from shrimp import *"
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code + "; clock._stop()"],
+        capture_output=True,
+        text=True,
+    )
+    elapsed = time.perf_counter() - start
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        modules[name.strip()] = int(cumulative)
+    return elapsed, modules
+
+
+def run(runs: int = 5, shell: bool = False) -> None:
+    import_once(shell)  # Warm up the bytecode and grammar caches
+    results = [import_once(shell) for _ in range(runs)]
+    wall = statistics.median(elapsed for elapsed, _ in results)
+    _, modules = results[-1]
+
+    print(f"wall clock:    {wall * 1000:8.1f} ms (median of {runs})")
+    print(f"shrimp.session:{modules.get('shrimp.session', 0) / 1000:8.1f} ms")
+    print(f"shrimp.core:   {modules.get('shrimp.core', 0) / 1000:8.1f} ms")
+    print("slowest top-level imports:")
+    top_level = {name: t for name, t in modules.items() if "." not in name and name != "shrimp"}
+    for name, cumulative in sorted(top_level.items(), key=lambda x: -x[1])[:10]:
+        print(f"  {name:24} {cumulative / 1000:8.1f} ms")
+    print(f"target ({TARGET * 1000:.0f} ms): {'ok' if wall <= TARGET else 'missed'}")
+
+
+if __name__ == "__main__":
+    arguments = [a for a in sys.argv[1:] if a != "--shell"]
+    run(int(arguments[0]) if arguments else 5, shell="--shell" in sys.argv[1:])
@@ -0,0 +1,59 @@
+"""
+MIDI clock jitter benchmark.
+
+Opens a virtual MIDI input, points a MIDIOut at it, enables the MIDI clock
+generator and measures the interval between received clock messages. The
+expected interval is 60 / (tempo * 24) seconds.
+
+Usage: python benchmarks/midi_clock_jitter.py [tempo] [seconds]
+"""
+
+from shrimp.Time.Clock import Clock
+from shrimp.IO.midi import MIDIOut
+import statistics
+import mido
+import time
+import sys
+
+PORT_NAME = "shrimp-jitter"
+
+
+def run(tempo: float = 120, duration: float = 10) -> None:
+    received = []
+    midi_in = mido.open_input(
+        PORT_NAME,
+        virtual=True,
+        callback=lambda msg: received.append(time.perf_counter()) if msg.type == "clock" else None,
+    )
+
+    clock = Clock(tempo)
+    clock._start()
+    time.sleep(0.1)
+    clock.play()
+
+    midi_out = MIDIOut(PORT_NAME, clock)
+    midi_out.sync_clock(True)
+    time.sleep(duration)
+    midi_out.sync_clock(False)
+    clock._stop()
+    midi_in.close()
+
+    expected = 60 / (tempo * 24)
+    intervals = [b - a for a, b in zip(received, received[1:])]
+    errors = sorted(abs(i - expected) * 1e6 for i in intervals)
+    if not errors:
+        print("No clock message received.")
+        return
+
+    print(f"Tempo: {tempo} BPM, {len(received)} clock messages in {duration}s")
+    print(f"Expected interval: {expected * 1e3:.3f} ms")
+    print(f"Mean interval:     {statistics.mean(intervals) * 1e3:.3f} ms")
+    print(f"Jitter (stdev):    {statistics.pstdev(intervals) * 1e6:.1f} us")
+    print(f"Jitter (p99):      {errors[int(len(errors) * 0.99) - 1]:.1f} us")
+    print(f"Jitter (max):      {errors[-1]:.1f} us")
+
+
+if __name__ == "__main__":
+    tempo = float(sys.argv[1]) if len(sys.argv) > 1 else 120
+    duration = float(sys.argv[2]) if len(sys.argv) > 2 else 10
+    run(tempo, duration)
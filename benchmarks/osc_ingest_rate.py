@@ -0,0 +1,79 @@
+"""
+OSC ingest rate benchmark.
+
+Measures how many OSC packets per second the input path can absorb:
+
+- parse: the in-place parser used by OSC.listen against osc4py3's decode_packet
+  followed by the value storage previously used by OSC.watch.
+- udp: packets sent from another thread to a listening OSC port, counted once
+  they have been stored in the latest-value table.
+
+Usage: python benchmarks/osc_ingest_rate.py [packets]
+"""
+
+from osc4py3 import oscbuildparse
+from shrimp.Time.Clock import Clock
+from shrimp.IO.osc import OSC, _parse_packet
+from shrimp.utils import flatten
+import threading
+import socket
+import time
+import sys
+
+PORT = 57399
+
+
+def bench_parse(packet: bytes, packets: int) -> None:
+    buffer = bytearray(packet)
+    values, handlers = {}, {}
+    start = time.perf_counter()
+    for _ in range(packets):
+        _parse_packet(buffer, 0, len(buffer), values, handlers)
+    new = time.perf_counter() - start
+
+    watched = {}
+    start = time.perf_counter()
+    for _ in range(packets):
+        message = oscbuildparse.decode_packet(packet)
+        watched[message.addrpattern] = {"args": flatten((message.arguments,)), "kwargs": {}}
+    old = time.perf_counter() - start
+
+    print(f"parse (shrimp):  {packets / new:12,.0f} packets/s")
+    print(f"parse (osc4py3): {packets / old:12,.0f} packets/s")
+
+
+def bench_udp(packet: bytes, packets: int) -> None:
+    osc = OSC("bench", "127.0.0.1", PORT + 1, Clock(120))
+    osc.listen(PORT, "127.0.0.1")
+    osc._in_socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 22)
+    received = [0]
+    osc.attach("/fader", lambda *args: received.__setitem__(0, received[0] + 1))
+
+    def blast():
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        for i in range(packets):
+            sock.sendto(packet, ("127.0.0.1", PORT))
+            if i % 256 == 0:
+                time.sleep(0)  # let the loop thread drain the socket
+
+    start = time.perf_counter()
+    sender = threading.Thread(target=blast)
+    sender.start()
+    sender.join()
+    deadline = time.perf_counter() + 2
+    while received[0] < packets and time.perf_counter() < deadline:
+        time.sleep(0.001)
+    elapsed = time.perf_counter() - start
+    osc._stop(None)
+
+    print(f"udp ingest:      {received[0] / elapsed:12,.0f} packets/s ", end="")
+    print(f"({received[0]}/{packets} received)")
+
+
+if __name__ == "__main__":
+    packets = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    packet = oscbuildparse.encode_packet(
+        oscbuildparse.OSCMessage("/fader", ",ffff", [0.1, 0.2, 0.3, 0.4])
+    )
+    bench_parse(packet, packets)
+    bench_udp(packet, packets)
@@ -0,0 +1,52 @@
+"""
+PlayerSystem iteration rate benchmark.
+
+Runs 40 players (p0..p19, P0..P19) without starting the clock thread and calls their
+iteration function (argument resolution, send method, rescheduling) in a round-robin
+fashion. Also measures the cost of resolving arguments with the compiled Sender plan.
+
+Usage: python benchmarks/player_iterations.py [iterations]
+"""
+
+from shrimp.Time.Clock import Clock
+from shrimp.Systems.PlayerSystem.PatternPlayer import Player, Sender
+from shrimp.Systems.PlayerSystem.Library.SequencePattern import Pseq
+from shrimp.Systems.PlayerSystem.Library.RandomPattern import Prand
+import time
+import sys
+
+
+def make_sender() -> Sender:
+    return Player._play_factory(
+        lambda *args, **kwargs: None,
+        note=Pseq(60, 62, 64, 67),
+        velocity=Prand(80, 100, 120),
+        channel=1,
+        length=[0.25, 0.5],
+        period=0.25,
+    )
+
+
+def run(iterations: int = 100_000) -> None:
+    clock = Clock(120)
+    players = list(Player.initialize_patterns(clock).values())
+    for player in players:
+        player >> make_sender()
+
+    start = time.perf_counter()
+    for i in range(iterations):
+        player = players[i % len(players)]
+        player._func(player.current_pattern)
+    elapsed = time.perf_counter() - start
+    print(f"{len(players)} players: {iterations / elapsed:,.0f} iterations/s")
+
+    sender = make_sender()
+    start = time.perf_counter()
+    for i in range(iterations):
+        sender.compile().resolve(i)
+    compiled = time.perf_counter() - start
+    print(f"resolution (compiled plan): {iterations / compiled:,.0f} senders/s")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
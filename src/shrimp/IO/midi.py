@@ -1,11 +1,14 @@
-import mido
 from ..Time.Clock import Clock
 from ..environment import Subscriber
 import threading
 from time import sleep
 from typing import Dict, Optional
-from ..utils import linear_scaling
+from ..utils import linear_scaling, lazy_import
 import logging
+import math
+
+# mido and its backend are slow to import: they are loaded when the first port is opened
+mido = lazy_import("mido")
 
 
 class CCStorage:
@@ -50,31 +53,40 @@ def list_midi_ports() -> list[str]:
 
 
 class MIDIIn(Subscriber):
-    """MIDI class to receive MIDI messages from a MIDI port."""
+    """MIDI class to receive MIDI messages from a MIDI port. The port is opened on first
+    use, or by calling open()."""
 
     def __init__(self, port: str, clock: Clock):
         super().__init__()
         self.port = port
         self.clock = clock
         self.wheel = 0
+        self._midi_in = None
+        self._opened = False
+        self._open_lock = threading.Lock()
         self._midi_loop_thread = None
         self._midi_loop_shutdown = threading.Event()
         self._received_controls = CCStorage()
 
-        try:
-            if self.port == "shrimp":
-                self._midi_in = mido.open_input(port, virtual=True)
-            else:
-                self._midi_in = mido.open_input(port)
-        except:
-            print(f"Could not open MIDI port {port}")
-
-        # Initialise the background MIDI-In monitoring loop
-        self._setup_midi_loop()
-
         # Registering handlers
         self.register_handler("stop", lambda _: self._midi_loop_shutdown.set())
 
+    def open(self) -> None:
+        """Open the MIDI port and start the background MIDI-In monitoring loop."""
+        with self._open_lock:
+            if self._opened:
+                return
+            self._opened = True
+            try:
+                if self.port == "shrimp":
+                    self._midi_in = mido.open_input(self.port, virtual=True)
+                else:
+                    self._midi_in = mido.open_input(self.port)
+            except:
+                print(f"Could not open MIDI port {self.port}")
+                return
+            self._setup_midi_loop()
+
     def _setup_midi_loop(self) -> None:
         """Setup the MIDI monitoring loop."""
 
@@ -105,27 +117,127 @@ class MIDIIn(Subscriber):
         Returns:
             int: The value of the control.
         """
+        if not self._opened:
+            self.open()
         value = self._received_controls.get_message(channel, control)
         if value is None:
             return default_value
         return value
 
 
+class MIDIClock:
+    """MIDI clock generator: sends a 24 PPQN clock stream and transport messages
+    (start/stop/continue) to a MIDI output, locked to the Link timeline of a Clock.
+
+    Deadlines are computed from the Link session for every tick, so the stream follows
+    tempo changes and peers. The generator runs on its own thread and does not go
+    through the clock scheduler.
+    """
+
+    PPQN = 24
+    # Song position pointers are 14 bits, counted in sixteenth notes
+    MAX_SONG_POSITION = 16383
+
+    def __init__(self, midi_out: "MIDIOut", clock: Clock):
+        self._midi_out = midi_out
+        self._clock = clock
+        self._thread: Optional[threading.Thread] = None
+        self._shutdown = threading.Event()
+        self._playing = False
+        self._tick: Optional[int] = None
+
+    @property
+    def running(self) -> bool:
+        """Return True if the generator thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start the clock generator thread."""
+        if self.running:
+            return
+        self._shutdown.clear()
+        self._playing = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the clock generator thread. Sends a MIDI stop if the transport was running."""
+        self._shutdown.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+        if self._playing:
+            self._playing = False
+            self._midi_out.stop()
+
+    def _transport(self, playing: bool, beat: float) -> None:
+        """Send the transport message matching a play/pause transition of the Link session.
+
+        Args:
+            playing (bool): The new playing state of the session.
+            beat (float): The current beat on the Link timeline.
+        """
+        self._playing = playing
+        if not playing:
+            self._tick = None
+            self._midi_out.stop()
+        elif beat < 1 / self.PPQN:
+            # Starting from the top: the first clock after `start` is the downbeat.
+            self._tick = max(0, math.ceil(beat * self.PPQN))
+            self._midi_out.start()
+        else:
+            # Resuming mid-song: position on the next sixteenth note, then continue.
+            # Past the range of song position pointers, receivers keep their position.
+            position = math.ceil(beat * 4)
+            self._tick = position * (self.PPQN // 4)
+            if position <= self.MAX_SONG_POSITION:
+                self._midi_out.song_position(position)
+            self._midi_out.resume()
+
+    def _run(self) -> None:
+        """Clock generator loop, meant to be run in its own thread."""
+        link = self._clock.link
+        while not self._shutdown.is_set():
+            quantum = self._clock.time_signature[1]
+            state, now = link.captureSessionState(), link.clock().micros()
+            playing = state.isPlaying()
+            beat = state.beatAtTime(now, quantum)
+
+            if playing != self._playing:
+                self._transport(playing, beat)
+            if not playing:
+                self._shutdown.wait(0.005)
+                continue
+
+            # The timeline jumped (e.g. beat reset on play): resynchronise the tick counter
+            if self._tick is None or abs(self._tick - beat * self.PPQN) > self.PPQN:
+                self._tick = max(0, math.floor(beat * self.PPQN) + 1)
+
+            deadline = state.timeAtBeat(self._tick / self.PPQN, quantum)
+            wait_time = (deadline - now) / 1e6
+            if wait_time > 0.005:
+                # Wake up early to catch tempo/transport changes before the deadline
+                self._shutdown.wait(wait_time - 0.005)
+                continue
+            if wait_time > 0:
+                self._clock.precise_wait(wait_time)
+            self._midi_out.tick()
+            self._tick += 1
+
+
 class MIDIOut(Subscriber):
-    """MIDI class to send MIDI messages to a MIDI port."""
+    """MIDI class to send MIDI messages to a MIDI port. The port is opened on first use,
+    or by calling open()."""
 
     def __init__(self, port: str, clock: Clock):
         super().__init__()
         self.port = port
         self.clock = clock
         self._nudge = -0.01
-        try:
-            if self.port == "shrimp":
-                self._midi_out = mido.open_output(port, virtual=True)
-            else:
-                self._midi_out = mido.open_output(port)
-        except:
-            print(f"Could not open MIDI port {port}")
+        self._midi_out_port = None
+        self._opened = False
+        self._open_lock = threading.Lock()
+        self._midi_clock: Optional[MIDIClock] = None
         self.pressed_notes: Dict[int, Dict[int, bool]] = {
             i: {} for i in range(16)
         }  # Track pressed notes per channel
@@ -134,6 +246,27 @@ class MIDIOut(Subscriber):
         self.register_handler("stop", self._stop_handler)
         self.register_handler("all_notes_off", lambda _: self.all_notes_off())
 
+    @property
+    def _midi_out(self):
+        """The mido output port, opened on first use."""
+        if not self._opened:
+            self.open()
+        return self._midi_out_port
+
+    def open(self) -> None:
+        """Open the MIDI port."""
+        with self._open_lock:
+            if self._opened:
+                return
+            self._opened = True
+            try:
+                if self.port == "shrimp":
+                    self._midi_out_port = mido.open_output(self.port, virtual=True)
+                else:
+                    self._midi_out_port = mido.open_output(self.port)
+            except:
+                print(f"Could not open MIDI port {self.port}")
+
     @property
     def nudge(self) -> float:
         """The nudge time in seconds."""
@@ -152,10 +285,28 @@ class MIDIOut(Subscriber):
 
     def _stop_handler(self, data: dict) -> None:
         """Handle the stop event."""
+        if self._midi_clock is not None:
+            self._midi_clock.stop()
         self.all_notes_off()
 
+    def sync_clock(self, value: bool = True) -> None:
+        """Enable or disable the MIDI clock and transport output on this port.
+
+        Args:
+            value (bool): True to send 24 PPQN clock and start/stop/continue messages
+                following the Link session, False to stop sending them.
+        """
+        if value:
+            if self._midi_clock is None:
+                self._midi_clock = MIDIClock(self, self.clock)
+            self._midi_clock.start()
+        elif self._midi_clock is not None:
+            self._midi_clock.stop()
+
     def all_notes_off(self):
         """Send all notes off message on all channels."""
+        if self._midi_out_port is None:
+            return  # Nothing has been played on a port that is not open
         for channel in range(16):
             for notes in range(128):
                 self._note_off(note=notes, channel=channel)
@@ -265,6 +416,18 @@ class MIDIOut(Subscriber):
         """Send a MIDI stop message."""
         self._midi_out.send(mido.Message("stop"))
 
+    def resume(self, *args, **kwargs):
+        """Send a MIDI continue message."""
+        self._midi_out.send(mido.Message("continue"))
+
+    def song_position(self, position: int = 0, **kwargs):
+        """Send a MIDI song position pointer message.
+
+        Args:
+            position (int): The song position, in sixteenth notes.
+        """
+        self._midi_out.send(mido.Message("songpos", pos=position))
+
     def pitch_bend(self, value: int = 0, channel: int = 1, **kwargs) -> None:
         """Send a MIDI pitch bend message.
 
@@ -1,17 +1,317 @@
 from osc4py3 import oscbuildparse
 from osc4py3.oscbuildparse import OSCtimetag
-from osc4py3.as_eventloop import *
 from osc4py3.oscmethod import *
 from ..environment import Subscriber
 from ..Time.Clock import Clock
-from ..utils import flatten, kwargs_to_flat_list
-from typing import Optional, Any, Callable, Optional
+from ..utils import kwargs_to_flat_list
+from typing import Optional, Any, Callable, Dict
 from ..Systems.PlayerSystem.Rest import Rest
+from collections import deque
+from functools import lru_cache
+import selectors
+import struct
 import threading
 import logging
+import socket
 import time
 
 
+_ARGUMENT_FORMATS = {ord("i"): "i", ord("f"): "f", ord("d"): "d", ord("h"): "q"}
+_struct_cache: Dict[bytes, Optional[struct.Struct]] = {}
+_timetag_struct = struct.Struct(">Q")
+_int_struct = struct.Struct(">i")
+_constants = {ord("T"): True, ord("F"): False, ord("N"): None, ord("I"): float("inf")}
+# Characters of OSC address patterns: handlers only match exact addresses
+_PATTERN_CHARACTERS = frozenset("*?[]{}")
+
+
+def _arguments_struct(typetags: bytes) -> Optional[struct.Struct]:
+    """Return a cached Struct unpacking a message made of fixed-size numbers only, or None
+    if the typetags contain other types."""
+    try:
+        return _struct_cache[typetags]
+    except KeyError:
+        pass
+    try:
+        compiled = struct.Struct(">" + "".join(_ARGUMENT_FORMATS[tag] for tag in typetags))
+    except KeyError:
+        compiled = None
+    _struct_cache[typetags] = compiled
+    return compiled
+
+
+def _read_string(data: bytearray, offset: int, end: int) -> tuple[bytearray, int]:
+    """Read a null-terminated, 4-bytes aligned OSC string. Returns the string and the
+    offset of the next field."""
+    stop = data.index(0, offset, end)
+    return data[offset:stop], (stop + 4) & ~3
+
+
+def _parse_arguments(data: bytearray, typetags: bytes, offset: int, end: int) -> tuple:
+    """Slow path for messages containing strings, blobs or other non numeric types."""
+    arguments = []
+    for tag in typetags:
+        if tag in _ARGUMENT_FORMATS:
+            value = struct.unpack_from(">" + _ARGUMENT_FORMATS[tag], data, offset)[0]
+            offset += 8 if tag in b"dh" else 4
+        elif tag in b"sS":
+            value, offset = _read_string(data, offset, end)
+            value = value.decode("utf-8", "replace")
+        elif tag == ord("b"):
+            size = _int_struct.unpack_from(data, offset)[0]
+            if size < 0:
+                raise ValueError("Negative OSC blob size")
+            value = bytes(data[offset + 4 : offset + 4 + size])
+            offset += (4 + size + 3) & ~3
+        elif tag in _constants:
+            value = _constants[tag]
+        elif tag == ord("t"):
+            value = _timetag_struct.unpack_from(data, offset)[0]
+            offset += 8
+        elif tag == ord("c"):
+            value = chr(_int_struct.unpack_from(data, offset)[0])
+            offset += 4
+        elif tag in b"rm":
+            value = bytes(data[offset : offset + 4])
+            offset += 4
+        else:
+            raise ValueError(f"Unsupported OSC type tag: {chr(tag)}")
+        arguments.append(value)
+    if offset > end:
+        raise ValueError("Truncated OSC message")
+    return tuple(arguments)
+
+
+def _parse_packet(data: bytearray, offset: int, end: int, values: dict, handlers: dict) -> None:
+    """Parse an OSC packet in place, store the arguments of every message in the values
+    table (address -> tuple) and call the handlers attached to their addresses. Bundle
+    timetags are ignored: received values are applied as soon as they arrive."""
+    if data.startswith(b"#bundle\0", offset, end):
+        offset += 16
+        while offset < end:
+            size = _int_struct.unpack_from(data, offset)[0]
+            offset += 4
+            # The receive buffer is reused: never read past the end of the packet
+            if size < 0 or offset + size > end:
+                raise ValueError("Truncated OSC bundle")
+            _parse_packet(data, offset, offset + size, values, handlers)
+            offset += size
+        return
+
+    address, offset = _read_string(data, offset, end)
+    address = address.decode("ascii", "replace")
+    if offset < end and data[offset] == 44:  # ','
+        typetags, offset = _read_string(data, offset + 1, end)
+        typetags = bytes(typetags)
+    else:
+        typetags = b""
+
+    compiled = _arguments_struct(typetags)
+    if compiled is not None:
+        if offset + compiled.size > end:
+            raise ValueError("Truncated OSC message")
+        arguments = compiled.unpack_from(data, offset)
+    else:
+        arguments = _parse_arguments(data, typetags, offset, end)
+
+    values[address] = arguments
+    handler = handlers.get(address)
+    if handler is not None:
+        handler(*arguments)
+
+
+# Seconds between the NTP epoch (1900) and the Unix epoch (1970), in 1/2**32 s units
+NTP_EPOCH_OFFSET = 2208988800 << 32
+_IMMEDIATELY = _timetag_struct.pack(1)
+_BUNDLE_HEADER = b"#bundle\0"
+_float_struct = struct.Struct(">f")
+_padding = (b"\0\0\0\0", b"\0\0\0", b"\0\0", b"\0")
+
+
+def _timetag(timestamp: float) -> bytes:
+    """Encode a Unix timestamp as an OSC timetag (64 bits NTP fixed point)."""
+    return _timetag_struct.pack(int(timestamp * 4294967296.0 + 0.5) + NTP_EPOCH_OFFSET)
+
+
+@lru_cache(maxsize=1024)
+def _encode_string(value: str) -> bytes:
+    """Encode a null-terminated, 4-bytes aligned OSC string. Addresses and parameter
+    names are few and repeated for every message, hence the cache."""
+    data = value.encode("utf-8")
+    return data + _padding[len(data) % 4]
+
+
+def _encode_message(address: str, arguments: list) -> bytes:
+    """Encode an OSC message, guessing typetags like osc4py3 does. Unusual arguments
+    (arrays, midi, rgba, ...) are left to osc4py3."""
+    return _encode_string(address) + _encode_arguments(arguments, address)
+
+
+def _encode_arguments(arguments: list, address: str = "/") -> bytes:
+    """Encode the typetags and arguments of an OSC message, i.e. the message without its
+    address."""
+    typetags, payload = [","], []
+    for argument in arguments:
+        if argument is True or argument is False:
+            typetags.append("T" if argument else "F")
+        elif isinstance(argument, float):
+            typetags.append("f")
+            payload.append(_float_struct.pack(argument))
+        elif isinstance(argument, int):
+            typetags.append("i")
+            payload.append(_int_struct.pack(argument))
+        elif isinstance(argument, str):
+            typetags.append("s")
+            payload.append(_encode_string(argument))
+        elif argument is None:
+            typetags.append("N")
+        elif isinstance(argument, (bytes, bytearray)):
+            typetags.append("b")
+            payload.append(_int_struct.pack(len(argument)))
+            payload.append(bytes(argument))
+            if len(argument) % 4:
+                payload.append(_padding[len(argument) % 4 - 4])
+        else:
+            encoded = oscbuildparse.encode_packet(
+                oscbuildparse.OSCMessage(addrpattern=address, typetags=None, arguments=arguments)
+            )
+            return encoded[len(_encode_string(address)) :]
+    return b"".join((_encode_string("".join(typetags)), *payload))
+
+
+class OSCLoop:
+    """Shared OSC I/O loop for all OSC objects.
+
+    A single background thread multiplexes every OSC socket with `selectors` and blocks
+    until a socket is readable or an outgoing packet has been queued, so it does not use
+    any CPU while idle. Outgoing packets are queued by `send` and written by the loop
+    thread, so callers (e.g. the clock thread) never block on network I/O.
+    """
+
+    _instance: Optional["OSCLoop"] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self):
+        self._selector = selectors.DefaultSelector()
+        self._send_queue: deque = deque()
+        self._wake_reader, self._wake_writer = socket.socketpair()
+        self._wake_reader.setblocking(False)
+        self._wake_writer.setblocking(False)
+        self._selector.register(self._wake_reader, selectors.EVENT_READ, self._drain_wakeups)
+        self._thread: Optional[threading.Thread] = None
+        self._shutdown = threading.Event()
+        self._users = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def get(cls) -> "OSCLoop":
+        """Return the shared OSC loop, creating it if needed."""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    @property
+    def running(self) -> bool:
+        """Return True if the loop thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def acquire(self) -> None:
+        """Register a user of the loop, starting the loop thread if needed."""
+        with self._lock:
+            self._users += 1
+            if not self.running:
+                self._shutdown.clear()
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+
+    def release(self) -> None:
+        """Unregister a user of the loop, stopping the loop thread when unused."""
+        with self._lock:
+            self._users = max(0, self._users - 1)
+            if self._users or not self.running:
+                return
+            self._shutdown.set()
+            self._wake_up()
+            thread, self._thread = self._thread, None
+        if thread is not threading.current_thread():
+            thread.join()
+
+    def register_reader(self, sock: socket.socket, callback: Callable) -> None:
+        """Watch a socket for incoming data. The callback receives the socket when it is
+        readable and is called from the loop thread."""
+        self._selector.register(sock, selectors.EVENT_READ, callback)
+        self._wake_up()
+
+    def unregister_reader(self, sock: socket.socket) -> None:
+        """Stop watching a socket for incoming data."""
+        try:
+            self._selector.unregister(sock)
+        except (KeyError, ValueError):
+            pass
+        self._wake_up()
+
+    def send(self, sock: socket.socket, address: tuple, data: bytes) -> None:
+        """Queue a datagram to be sent by the loop thread.
+
+        Args:
+            sock (socket.socket): The UDP socket to send from.
+            address (tuple): The (host, port) destination.
+            data (bytes): The encoded OSC packet.
+        """
+        self._send_queue.append((sock, address, data))
+        self._wake_up()
+
+    def close(self, sock: socket.socket) -> None:
+        """Close a socket from the loop thread, once the datagrams queued before are sent.
+
+        Args:
+            sock (socket.socket): The socket to close.
+        """
+        self._send_queue.append((sock, None, None))
+        self._wake_up()
+
+    def _wake_up(self) -> None:
+        """Wake the loop thread from its blocking select."""
+        try:
+            self._wake_writer.send(b"\0")
+        except (BlockingIOError, OSError):
+            # The wake-up socket is already full: the loop will wake up anyway.
+            pass
+
+    def _drain_wakeups(self, sock: socket.socket) -> None:
+        """Consume pending wake-up bytes."""
+        try:
+            while sock.recv(4096):
+                pass
+        except (BlockingIOError, OSError):
+            pass
+
+    def _flush(self) -> None:
+        """Send every queued datagram."""
+        queue = self._send_queue
+        while queue:
+            sock, address, data = queue.popleft()
+            if address is None:
+                sock.close()
+                continue
+            try:
+                sock.sendto(data, address)
+            except OSError as e:
+                logging.error(f"Error sending OSC packet to {address}: {e}")
+
+    def _run(self) -> None:
+        """Loop entry point, meant to be run in its own thread."""
+        while not self._shutdown.is_set():
+            for key, _ in self._selector.select():
+                try:
+                    key.data(key.fileobj)
+                except Exception as e:
+                    logging.error(f"Error in OSC loop callback: {e}")
+            self._flush()
+        self._flush()
+
+
 class OSC(Subscriber):
     """OSC client: Send/Receive Open Sound Control messages to/from a remote host."""
 
@@ -19,46 +319,69 @@ class OSC(Subscriber):
         super().__init__()
         self.name, self.host, self.port = name, host, port
         self._clock = clock
-        self.client = osc_udp_client(address=self.host, port=self.port, name=self.name)
-        self._osc_loop_shutdown = threading.Event()
-        self._osc_loop_thread: Optional[threading.Thread] = None
+        self._address = socket.getaddrinfo(host, port, socket.AF_INET, socket.SOCK_DGRAM)[0][4]
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         self._nudge = 0.1
 
-        # OSC-In communication
-        self._watched_values = {}
+        # OSC-In communication: latest arguments received on each address
+        self._values: Dict[str, tuple] = {}
+        self._handlers: Dict[str, Callable] = {}
+        self._in_socket: Optional[socket.socket] = None
+        self._buffer = bytearray(65536)
 
-        # Initialise the background OSC process loop
-        self.setup_osc_loop()
+        # All OSC objects share a single I/O loop
+        self._loop = OSCLoop.get()
+        self._loop.acquire()
 
         # Event handlers
         self.register_handler("stop", lambda _: self._stop(_))
         self.register_handler("silence", lambda _: self.panic())
 
     def _stop(self, _):
-        """Stops the OSC processing loop"""
-        self._osc_loop_shutdown.set()
-        self._osc_loop_thread.join()
-
-    def setup_osc_loop(self) -> None:
-        """Initialise the background OSC process loop."""
+        """Close the sockets and release the shared OSC loop"""
+        if self._in_socket is not None:
+            self._loop.unregister_reader(self._in_socket)
+            self._in_socket.close()
+            self._in_socket = None
+        if self._loop is not None:
+            # The output socket is closed after the messages already queued are sent
+            self._loop.close(self._socket)
+            self._loop.release()
+            self._loop = None
+
+    def listen(self, port: int, host: str = "0.0.0.0") -> None:
+        """Start receiving OSC messages on a given UDP port. Incoming packets are parsed
+        by the shared OSC loop and the latest arguments received on each address can be
+        read with the get() method.
 
-        def _osc_process_loop():
-            """Background OSC processing loop.
-
-            Note: This function is intended to be run in a separate thread.
-            It should call osc_process() repeatedly to keep the OSC server
-            alive. It will run until the _osc_loop_shutdown event is set.
-            """
+        Args:
+            port (int): The UDP port to listen on.
+            host (str): The interface to bind to.
+        """
+        if self._in_socket is not None:
+            self._loop.unregister_reader(self._in_socket)
+            self._in_socket.close()
+        self._in_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._in_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._in_socket.bind((host, port))
+        self._in_socket.setblocking(False)
+        self._loop.register_reader(self._in_socket, self._receive)
+
+    def _receive(self, sock: socket.socket) -> None:
+        """Read every pending datagram into the receive buffer and parse it in place."""
+        buffer, values, handlers = self._buffer, self._values, self._handlers
+        while True:
             try:
-                while not self._osc_loop_shutdown.is_set():
-                    osc_process()
-                    time.sleep(0.001)
-            except BlockingIOError:
-                pass
-
-        osc_startup()
-        self._osc_loop_thread = threading.Thread(target=_osc_process_loop, daemon=True)
-        self._osc_loop_thread.start()
+                size = sock.recv_into(buffer)
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError as e:
+                logging.error(f"Error receiving OSC packet: {e}")
+                return
+            try:
+                _parse_packet(buffer, 0, size, values, handlers)
+            except (ValueError, IndexError, struct.error) as e:
+                logging.warning(f"Dropping malformed OSC packet: {e}")
 
     @property
     def nudge(self):
@@ -86,26 +409,58 @@ class OSC(Subscriber):
             messages (list): A list of messages to send.
             timestamp (Optional[float]): The Unix timestamp of the message.
         """
-        messages = [
-            oscbuildparse.OSCMessage(
-                addrpattern=address, typetags=None, arguments=message  # auto-detect types
+        try:
+            self._loop.send(
+                self._socket, self._address, self._encode_bundle(address, messages, timestamp)
+            )
+        except Exception as e:
+            logging.error(f"Error sending OSC messages: {e}")
+
+    def send_encoded(self, address: str, arguments: bytes, timestamp: Optional[float]) -> None:
+        """Send a single message whose arguments are already encoded (see
+        `_encode_arguments`), e.g. read from an event ring.
+
+        Args:
+            address (str): The OSC address.
+            arguments (bytes): The typetags and arguments of the message (bytes-like).
+            timestamp (Optional[float]): The Unix timestamp of the message.
+        """
+        size = len(_encode_string(address)) + len(arguments)
+        packet = b"".join(
+            (
+                _BUNDLE_HEADER,
+                _timetag(timestamp + self._nudge) if timestamp else _IMMEDIATELY,
+                _int_struct.pack(size),
+                _encode_string(address),
+                arguments,
             )
-            for message in messages
-        ]
-
-        bundle = oscbuildparse.OSCBundle(
-            timetag=(
-                oscbuildparse.unixtime2timetag(timestamp + self._nudge)
-                if timestamp
-                else oscbuildparse.OSC_IMMEDIATELY + self._nudge
-            ),
-            elements=messages,
         )
         try:
-            osc_send(bundle, self.name)
+            self._loop.send(self._socket, self._address, packet)
         except Exception as e:
             logging.error(f"Error sending OSC messages: {e}")
 
+    def _send_timed_message(self, address: str, message: list) -> None:
+        """Send a single message now, delayed by the nudge like timestamped messages."""
+        self.send(address=address, messages=[message], timestamp=time.time())
+
+    def _encode_bundle(self, address: str, messages: list, timestamp: Optional[float]) -> bytes:
+        """Encode messages sent to the same address as an OSC bundle. The timetag is
+        computed with integer arithmetic from the precomputed NTP epoch offset.
+
+        Args:
+            address (str): The OSC address.
+            messages (list): A list of messages (lists of arguments).
+            timestamp (Optional[float]): The Unix timestamp of the bundle, nudged by
+                self.nudge. The bundle is played immediately if None.
+        """
+        parts = [_BUNDLE_HEADER, _timetag(timestamp + self._nudge) if timestamp else _IMMEDIATELY]
+        for message in messages:
+            encoded = _encode_message(address, message)
+            parts.append(_int_struct.pack(len(encoded)))
+            parts.append(encoded)
+        return b"".join(parts)
+
     def dirt(self, **kwargs) -> None:
         """Send a /dirt/play message to the SuperDirt audio engine.
 
@@ -211,60 +566,63 @@ class OSC(Subscriber):
         """Send a panic message to the SuperDirt audio engine."""
         self.dirt(sound="superpanic")
 
-    def _generic_store(self, address) -> None:
-        """Generic storage function to attach to a given address
-
-        Args:
-            address (str): The OSC address to store the value of.
-        """
-
-        def generic_value_tracker(*args, **kwargs):
-            """Generic value tracker to be attached to an address"""
-            self._watched_values[address] = {"args": flatten(args), "kwargs": kwargs}
-            return (args, kwargs)
-
-        osc_method(address, generic_value_tracker, argscheme=OSCARG_DATA)
-
     def watch(self, address: str) -> None:
         """
-        Watch the value of a given OSC address. Will be recorded in memory
-        in the self._watched_values dictionary accessible through the get()
-        method
+        Watch the value of a given OSC address. The latest arguments received on every
+        address are always recorded once the port is listening: watching an address
+        only makes it known to the get() method before any value has been received.
 
         Args:
             address (str): The OSC address to watch.
         """
         print(f"[yellow]Watching address [red]{address}[/red].[/yellow]")
-        self._generic_store(address)
+        self._values.setdefault(address, ())
 
     def attach(self, address: str, function: Callable, watch: bool = False, argscheme=None) -> None:
         """
-        Attach a callback to a given address. You can also toggle the watch boolean
-        value to tell if the value should be tracked by the receiver. This allows to
-        return values from the callback that you can retrieve later on through
-        the get(address) method.
+        Attach a callback to a given address. The callback is called from the OSC loop
+        thread with the arguments of the message unpacked, or with the arguments tuple
+        if argscheme is OSCARG_DATA. Only exact addresses are matched.
 
         Args:
             address (str): The OSC address to attach the function to.
             function (Callable): The function to attach.
             watch (bool): Whether to watch the value of the address.
-            argscheme: The OSC argument scheme.
+            argscheme: The OSC argument scheme (OSCARG_DATAUNPACK or OSCARG_DATA).
 
+        Raises:
+            ValueError: If the address is a pattern (wildcards are not matched) or if the
+                argument scheme is not supported.
         """
+        if any(char in address for char in _PATTERN_CHARACTERS):
+            raise ValueError(f"OSC address patterns are not supported: {address}")
+        if argscheme is None or argscheme == OSCARG_DATAUNPACK:
+            handler = function
+        elif argscheme == OSCARG_DATA:
+            handler = lambda *args: function(args)
+        else:
+            raise ValueError(
+                f"Unsupported argument scheme {argscheme}: use OSCARG_DATAUNPACK or OSCARG_DATA"
+            )
         print(
             f"[yellow]Attaching function [red]{function.__name__}[/red] to address [red]{address}[/red][/yellow]"
         )
-        osc_method(
-            address,
-            function,
-            argscheme=OSCARG_DATAUNPACK if argscheme is None else argscheme,
-        )
+        self._handlers[address] = handler
         if watch:
             self.watch(address)
 
-    def get(self, address: str) -> Any | None:
-        """Get a watched value. Return None if not found"""
+    def get(self, address: str, index: Optional[int] = None, default: Any = None) -> Any:
+        """Get the latest arguments received on an address, or a single argument if an
+        index is given. Return the default value if nothing has been received.
+
+        Reading is lock-free: the table is only ever updated by replacing whole tuples.
+        """
+        arguments = self._values.get(address)
+        if not arguments:
+            return default
+        if index is None:
+            return arguments
         try:
-            return self._watched_values[address]
-        except KeyError:
-            return None
+            return arguments[index]
+        except IndexError:
+            return default
@@ -0,0 +1,262 @@
+"""
+Shared memory event ring: hand rendered events from a producer (pattern rendering) to a
+consumer (I/O sender) living in another thread or process, without pickling and without
+allocating an object per event on the producer side.
+
+The ring is a single-producer, single-consumer queue of fixed-size records stored in a
+`multiprocessing.shared_memory` block:
+
+    header   write index (u64) | read index (u64) | capacity (u32) | blob size (u32)
+    record   deadline (f64) | target id (u32) | address id (u32) | blob length (u16) |
+             padding | argument blob (blob size bytes)
+
+Indices only grow: record `i` is stored in slot `i % capacity`. The producer only writes
+the write index and the consumer only writes the read index, so no lock is needed. Target
+and address ids index tables known by both sides (e.g. OSC objects and OSC addresses),
+the argument blob is the encoded arguments of the message (see `osc._encode_arguments`).
+"""
+
+from multiprocessing import shared_memory
+from typing import Callable, Dict, List, Optional, Tuple
+from .osc import OSC, _encode_arguments
+import threading
+import logging
+import struct
+import time
+
+_header = struct.Struct("<QQII")
+_index = struct.Struct("<Q")
+_record = struct.Struct("<dIIH6x")
+_WRITE, _READ = 0, 8
+
+# A record read from the ring: deadline, target id, address id and argument blob
+Record = Tuple[float, int, int, bytes]
+
+
+class EventRing:
+    """
+    Fixed-layout ring buffer of events in shared memory.
+
+    Args:
+        capacity (int): Number of records the ring can hold.
+        blob_size (int): Maximum size of the argument blob of a record, in bytes.
+        name (str, optional): Name of an existing ring to attach to (see `name`). The
+            capacity and blob size are then read from the ring.
+    """
+
+    def __init__(self, capacity: int = 4096, blob_size: int = 232, name: Optional[str] = None):
+        if name is None:
+            if capacity <= 0 or not 0 < blob_size < 1 << 16:
+                raise ValueError("Invalid ring capacity or blob size")
+            size = _header.size + capacity * (_record.size + blob_size)
+            self._memory = shared_memory.SharedMemory(create=True, size=size)
+            _header.pack_into(self._memory.buf, 0, 0, 0, capacity, blob_size)
+            self._owner = True
+        else:
+            self._memory = shared_memory.SharedMemory(name=name)
+            _, _, capacity, blob_size = _header.unpack_from(self._memory.buf, 0)
+            self._owner = False
+        self._buffer = self._memory.buf
+        self.capacity, self.blob_size = capacity, blob_size
+        self._record_size = _record.size + blob_size
+        # Local copies of the indices: each side only reads the index of the other side
+        # when its own view says the ring is full (producer) or empty (consumer).
+        self._write, self._read = _header.unpack_from(self._buffer, 0)[:2]
+        self._write_limit = self._read + capacity
+        self._read_limit = self._write
+
+    @property
+    def name(self) -> str:
+        """Name of the shared memory block, used by other processes to attach."""
+        return self._memory.name
+
+    def __len__(self) -> int:
+        write = _index.unpack_from(self._buffer, _WRITE)[0]
+        return write - _index.unpack_from(self._buffer, _READ)[0]
+
+    def push(self, deadline: float, target: int, address: int, blob: bytes) -> bool:
+        """Append a record. Returns False if the ring is full (the record is dropped).
+
+        Args:
+            deadline (float): Unix timestamp of the event.
+            target (int): Id of the output.
+            address (int): Id of the address.
+            blob (bytes): Encoded arguments (bytes-like), at most `blob_size` bytes.
+        """
+        if len(blob) > self.blob_size:
+            raise ValueError(f"Event of {len(blob)} bytes, the ring blob size is {self.blob_size}")
+        if self._write >= self._write_limit:
+            self._write_limit = _index.unpack_from(self._buffer, _READ)[0] + self.capacity
+            if self._write >= self._write_limit:
+                return False
+        offset = _header.size + (self._write % self.capacity) * self._record_size
+        _record.pack_into(self._buffer, offset, deadline, target, address, len(blob))
+        start = offset + _record.size
+        self._buffer[start : start + len(blob)] = blob
+        # Publish the record once it is completely written
+        self._write += 1
+        _index.pack_into(self._buffer, _WRITE, self._write)
+        return True
+
+    def pop(self) -> Optional[Record]:
+        """Remove and return the oldest record, or None if the ring is empty."""
+        records = []
+        self.drain(lambda *record: records.append((*record[:3], bytes(record[3]))), 1)
+        return records[0] if records else None
+
+    def drain(self, callback: Callable, limit: Optional[int] = None) -> int:
+        """Call `callback(deadline, target, address, blob)` for the pending records, in
+        order, and remove them. The blob is a memoryview of the ring, only valid during the
+        call. Returns the number of records read.
+
+        Args:
+            callback (Callable): The function called for each record.
+            limit (int, optional): Maximum number of records to read.
+        """
+        if self._read >= self._read_limit:
+            self._read_limit = _index.unpack_from(self._buffer, _WRITE)[0]
+        end = self._read_limit if limit is None else min(self._read_limit, self._read + limit)
+        buffer, capacity, size = self._buffer, self.capacity, self._record_size
+        count = 0
+        while self._read < end:
+            offset = _header.size + (self._read % capacity) * size
+            deadline, target, address, length = _record.unpack_from(buffer, offset)
+            start = offset + _record.size
+            with buffer[start : start + length] as blob:
+                callback(deadline, target, address, blob)
+            self._read += 1
+            count += 1
+            # Give the slot back to the producer
+            _index.pack_into(buffer, _READ, self._read)
+        return count
+
+    def close(self) -> None:
+        """Detach from the ring, and free it if it was created by this object."""
+        self._buffer.release()
+        self._memory.close()
+        if self._owner:
+            self._memory.unlink()
+
+
+class RingSender:
+    """
+    Consumer thread sending the events of a ring to OSC outputs.
+
+    Args:
+        ring (EventRing): The ring to read from.
+        targets (list): OSC outputs, indexed by the target id of the records.
+        addresses (list): OSC addresses, indexed by the address id of the records.
+        poll_interval (float): Sleep time when the ring becomes empty, in seconds.
+        max_poll_interval (float): Longest sleep time, reached when the ring stays empty.
+
+    The ring may be filled by another process, and shared memory has no wakeup primitive:
+    the consumer polls. The sleep time starts at `poll_interval`, which bounds the added
+    latency while events are flowing, and doubles up to `max_poll_interval` while the ring
+    stays idle. Events are sent ahead of their timestamp (latency), so a longer sleep after
+    a silence only delays the handoff, not the sound.
+    """
+
+    def __init__(
+        self,
+        ring: EventRing,
+        targets: List[OSC],
+        addresses: List[str],
+        poll_interval: float = 0.001,
+        max_poll_interval: float = 0.05,
+    ):
+        self._ring, self._targets, self._addresses = ring, targets, addresses
+        self._poll_interval = poll_interval
+        self._max_poll_interval = max(poll_interval, max_poll_interval)
+        self._shutdown = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start the consumer thread."""
+        if self._thread is None or not self._thread.is_alive():
+            self._shutdown.clear()
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the consumer thread once the pending events are sent."""
+        self._shutdown.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _send(self, deadline: float, target: int, address: int, blob: memoryview) -> None:
+        try:
+            self._targets[target].send_encoded(self._addresses[address], blob, deadline)
+        except IndexError:
+            logging.error(f"Unknown target {target} or address {address} in event ring")
+
+    def _run(self) -> None:
+        interval = self._poll_interval
+        while not self._shutdown.is_set():
+            if self._ring.drain(self._send):
+                interval = self._poll_interval
+            else:
+                self._shutdown.wait(interval)
+                interval = min(interval * 2, self._max_poll_interval)
+        self._ring.drain(self._send)
+
+
+class RingOutput:
+    """
+    Producer side of an event ring for OSC outputs: messages are encoded by the thread that
+    renders them and sent by a `RingSender` thread.
+
+    Args:
+        capacity (int): Number of records of the ring.
+        blob_size (int): Maximum size of the encoded arguments of a message.
+        poll_interval (float): Shortest sleep time of the sender.
+        max_poll_interval (float): Longest sleep time of the sender.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 4096,
+        blob_size: int = 232,
+        poll_interval: float = 0.001,
+        max_poll_interval: float = 0.05,
+    ):
+        self.ring = EventRing(capacity=capacity, blob_size=blob_size)
+        self._targets: List[OSC] = []
+        self._addresses: List[str] = []
+        self._target_ids: Dict[int, int] = {}
+        self._address_ids: Dict[str, int] = {}
+        self._sender = RingSender(
+            self.ring, self._targets, self._addresses, poll_interval, max_poll_interval
+        )
+        self._sender.start()
+
+    def send(self, target: OSC, address: str, message: list, timestamp: Optional[float]) -> bool:
+        """Queue a message for the sender thread.
+
+        Args:
+            target (OSC): The OSC output sending the message.
+            address (str): The OSC address.
+            message (list): The arguments of the message.
+            timestamp (Optional[float]): The Unix timestamp of the message.
+
+        Returns:
+            bool: False if the message does not fit in the ring: the caller sends it itself.
+        """
+        blob = _encode_arguments(message, address)
+        if len(blob) > self.ring.blob_size:
+            return False
+        # Tables are appended before the record referencing them is published
+        target_id = self._target_ids.get(id(target))
+        if target_id is None:
+            target_id = self._target_ids[id(target)] = len(self._targets)
+            self._targets.append(target)
+        address_id = self._address_ids.get(address)
+        if address_id is None:
+            address_id = self._address_ids[address] = len(self._addresses)
+            self._addresses.append(address)
+        return self.ring.push(timestamp or 0.0, target_id, address_id, blob)
+
+    def close(self) -> None:
+        """Send the pending messages, stop the sender thread and release the ring."""
+        self._sender.stop()
+        self.ring.close()
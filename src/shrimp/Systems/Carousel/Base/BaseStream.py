@@ -2,7 +2,7 @@ from abc import ABC
 import time
 from ..TimeSpan import TimeSpan
 from ..Pattern import Pattern
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, Optional, Tuple
 from ....IO.osc import OSC
 from ....Time.Clock import Clock
 from ....environment import Subscriber
@@ -25,6 +25,11 @@ class BaseCarouselStream(ABC, Subscriber):
         self.pattern: Pattern = None
         self._clock = clock
         self._latency = 0.2
+        # Source of the pattern, rendered by worker processes if there is a renderer
+        self.source: Optional[str] = None
+        self._renderer = None
+        # Event ring sending the OSC messages of the stream (see IO.ring.RingOutput)
+        self._ring = None
 
     def notify_tick(
         self,
@@ -38,18 +43,18 @@ class BaseCarouselStream(ABC, Subscriber):
         if not self.pattern:
             return
 
-        for event in self.pattern.onsets_only().query(TimeSpan(*current_cycle)):
+        for begin, end, value in self._render(*current_cycle):
             link_on, link_off = (
-                link_session.timeAtBeat(event.whole.begin * beats_per_cycle, 0),
-                link_session.timeAtBeat(event.whole.end * beats_per_cycle, 0),
+                link_session.timeAtBeat(begin * beats_per_cycle, 0),
+                link_session.timeAtBeat(end * beats_per_cycle, 0),
             )
             delta_secs = (link_off - link_on) / 1e6
-            ts = (link_session.timeAtBeat(event.whole.begin * beats_per_cycle, 0) - now) / 1e6
+            ts = (link_session.timeAtBeat(begin * beats_per_cycle, 0) - now) / 1e6
             unix_ts = (
                 ts
                 + datetime.datetime.now().timestamp()
                 + self._latency
-                + event.value.get("nudge", 0)
+                + value.get("nudge", 0)
             )
             # giohappy
             # ts = link_origin + datetime.timedelta(microseconds=link_next_beat_micros + (self._latency * 1e6) + (nudge * 1e6))
@@ -58,15 +63,28 @@ class BaseCarouselStream(ABC, Subscriber):
 
             if self.env.clock._playing:
                 self.notify_event(
-                    event.value,
+                    value,
                     unix_timestamp=unix_ts,
                     beat_timestamp=event_beat_timestamp,
                     cps=float(cycles_per_second),
-                    cycle=float(event.whole.begin),
+                    cycle=float(begin),
                     delta=float(delta_secs),
                     beats_per_cycle=beats_per_cycle,
                 )
 
+    def _render(self, cycle_from, cycle_to) -> Iterable[Tuple[Any, Any, Any]]:
+        """Return the onset, offset and value of the events starting in the given span.
+        Events are taken from the render backend if the stream has one and a source,
+        unless they have not been rendered in time."""
+        if self._renderer is not None and self.source is not None:
+            events = self._renderer.events(self.name, cycle_from, cycle_to)
+            if events is not None:
+                return events
+        return (
+            (event.whole.begin, event.whole.end, event.value)
+            for event in self.pattern.onsets_only().query(TimeSpan(cycle_from, cycle_to))
+        )
+
     def notify_event(
         self,
         event: Dict[str, Any],
@@ -3,6 +3,8 @@ from .Streams.CarouselStream import CarouselStream
 from ...Time.Clock import Clock
 from .Pattern import Pattern
 from ...environment import get_global_environment
+from .Render import ProcessRenderer, compile_source
+from ...IO.ring import RingOutput
 
 env = get_global_environment()
 
@@ -13,26 +15,86 @@ class CarouselPatternManager:
     def __init__(self, clock: Optional[Clock] = None):
         self._players: Dict[str, CarouselStream] = {}
         self._clock = clock
+        self._renderer: Optional[ProcessRenderer] = None
+        self._ring: Optional[RingOutput] = None
+
+    def _new_player(self, name: str) -> CarouselStream:
+        """Create a player and subscribe it to the environment."""
+        player = self._players[name] = CarouselStream(clock=env.clock, name=name)
+        player._ring = self._ring
+        env.subscribe(player)
+        return player
 
     def __setattr__(self, name: str, value):
         if isinstance(value, Pattern):
             if name not in self._players:
-                self._players[name] = CarouselStream(clock=env.clock, name=name)
-                env.subscribe(self._players[name])
+                self._new_player(name)
             self._players[name].pattern = value
+            self._forget_source(name)
         else:
             super().__setattr__(name, value)
 
     def __getattr__(self, name: str) -> CarouselStream:
         if name not in self._players:
-            self._players[name] = CarouselStream(clock=env.clock, name=name)
-            env.subscribe(self._players[name])
+            self._new_player(name)
         return self._players[name]
 
     def clear(self):
         """Clear all players"""
+        for name, player in self._players.items():
+            env.unsubscribe(player)
+            self._forget_source(name)
         self._players.clear()
 
+    def set_renderer(self, renderer: Optional[ProcessRenderer]) -> None:
+        """Render the players defined by a source (see play_source) in worker processes
+        with the given render backend, or in the clock thread if None."""
+        if self._renderer is not None:
+            for name in self._players:
+                self._renderer.remove(name)
+        self._renderer = renderer
+        for name, player in self._players.items():
+            player._renderer = renderer
+            if renderer is not None and player.source is not None:
+                renderer.set_source(name, player.source)
+
+    def set_event_ring(self, ring: Optional[RingOutput]) -> None:
+        """Hand the OSC messages of the players to an event ring: messages are encoded in
+        the clock thread and sent by the sender thread of the ring. Messages are sent from
+        the clock thread if None, or if they do not fit in the ring.
+
+        Args:
+            ring (Optional[RingOutput]): The event ring, e.g. `RingOutput()`.
+        """
+        self._ring = ring
+        for player in self._players.values():
+            player._ring = ring
+
+    def play_source(self, name: str, source: str) -> None:
+        """Play the pattern written by `source` on a player, e.g.
+        `P.play_source("d1", "s('bd [cp cp]') >> out(superdirt)")`. With a render backend,
+        the pattern is rendered by worker processes. Names of the outputs are resolved
+        with the targets of the render backend.
+
+        Args:
+            name (str): The name of the player.
+            source (str): Python code written with the Carousel vocabulary.
+        """
+        targets = self._renderer.targets if self._renderer is not None else {}
+        pattern = compile_source(source, targets)
+        player = self.__getattr__(name)
+        player.pattern, player.source, player._renderer = pattern, source, self._renderer
+        if self._renderer is not None:
+            self._renderer.set_source(name, source)
+
+    def _forget_source(self, name: str) -> None:
+        """Stop rendering a player from its source."""
+        player = self._players.get(name)
+        if player is not None:
+            player.source = None
+        if self._renderer is not None:
+            self._renderer.remove(name)
+
     def __iter__(self):
         return iter(self._players.values())
 
@@ -43,7 +105,8 @@ class CarouselPatternManager:
     def remove_player(self, name: str):
         """Remove a player"""
         if name in self._players:
-            del self._players[name]
+            self._forget_source(name)
+            env.unsubscribe(self._players.pop(name))
 
     def list_players(self):
         """List all players"""
@@ -53,10 +116,9 @@ class CarouselPatternManager:
         """Update a player with a new pattern"""
         if name in self._players:
             self._players[name].pattern = pattern
+            self._forget_source(name)
         else:
-            new_stream = CarouselStream(clock=env.clock, name=name)
-            new_stream.pattern = pattern
-            self._players[name] = new_stream
+            self._new_player(name).pattern = pattern
 
     def __repr__(self):
         return f"CarouselPatternManager(players={list(self._players.keys())})"
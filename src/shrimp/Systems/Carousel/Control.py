@@ -1,5 +1,5 @@
 import sys
-from .Pattern import sequence, Pattern
+from .Pattern import sequence, Pattern, _arguments_key, _interned_pattern
 from typing import Callable
 
 # Create functions for making control patterns (patterns of dictionaries)
@@ -347,14 +347,15 @@ def make_control(control_name: str) -> Callable:
     """Creates a new control function with the given name"""
 
     def ctrl(*args):
-        return sequence(*[Pattern.reify(arg) for arg in args]).with_value(
-            lambda v: {control_name: v}
+        return _interned_pattern(
+            ("control", control_name, *_arguments_key(args)),
+            lambda: sequence(*[Pattern.reify(arg) for arg in args]).with_value(
+                lambda v: {control_name: v}
+            ),
         )
 
     def ctrl_pattern(self, *args):
-        return self >> sequence(*[Pattern.reify(arg) for arg in args]).with_value(
-            lambda v: {control_name: v}
-        )
+        return self >> ctrl(*args)
 
     # setattr(Pattern, name, lambda pat: Pattern(reify(pat).fmap(lambda v: {name: v}).query))
     setattr(module_obj, control_name, ctrl)
@@ -2,6 +2,7 @@ import pprint
 
 from ..Mini.grammar import grammar
 from ..Mini.interpreter import MiniInterpreter, MiniVisitor
+from ..Pattern import _interned_pattern
 
 visitor = MiniVisitor()
 interpreter = MiniInterpreter()
@@ -14,8 +15,9 @@ def parse_mini(code: str):
 
 
 def mini(code: str, print_ast: bool = False):
-    """Parse and evaluate the given code."""
-    ast = parse_mini(code)
+    """Parse and evaluate the given code. The same code gives the same pattern object."""
     if print_ast:
+        ast = parse_mini(code)
         pprint.pp(ast)
-    return interpreter.eval(ast)
+        return interpreter.eval(ast)
+    return _interned_pattern(("mini", code), lambda: interpreter.eval(parse_mini(code)))
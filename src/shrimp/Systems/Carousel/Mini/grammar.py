@@ -53,8 +53,17 @@ bugs, optimizations, or questions.
 """
 
 from parsimonious import Grammar
+from importlib.metadata import version
+import hashlib
+import logging
+import pickle
+import appdirs
+import sys
+import os
 
-grammar = Grammar(
+CACHE_DIRECTORY = appdirs.user_cache_dir("Shrimp", "Raphaël Forment")
+
+RULES = (
     r"""
     root = ws? sequence ws?
 
@@ -129,3 +138,34 @@ grammar = Grammar(
     ws = ~"\s+"
     """
 )
+
+
+def _cache_file(rules: str) -> str:
+    """Path of the cached grammar: compiled grammars are specific to the rules and to the
+    versions of Python and parsimonious that compiled them."""
+    key = f"{rules}{sys.version}{version('parsimonious')}".encode()
+    return os.path.join(CACHE_DIRECTORY, f"mini-{hashlib.sha1(key).hexdigest()[:16]}.pickle")
+
+
+def load_grammar(rules: str = RULES) -> Grammar:
+    """Load the compiled grammar from the disk cache, compiling and caching it if needed."""
+    path = _cache_file(rules)
+    try:
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    except Exception:
+        pass
+
+    compiled = Grammar(rules)
+    try:
+        os.makedirs(CACHE_DIRECTORY, exist_ok=True)
+        temporary = f"{path}.{os.getpid()}"
+        with open(temporary, "wb") as f:
+            pickle.dump(compiled, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary, path)
+    except OSError as e:
+        logging.warning(f"Could not cache the mini-notation grammar: {e}")
+    return compiled
+
+
+grammar = load_grammar()
@@ -141,17 +141,66 @@ in this class, and they are unsufficiently documented.
 # - [ ] xfade
 
 import math
-from functools import reduce, partial
+from fractions import Fraction
+from functools import reduce, partial, lru_cache
 from typing import Self, List, Callable, Optional, Iterable, Any, Tuple, Dict
-from pyautogui import position as mouse_position
-from pyautogui import size as screen_size
+from ...utils import lazy_import
 from .TimeSpan import TimeSpan, TidalFraction
 from .Hap import Hap
-from .Utils import flatten, identity, bjorklund, curry, remove_nones, xorwise
+from .Utils import flatten, identity, euclid_rhythm, curry, remove_nones, xorwise, splitmix64
 from itertools import accumulate
-import types
+from contextlib import contextmanager
+from operator import attrgetter
+from bisect import bisect_right
+import threading
+import weakref
+
+# pyautogui is slow to import and needs a display: it is loaded by mouseX/mouseY
+_pyautogui = lazy_import("pyautogui")
+_np = lazy_import("numpy")
+
+
+def _applicative_operators(cls):
+    """Class decorator defining the applicative operator methods of patterns: `addleft`,
+    `addright`, `addboth`, `subleft`, ... The structure comes from the left pattern, the
+    right pattern or both patterns. Methods are generated once, on the class."""
+    operations = {
+        "add": lambda a, b: a + b,
+        "sub": lambda a, b: a - b,
+        "mul": lambda a, b: a * b,
+        "truediv": lambda a, b: a / b,
+        "floordiv": lambda a, b: a // b,
+        "mod": lambda a, b: a % b,
+        "pow": lambda a, b: a**b,
+    }
+
+    structures = {
+        "left": "the pattern it is called on",
+        "right": "the other pattern",
+        "both": "both patterns",
+    }
+
+    def _apply_op_pattern(op_name: str, func: Callable, side: str) -> Callable:
+        app = getattr(cls, f"_app_{side}")
+
+        def method(self, other: Self) -> Self:
+            return app(
+                self.with_value(lambda x: lambda y: self._apply_op(x, y, func)),
+                Pattern.reify(other),
+            )
+
+        method.__name__ = f"{op_name}{side}"
+        method.__qualname__ = f"{cls.__name__}.{method.__name__}"
+        method.__doc__ = f"Applies {op_name}, keeping the structure of {structures[side]}."
+        return method
 
+    for op_name, func in operations.items():
+        for side in structures:
+            setattr(cls, f"{op_name}{side}", _apply_op_pattern(op_name, func, side))
+    return cls
 
+
+@_applicative_operators
 class Pattern:
     """
     Pattern class, representing discrete and continuous events as a function of time.
@@ -160,10 +209,13 @@ class Pattern:
     time span represents the time interval over which the pattern is queried.
     """
 
+    # Patterns are created for every combinator call, including the ones made for each
+    # frame of the carousel clock: no instance dictionary.
+    __slots__ = ("query", "_tactus", "__weakref__")
+
     def __init__(self, query: Callable, tactus: Optional[int] = None):
         self.query: Callable[[TimeSpan], List[Hap]] = query
         self._tactus = tactus
-        self._generate_applicative_methods()
 
     @property
     def tactus(self) -> Optional[int]:
@@ -203,9 +255,16 @@ class Pattern:
 
     @staticmethod
     def _patternify(method: Callable) -> Self:
-        """Turns a method into a pattern method, by lifting the arguments to patterns."""
+        """Turns a method into a pattern method, by lifting the arguments to patterns.
+        A single constant argument is passed to the method as is: lifting it would only
+        add an inner join over a pure pattern."""
 
         def patterned(self, *args: Any) -> Self:
+            if len(args) == 1 and _is_constant(args[0]):
+                arg = args[0]
+                return _interned_pattern(
+                    (method, id(self), _argument_key(arg)), lambda: method(self, arg)
+                )
             pat_arg = sequence(*args)
             return pat_arg.with_value(lambda arg: method(self, arg)).inner_join()
 
@@ -609,44 +668,6 @@ class Pattern:
             print(a, b)
             raise ValueError("Both arguments must be either pure values or dictionaries.")
 
-    # TODO: I think that this is not the right way to implement this (bugs ?)
-    def _generate_applicative_methods(self):
-        def _apply_op_pattern(op_name: str, func: Callable):
-            def method_left(self, other: Self) -> Self:
-                return self.with_value(lambda x: lambda y: self._apply_op(x, y, func)).app_left(
-                    Pattern.reify(other)
-                )
-
-            def method_right(self, other: Self) -> Self:
-                return self.with_value(lambda x: lambda y: self._apply_op(x, y, func)).app_right(
-                    Pattern.reify(other)
-                )
-
-            def method_both(self, other: Self) -> Self:
-                return self.with_value(lambda x: lambda y: self._apply_op(x, y, func)).app_both(
-                    Pattern.reify(other)
-                )
-
-            return method_left, method_right, method_both
-
-        # Define the operations and their corresponding functions
-        operations = {
-            "add": lambda a, b: a + b,
-            "sub": lambda a, b: a - b,
-            "mul": lambda a, b: a * b,
-            "truediv": lambda a, b: a / b,
-            "floordiv": lambda a, b: a // b,
-            "mod": lambda a, b: a % b,
-            "pow": lambda a, b: a**b,
-        }
-
-        # Attach the methods to the instance
-        for op_name, func in operations.items():
-            method_left, method_right, method_both = _apply_op_pattern(op_name, func)
-            setattr(self, f"{op_name}left", types.MethodType(method_left, self))
-            setattr(self, f"{op_name}right", types.MethodType(method_right, self))
-            setattr(self, f"{op_name}both", types.MethodType(method_both, self))
-
     def __add__(self, other: Self) -> Self:
         return self.with_value(
             lambda x: lambda y: self._apply_op(x, y, lambda a, b: a + b)
@@ -946,14 +967,13 @@ class Pattern:
     def jux(self, func: Callable, by: int | float = 1) -> Self:
         """Classic Tidal Function."""
 
-        left = self.with_value(
-            lambda val: dict(list(val.items()) + [("pan", val.get("pan", 0.5) - by / 2)])
-        )
-        right = self.with_value(
-            lambda val: dict(list(val.items()) + [("pan", val.get("pan", 0.5) + by / 2)])
-        )
+        def left(pat: Self) -> Self:
+            return pat.with_value(lambda val: {**val, "pan": val.get("pan", 0.5) - by / 2})
 
-        return stack(left, func(right))
+        def right(pat: Self) -> Self:
+            return func(pat.with_value(lambda val: {**val, "pan": val.get("pan", 0.5) + by / 2}))
+
+        return self._layers(left, right)
 
     def superimpose(self, func: Callable) -> Self:
         """
@@ -964,7 +984,7 @@ class Pattern:
         >>> s("bd sn cp hh").superimpose(lambda p: p.speed(2).early(0.125))
 
         """
-        return stack(self, func(self))
+        return self._layers(identity, func)
 
     def layer(self, *list_funcs: Callable) -> Self:
         """
@@ -981,7 +1001,21 @@ class Pattern:
         >>> s("arpy [~ arpy:4]").layer(identity, rev, lambda p: p.fast(2)])
 
         """
-        return stack(*[func(self) for func in list_funcs])
+        return self._layers(*list_funcs)
+
+    def _layers(self, *list_funcs: Callable) -> Self:
+        """
+        Stack of functions of this pattern. Within a query, layers querying this pattern
+        over the same span (e.g. layers only changing values) share the result.
+        """
+        shared = Pattern(_SharedQuery(self.query), self.tactus)
+        layers = stack(*[func(shared) for func in list_funcs])
+
+        def _query(span: TimeSpan) -> List[Hap]:
+            with shared_queries():
+                return layers.query(span)
+
+        return Pattern(_query, layers.tactus)
 
     def append(self, other: Self) -> Self:
         """Appends two patterns together and compress them into a single cycle"""
@@ -1092,6 +1126,8 @@ class Pattern:
         (SuperDirt, Dirt, etc.)
 
         """
+        if _is_constant(n_pat):
+            return self._striate(n_pat)
         return self.reify(n_pat).with_value(lambda n: self._striate(n)).inner_join()
 
     def _striate(self, n: int) -> Self:
@@ -1155,19 +1191,19 @@ class Pattern:
         """
         return self.degrade_by(0.5)
 
-    def degrade_by(self, by: float, prand: Self = None) -> Self:
+    def degrade_by(self, by: float, prand: Self = None, seed: int = 0) -> Self:
         """
         Randomly removes events from pattern.
 
         You can control the percentage of events that are removed with `by`.
         With `prand` you can specify a different random pattern, must be a
-        numerical 0-1 ranged pattern.
+        numerical 0-1 ranged pattern. Otherwise `seed` selects the random stream.
 
         """
         if by == 0:
             return self
         if not prand:
-            prand = rand()
+            return self._filter_rand(lambda v: v > by, seed)
         return self.with_value(lambda a: lambda _: a)._app_left(
             prand.filter_values(lambda v: v > by)
         )
@@ -1180,22 +1216,41 @@ class Pattern:
         """
         return self.undegrade_by(0.5)
 
-    def undegrade_by(self, by: float, prand: Self = None) -> Self:
+    def undegrade_by(self, by: float, prand: Self = None, seed: int = 0) -> Self:
         """
         Same as `degrade`, but random values represent percentage of events to
         keep, not remove.
 
         You can control the percentage of events that are removed with `by`.
         With `prand` you can specify a different random pattern, must be a
-        numerical 0-1 ranged pattern.
+        numerical 0-1 ranged pattern. Otherwise `seed` selects the random stream.
 
         """
         if not prand:
-            prand = rand()
+            return self._filter_rand(lambda v: v <= by, seed)
         return self.with_value(lambda a: lambda _: a)._app_left(
             prand.filter_values(lambda v: v <= by)
         )
 
+    def _filter_rand(self, test: Callable, seed: int = 0) -> Self:
+        """Keeps the haps whose random value passes `test`. Same as applying `rand(seed)`
+        filtered by `test` to the left: the random value of a hap is sampled at the middle
+        of its whole, the random values of a query are computed in one batch."""
+
+        def _query(span: TimeSpan) -> List[Hap]:
+            haps = self.query(span)
+            spans = [hap.whole_or_part() for hap in haps]
+            rands = _counters_to_rands([_midpoint_to_counter(hap_span) for hap_span in spans], seed)
+            kept = []
+            for hap, hap_span, value in zip(haps, spans, rands):
+                if test(value):
+                    part = hap.part.intersection(hap_span)
+                    if part:
+                        kept.append(Hap(hap.whole, part, hap.value))
+            return kept
+
+        return Pattern(_query)
+
     def sometimes_by(self, by_pat: float, func: Callable) -> Self:
         """
         Applies a function to pattern sometimes based on specified `by`
@@ -1207,6 +1262,8 @@ class Pattern:
         >>> s("bd").fast(8).sometimes_by(0.75, lambda p: p << speed(3))
 
         """
+        if _is_constant(by_pat):
+            return self._sometimes_by(by_pat, func)
         return self.reify(by_pat).with_value(lambda by: self._sometimes_by(by, func)).inner_join()
 
     def always(self, func: Callable) -> Self:
@@ -1265,6 +1322,8 @@ class Pattern:
         applying function.
 
         """
+        if _is_constant(by_pat):
+            return self._sometimes_pre_by(by_pat, func)
         return (
             self.reify(by_pat).with_value(lambda by: self._sometimes_pre_by(by, func)).inner_join()
         )
@@ -1278,6 +1337,8 @@ class Pattern:
 
     def somecycles_by(self, by_pat: float, func: Callable) -> Self:
         """Applies a function to pattern sometimes based on specified `by` percentage, at random."""
+        if _is_constant(by_pat):
+            return self._somecycles_by(by_pat, func)
         return self.reify(by_pat).with_value(lambda by: self._somecycles_by(by, func)).inner_join()
 
     def _somecycles_by(self, by: float, func: Callable) -> Self:
@@ -1293,12 +1354,53 @@ class Pattern:
         dropped).
 
         """
-        return (
-            sequence(binary_pats)
-            .with_value(lambda b: lambda val: val if b else None)
-            ._app_left(self)
-            .remove_none()
-        )
+        bits = binary_pats
+        if len(bits) == 1 and isinstance(bits[0], (list, tuple)):
+            bits = bits[0]
+        if bits and all(_is_constant(bit) for bit in bits):
+            return self._struct_steps(tuple(bits))
+
+        structure = sequence(binary_pats)
+
+        def _query(span: TimeSpan) -> List[Hap]:
+            haps = []
+            for step in structure.query(span):
+                # The pattern is only queried over the true segments of the structure
+                if not step.value:
+                    continue
+                for hap in self.query(step.whole_or_part()):
+                    part = step.part.intersection(hap.part)
+                    # Falsy values are dropped
+                    if part and hap.value:
+                        haps.append(Hap(step.whole, part, hap.value))
+            return haps
+
+        return Pattern(_query)
+
+    def _struct_steps(self, bits: Tuple[Any, ...]) -> Self:
+        """
+        Restructure the pattern according to a rhythm of `len(bits)` steps per cycle,
+        given as a tuple of bits. Equivalent to `self.struct(sequence(list(bits)))`, but
+        haps are computed from the step numbers instead of querying a sequence.
+        """
+        steps = len(bits)
+
+        def _query(span: TimeSpan) -> List[Hap]:
+            haps = []
+            if span.end <= span.begin:
+                return haps
+            for step in range(math.floor(span.begin * steps), math.ceil(span.end * steps)):
+                if not bits[step % steps]:
+                    continue
+                whole = TimeSpan(TidalFraction(step, steps), TidalFraction(step + 1, steps))
+                part = TimeSpan(max(span.begin, whole.begin), min(span.end, whole.end))
+                for hap in self.query(whole):
+                    new_part = part.intersection(hap.part)
+                    if new_part and hap.value:
+                        haps.append(Hap(whole, new_part, hap.value))
+            return haps
+
+        return _interned_pattern(("struct", id(self), bits), lambda: Pattern(_query))
 
     def ply(self, factor: int) -> Self:
         """Tidal 'ply' function"""
@@ -1313,12 +1415,21 @@ class Pattern:
         given binary pattern.
 
         """
-        return (
-            sequence(binary_pats)
-            .with_value(lambda b: lambda val: val if b else None)
-            ._app_right(self)
-            .remove_none()
-        )
+        structure = sequence(binary_pats)
+
+        def _query(span: TimeSpan) -> List[Hap]:
+            haps = []
+            for hap in self.query(span):
+                if not hap.value:
+                    continue
+                for step in structure.query(hap.whole_or_part()):
+                    if step.value:
+                        part = step.part.intersection(hap.part)
+                        if part:
+                            haps.append(Hap(hap.whole, part, hap.value))
+            return haps
+
+        return Pattern(_query)
 
     def mask_all(self, *binary_pats: bool) -> Self:
         raise NotImplementedError
@@ -1343,7 +1454,13 @@ class Pattern:
         >>> s("sd").euclid(5, 8, fastcat(0, 2, 4))
 
         """
-        return self.struct(_tparams(_euclid, k, n, rot).inner_join())
+
+        def structure(k: int, n: int, rot: int) -> Self:
+            return self._struct_steps(euclid_rhythm(k, n, rot))
+
+        if _is_constant(k) and _is_constant(n) and _is_constant(rot):
+            return structure(k, n, rot)
+        return _tparams(structure, k, n, rot).inner_join()
 
     ################################################################################
     # NOTHING OR SILENCE FUNCTIONS
@@ -1445,6 +1562,83 @@ def _tparams(func, *params: Any) -> Pattern:
     )
 
 
+################################################################################
+# HASH-CONSING
+################################################################################
+
+# Patterns built by declarative constructors (pure, sequence, stack, mini, controls,
+# patterned methods with a constant argument...), by key. Equal subtrees are the same
+# object, as long as they are alive.
+_interned: "weakref.WeakValueDictionary[tuple, Pattern]" = weakref.WeakValueDictionary()
+_frame = threading.local()
+
+
+class _SharedQuery:
+    """Query of an interned pattern: within `shared_queries`, it is computed once per span
+    for all the patterns sharing the subtree."""
+
+    __slots__ = ("query",)
+
+    def __init__(self, query: Callable):
+        self.query = query
+
+    def __call__(self, span: TimeSpan) -> List[Hap]:
+        memo = getattr(_frame, "memo", None)
+        if memo is None:
+            return self.query(span)
+        key = (self, span.begin, span.end)
+        haps = memo.get(key)
+        if haps is None:
+            haps = memo[key] = list(self.query(span))
+        return list(haps)
+
+
+def _argument_key(arg: Any) -> tuple:
+    """Key of a constructor argument. 1, 1.0 and True are equal but build different
+    patterns. Patterns cannot be compared: they are identified by their id, which cannot
+    be reused while the interned pattern (referencing them) is alive."""
+    return (Pattern, id(arg)) if isinstance(arg, Pattern) else (type(arg), arg)
+
+
+def _arguments_key(args: Iterable) -> tuple:
+    return tuple(_argument_key(arg) for arg in args)
+
+
+def _interned_pattern(key: tuple, build: Callable[[], Pattern]) -> Pattern:
+    """Returns the pattern interned for `key`, built by `build` if needed. Patterns whose
+    key is not hashable (e.g. lists or dicts in the arguments) are not shared."""
+    try:
+        pattern = _interned.get(key)
+    except TypeError:
+        return build()
+    if pattern is None:
+        pattern = build()
+        if not isinstance(pattern.query, _SharedQuery):
+            pattern.query = _SharedQuery(pattern.query)
+        _interned[key] = pattern
+    return pattern
+
+
+@contextmanager
+def shared_queries():
+    """
+    Within this context (e.g. a frame of the carousel clock), interned subtrees are only
+    queried once per span in the current thread: a subtree shared by ten players is
+    queried once per frame.
+
+    >>> with shared_queries():
+    ...     haps = [pattern.query(span) for pattern in patterns]
+    """
+    if getattr(_frame, "memo", None) is not None:
+        yield
+        return
+    _frame.memo = {}
+    try:
+        yield
+    finally:
+        _frame.memo = None
+
+
 def pure(value: Any) -> Pattern:
     """
     Returns a pattern that repeats 'value' once per cycle using
@@ -1463,7 +1657,7 @@ def pure(value: Any) -> Pattern:
             for subspan in span.span_cycles()
         ]
 
-    return Pattern(_query)
+    return _interned_pattern(("pure", _argument_key(value)), lambda: Pattern(_query))
 
 
 def steady(value: Any) -> Pattern:
@@ -1481,10 +1675,13 @@ def slowcat(*pats: Pattern) -> Pattern:
     pats = [Pattern.reify(pat) for pat in pats]
 
     def _query(span: TimeSpan) -> List[Hap]:
-        pat = pats[math.floor(span.begin) % len(pats)]
-        return pat.query(span)
+        # Queries are split at cycle boundaries, each cycle only queries its pattern
+        haps = []
+        for subspan in span.span_cycles():
+            haps.extend(pats[math.floor(subspan.begin) % len(pats)].query(subspan))
+        return haps
 
-    return Pattern(_query).split_queries()
+    return _interned_pattern(("slowcat", *_arguments_key(pats)), lambda: Pattern(_query))
 
 
 def fastcat(*pats: Pattern) -> Pattern:
@@ -1498,13 +1695,31 @@ seq = fastcat
 
 
 def stack(*pats: Tuple[Pattern]) -> Self:
-    """Pile up patterns"""
+    """Pile up patterns. Haps are sorted by onset (the beginning of their part), haps
+    with the same onset keep the order of the patterns."""
     pats = [Pattern.reify(pat) for pat in pats]
 
     def _query(span: TimeSpan) -> List[Hap]:
-        return flatten([pat.query(span) for pat in pats])
+        return _merge_haps([pat.query(span) for pat in pats])
+
+    return _interned_pattern(("stack", *_arguments_key(pats)), lambda: Pattern(_query))
+
+
+_part_begin = attrgetter("part.begin")
+
+
+def _merge_haps(results: List[List[Hap]]) -> List[Hap]:
+    """Merges the haps of the patterns of a stack by onset. The result of each pattern is
+    usually sorted already: the stable sort (Timsort) then only merges these runs."""
+    haps = [hap for result in results for hap in result]
+    haps.sort(key=_part_begin)
+    return haps
 
-    return Pattern(_query)
+
+def _is_constant(x: Any) -> bool:
+    """Returns True if `x` is a plain value, that `sequence` and `Pattern.reify` lift to
+    a pure pattern."""
+    return not isinstance(x, (Pattern, str, list, tuple))
 
 
 def _sequence_count(x: list | tuple | str | Any) -> Tuple[Pattern, int]:
@@ -1527,7 +1742,7 @@ def _sequence_count(x: list | tuple | str | Any) -> Tuple[Pattern, int]:
 
 def sequence(*args: Any) -> Pattern:
     """TODO: add docstring"""
-    return _sequence_count(args)[0]
+    return _interned_pattern(("sequence", *_arguments_key(args)), lambda: _sequence_count(args)[0])
 
 
 def congruent(a: Hap, b: Hap) -> bool:
@@ -1561,14 +1776,6 @@ def polyrhythm(*xs: Any) -> Pattern:
     return stack(*seqs)
 
 
-def _euclid(k: int, n: int, rotation: float):
-    """Generate an euclidean sequence, with optional rotation"""
-    b = bjorklund(k, n)
-    if rotation:
-        b = b[rotation:] + b[:rotation]
-    return sequence(b)
-
-
 @partial_decorator
 def fast(arg: int | float, pat: Any):
     """Override for `fast` method"""
@@ -1662,9 +1869,29 @@ def timecat(*time_pat_tuples):
     for time, pat in time_pat_tuples:
         arranged.append((accum, accum + TidalFraction(time), Pattern.reify(pat)))
         accum += time
-    return stack(
-        *[pat.compress(TidalFraction(s, total), TidalFraction(e, total)) for s, e, pat in arranged]
-    )
+    begins = [TidalFraction(s, total) for s, _, _ in arranged]
+    ends = [TidalFraction(e, total) for _, e, _ in arranged]
+    children = [pat.compress(s, e) for s, e, (_, _, pat) in zip(begins, ends, arranged)]
+    if any(s >= e for s, e in zip(begins, ends)):
+        # Negative or null weights: the children are not sorted
+        return stack(*children)
+
+    def _query(span: TimeSpan) -> List[Hap]:
+        # Children are sorted by position in the cycle: only the ones overlapping the
+        # query are visited, found by bisection on their ends
+        results = []
+        for piece in span.span_cycles() if span.end > span.begin else [span]:
+            cycle = piece.begin.sam()
+            begin, end = piece.begin - cycle, piece.end - cycle
+            index = bisect_right(ends, begin)
+            while index < len(children) and (
+                begins[index] < end or begins[index] == begin == end
+            ):
+                results.append(children[index].query(piece))
+                index += 1
+        return _merge_haps(results)
+
+    return Pattern(_query)
 
 
 # TODO: fix ??
@@ -1756,17 +1983,21 @@ def envEqR() -> Pattern:
     return signal(lambda t: math.sqrt(math.cos(math.pi / 2 * max(0, min(1 - t, 1)))))
 
 
-def rand() -> Pattern:
+def rand(seed: int = 0) -> Pattern:
     """
     Generate a continuous pattern of pseudo-random numbers between `0` and `1`.
+    Patterns with the same `seed` generate the same numbers.
 
     >>> rand().segment(4)
+    >>> rand(seed=2).segment(4)
 
     """
+    if seed:
+        return signal(lambda t: time_to_rand(t, seed))
     return signal(time_to_rand)
 
 
-def irand(n: int) -> Pattern:
+def irand(n: int, seed: int = 0) -> Pattern:
     """
     Generate a pattern of pseudo-random whole numbers between `0` to `n-1` inclusive.
 
@@ -1776,7 +2007,7 @@ def irand(n: int) -> Pattern:
     >>> irand(16).segment(8)
 
     """
-    return signal(lambda t: math.floor(time_to_rand(t) * n))
+    return signal(lambda t: math.floor(time_to_rand(t, seed) * n))
 
 
 def _perlin_with(p: Pattern) -> Pattern:
@@ -1788,19 +2019,37 @@ def _perlin_with(p: Pattern) -> Pattern:
     pa = p.with_value(math.floor)
     pb = p.with_value(lambda v: math.floor(v) + 1)
 
-    def smoother_step(x: int | float) -> float:
-        return 6.0 * x**5 - 15.0 * x**4 + 10.0 * x**3
-
-    interp = lambda x: lambda a: lambda b: a + smoother_step(x) * (b - a)
+    interp = lambda x: lambda a: lambda b: a + _smoother_step(x) * (b - a)
 
     return (
         (p - pa)
         .with_value(interp)
-        ._app_both(pa.with_value(time_to_rand))
-        ._app_both(pb.with_value(time_to_rand))
+        ._app_both(pa.with_value(_perlin_lattice))
+        ._app_both(pb.with_value(_perlin_lattice))
     )
 
 
+@lru_cache(maxsize=4096)
+def _perlin_lattice(i: int) -> float:
+    """Random value of the Perlin noise at the integer `i`."""
+    return time_to_rand(i)
+
+
+def _smoother_step(x: int | float) -> float:
+    if isinstance(x, Fraction):
+        # Same floats as the fraction powers, without fraction arithmetic
+        n, d = x.numerator, x.denominator
+        return 6.0 * (n**5 / d**5) - 15.0 * (n**4 / d**4) + 10.0 * (n**3 / d**3)
+    return 6.0 * x**5 - 15.0 * x**4 + 10.0 * x**3
+
+
+def _perlin_at(t: float) -> float:
+    """Perlin noise at the time `t`: interpolation between the lattice values around `t`."""
+    i = math.floor(t)
+    a = _perlin_lattice(i)
+    return a + _smoother_step(t - i) * (_perlin_lattice(i + 1) - a)
+
+
 def perlin(p: Optional[Pattern] = None) -> Pattern:
     """
     1D Perlin (smooth) noise, works like rand but smoothly moves between random
@@ -1808,22 +2057,50 @@ def perlin(p: Optional[Pattern] = None) -> Pattern:
 
     """
     if not p:
-        p = signal(identity)
+        return signal(_perlin_at)
     return _perlin_with(p)
 
 
 # Randomness
 RANDOM_CONSTANT = 2**29
 RANDOM_CYCLES_LENGTH = 300
+# Batches of times smaller than this are computed in Python, numpy only pays off for large
+# arrays
+RANDOM_VECTOR_SIZE = 64
+
+
+def _time_to_counter(a: float) -> int:
+    """Stretch RANDOM_CYCLES_LENGTH cycles over the range of [0, RANDOM_CONSTANT]: position
+    of a time value in the random streams. Exact integer arithmetic for fractions."""
+    if isinstance(a, Fraction):
+        counter = abs(a.numerator) * RANDOM_CONSTANT // (a.denominator * RANDOM_CYCLES_LENGTH)
+        return counter if a.numerator >= 0 else -counter
+    return math.trunc((a / RANDOM_CYCLES_LENGTH) * RANDOM_CONSTANT)
+
+
+def _midpoint_to_counter(span: TimeSpan) -> int:
+    """Same as `_time_to_counter(span.midpoint())`, without fraction arithmetic."""
+    begin, end = span.begin, span.end
+    if not (isinstance(begin, Fraction) and isinstance(end, Fraction)):
+        return _time_to_counter(span.midpoint())
+    numerator = begin.numerator * end.denominator + end.numerator * begin.denominator
+    denominator = 2 * begin.denominator * end.denominator * RANDOM_CYCLES_LENGTH
+    counter = abs(numerator) * RANDOM_CONSTANT // denominator
+    return counter if numerator >= 0 else -counter
 
 
-def time_to_int_seed(a: float) -> int:
+def time_to_int_seed(a: float, seed: int = 0) -> int:
     """
     Stretch RANDOM_CYCLES_LENGTH cycles over the range of [0, RANDOM_CONSTANT]
     then apply the xorshift algorithm.
 
+    Other seeds select other streams: the position is then hashed with the seed by the
+    SplitMix64 counter-based RNG.
+
     """
-    return xorwise(math.trunc((a / RANDOM_CYCLES_LENGTH) * RANDOM_CONSTANT))
+    if seed:
+        return splitmix64(_time_to_counter(a) ^ splitmix64(seed))
+    return xorwise(_time_to_counter(a))
 
 
 def int_seed_to_rand(a: int) -> float:
@@ -1831,9 +2108,47 @@ def int_seed_to_rand(a: int) -> float:
     return (a % RANDOM_CONSTANT) / RANDOM_CONSTANT
 
 
-def time_to_rand(a: float) -> float:
+def time_to_rand(a: float, seed: int = 0) -> float:
     """Converts a time value to a random float between 0 and 1"""
-    return int_seed_to_rand(time_to_int_seed(a))
+    return int_seed_to_rand(time_to_int_seed(a, seed))
+
+
+def times_to_rands(times: Iterable[float], seed: int = 0) -> List[float]:
+    """Converts time values to random floats between 0 and 1, same as `time_to_rand`.
+    Large batches are computed with numpy."""
+    return _counters_to_rands([_time_to_counter(t) for t in times], seed)
+
+
+def _counters_to_rands(counters: List[int], seed: int = 0) -> List[float]:
+    if len(counters) >= RANDOM_VECTOR_SIZE:
+        try:
+            return _counters_to_rands_vector(counters, seed)
+        except OverflowError:
+            # Counters do not fit in 64 bits integers
+            pass
+    if seed:
+        key = splitmix64(seed)
+        return [int_seed_to_rand(splitmix64(c ^ key)) for c in counters]
+    return [int_seed_to_rand(xorwise(c)) for c in counters]
+
+
+def _counters_to_rands_vector(counters: List[int], seed: int = 0) -> List[float]:
+    np = _np
+    x = np.array(counters, dtype=np.int64)
+    if seed:
+        # SplitMix64 on unsigned integers, wrapping like the `& _MASK64` of splitmix64
+        x = x.astype(np.uint64) ^ np.uint64(splitmix64(seed))
+        x = x + np.uint64(0x9E3779B97F4A7C15)
+        x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+        x = x ^ (x >> np.uint64(31))
+    else:
+        # Xorshift on 64 bits integers: the bits kept by int_seed_to_rand are the same as
+        # with unbounded Python integers
+        x = (x << 13) ^ x
+        x = (x >> 17) ^ x
+        x = (x << 5) ^ x
+    return ((x % RANDOM_CONSTANT) / RANDOM_CONSTANT).tolist()
 
 
 def signal(func: Callable) -> Pattern:
@@ -1870,7 +2185,7 @@ def cosine2() -> Pattern:
 
 def mouseX() -> Pattern:
     """Returns a pattern that generates the x position of the mouse"""
-    return signal(lambda _: mouse_position()[0] / screen_size()[0])
+    return signal(lambda _: _pyautogui.position()[0] / _pyautogui.size()[0])
 
 
 mousex = mouseX
@@ -1878,12 +2193,21 @@ mousex = mouseX
 
 def mouseY() -> Pattern:
     """Returns a pattern that generates the y position of the mouse"""
-    return signal(lambda _: mouse_position()[1] / screen_size()[1])
+    return signal(lambda _: _pyautogui.position()[1] / _pyautogui.size()[1])
 
 
 mousey = mouseY
 
 
+def osc_value(port: Any, address: str, index: int = 0, default: Any = 0) -> Pattern:
+    """
+    Returns a pattern sampling the latest value received by an OSC port on a given address.
+    The port must be listening (see OSC.listen). Sampling is lock-free: the pattern only
+    reads the port's latest-value table and never waits for the OSC loop.
+    """
+    return signal(lambda _: port.get(address, index, default))
+
+
 def wchoose(*vals):
     """Like @choose@, but works on an a list of tuples of values and weights"""
     return wchoose_with(rand(), *vals)
@@ -1927,17 +2251,34 @@ def choose_with(pat, *vals):
     return _choose_with(pat, *vals).outer_join()
 
 
-def choose_cycles(*vals):
+def choose_cycles(*vals, seed: int = 0):
     """
     Similar to `cat`, but rather than playing the given patterns in order, it
-    picks them at random.
+    picks them at random (from the random stream selected by `seed`).
 
     >>> s(choose_cycles("bd*2 sn", "jvbass*3", "drum*2", "ht mt")
 
     """
-    return choose(*vals).segment(1)
+    pats = [Pattern.reify(val) for val in vals]
+
+    def _query(span: TimeSpan) -> List[Hap]:
+        # Same as `choose(*vals).segment(1)`: the pattern of each cycle is picked with the
+        # random value at the middle of the cycle, its haps get the cycle as whole
+        haps = []
+        for subspan in span.span_cycles():
+            whole = TidalFraction(subspan.begin).whole_cycle()
+            pat = pats[math.floor(time_to_rand(whole.midpoint(), seed) * len(pats))]
+            for hap in pat.query(whole):
+                part = subspan.intersection(hap.part)
+                if part:
+                    haps.append(Hap(whole, part, hap.value))
+        return haps
+
+    return _interned_pattern(
+        ("choose_cycles", seed, *_arguments_key(pats)), lambda: Pattern(_query)
+    )
 
 
-def randcat(*vals):
+def randcat(*vals, seed: int = 0):
     """Alias of `choose_cycles`"""
-    return choose_cycles(*vals)
+    return choose_cycles(*vals, seed=seed)
@@ -0,0 +1,243 @@
+"""
+Process-pool render backend for Carousel streams.
+
+Patterns are shipped to worker processes by their source: Python code written with the
+Carousel vocabulary, e.g. "s('bd [cp cp]') >> out(superdirt)". Workers compile each
+source once, render whole cycles ahead of time and write compact hap batches (onset,
+offset and value of each event, pickled) to shared memory slots. The main process only
+reads the batches, merges them into the frames of the carousel clock and sends.
+
+Output objects (OSC, MIDIOut, ...) cannot be shipped to other processes: workers see
+them as RenderTarget placeholders, replaced by the real objects when batches are read.
+"""
+
+from concurrent.futures import Future, ProcessPoolExecutor, TimeoutError
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional, Tuple
+import multiprocessing
+import importlib
+import threading
+import logging
+import pickle
+import math
+import os
+
+# A rendered event: onset and offset (in cycles) and value of the hap
+RenderedEvent = Tuple[float, float, Any]
+
+SLOT_SIZE = 1 << 20
+
+
+class RenderTarget:
+    """Placeholder for an output object in worker processes."""
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __repr__(self) -> str:
+        return f"RenderTarget({self.name!r})"
+
+
+def compile_source(source: str, targets: Dict[str, Any]):
+    """Evaluate a pattern source with the Carousel vocabulary and the given targets."""
+    from .Mini import mini
+
+    carousel = vars(importlib.import_module(__package__))
+    namespace = {key: value for key, value in carousel.items() if not key.startswith("_")}
+    namespace["mini"] = mini
+    namespace.update(targets)
+    return eval(source, namespace)
+
+
+# Worker process state
+_worker_targets: Dict[str, RenderTarget] = {}
+_worker_patterns: Dict[str, Any] = {}
+_worker_slots: Dict[str, shared_memory.SharedMemory] = {}
+
+
+def _worker_init(target_names: List[str]) -> None:
+    """Initialise a worker process: pattern sources see placeholders for the targets."""
+    global _worker_targets
+    _worker_targets = {name: RenderTarget(name) for name in target_names}
+
+
+def _attach(slot_name: str) -> shared_memory.SharedMemory:
+    """Attach to a slot of the main process, once per worker."""
+    slot = _worker_slots.get(slot_name)
+    if slot is None:
+        # Workers share the resource tracker of the main process, which unlinks the slots
+        slot = _worker_slots[slot_name] = shared_memory.SharedMemory(name=slot_name)
+    return slot
+
+
+def _render(source: str, cycle: int, slot_name: str) -> Tuple[int, Optional[bytes]]:
+    """Render the onsets of a cycle of a pattern source into a shared memory slot. Returns
+    the size of the batch, and the batch itself if it does not fit in the slot."""
+    from .TimeSpan import TimeSpan, TidalFraction
+
+    pattern = _worker_patterns.get(source)
+    if pattern is None:
+        if len(_worker_patterns) >= 256:
+            _worker_patterns.clear()
+        pattern = _worker_patterns[source] = compile_source(source, _worker_targets)
+
+    haps = pattern.onsets_only().query(TimeSpan(TidalFraction(cycle), TidalFraction(cycle + 1)))
+    batch = pickle.dumps(
+        [(float(hap.whole.begin), float(hap.whole.end), hap.value) for hap in haps],
+        protocol=pickle.HIGHEST_PROTOCOL,
+    )
+    if len(batch) > SLOT_SIZE:
+        return len(batch), batch
+    _attach(slot_name).buf[: len(batch)] = batch
+    return len(batch), None
+
+
+class ProcessRenderer:
+    """
+    Render backend evaluating Carousel patterns in a pool of worker processes.
+
+    Each stream registered with a source is rendered one cycle at a time, `lookahead`
+    cycles ahead of the carousel clock. Streams are independent jobs: a set with many
+    heavy players is spread over the workers.
+
+    Args:
+        workers (int, optional): Number of worker processes. Defaults to the CPU count.
+        targets (dict, optional): Output objects (OSC, MIDIOut, ...) by the name used in
+            the pattern sources.
+        lookahead (int): Number of cycles rendered ahead of the current cycle.
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        targets: Optional[Dict[str, Any]] = None,
+        lookahead: int = 2,
+    ):
+        self._targets = dict(targets or {})
+        self._lookahead = lookahead
+        self._executor = ProcessPoolExecutor(
+            max_workers=workers or os.cpu_count(),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_worker_init,
+            initargs=(list(self._targets),),
+        )
+        self._lock = threading.Lock()
+        self._sources: Dict[str, str] = {}
+        # Rendered (or pending) cycles of each stream: cycle -> (future, slot) or events
+        self._cycles: Dict[str, Dict[int, Any]] = {}
+        self._slots: List[shared_memory.SharedMemory] = []
+        self._free_slots: List[shared_memory.SharedMemory] = []
+
+    @property
+    def targets(self) -> Dict[str, Any]:
+        """Output objects by the name used in the pattern sources."""
+        return self._targets
+
+    @property
+    def workers(self) -> int:
+        """Number of worker processes."""
+        return self._executor._max_workers
+
+    def set_source(self, name: str, source: str) -> None:
+        """Render the stream `name` from a pattern source. Cycles rendered for a previous
+        source are dropped."""
+        dropped = []
+        with self._lock:
+            if self._sources.get(name) != source:
+                self._sources[name] = source
+                dropped = self._drop(name)
+        self._release(dropped)
+
+    def remove(self, name: str) -> None:
+        """Stop rendering the stream `name`."""
+        with self._lock:
+            self._sources.pop(name, None)
+            dropped = self._drop(name)
+        self._release(dropped)
+
+    def events(
+        self, name: str, begin: float, end: float, timeout: Optional[float] = 0
+    ) -> Optional[List[RenderedEvent]]:
+        """Return the events of a stream whose onset is in [begin, end[, and request the
+        following cycles. Returns None if the cycles are not rendered after `timeout`
+        seconds (None to wait as long as needed): the caller should query the pattern
+        itself."""
+        first, last = math.floor(begin), math.ceil(end) - 1
+        with self._lock:
+            source = self._sources.get(name)
+            if source is None:
+                return None
+            cycles = self._cycles.setdefault(name, {})
+            past = [cycles.pop(cycle) for cycle in [c for c in cycles if c < first]]
+            for cycle in range(first, max(first, last) + self._lookahead + 1):
+                if cycle not in cycles:
+                    cycles[cycle] = self._submit(source, cycle)
+            pending = [(cycle, cycles[cycle]) for cycle in range(first, last + 1)]
+        self._release(past)
+
+        events = []
+        for cycle, rendered in pending:
+            if isinstance(rendered, tuple):
+                future, _ = rendered
+                try:
+                    future.result(timeout)
+                except TimeoutError:
+                    return None
+                except Exception as e:
+                    logging.error(f"Error while rendering {name} (cycle {cycle}): {e}")
+                    return None
+                rendered = self._read(name, cycle, rendered)
+            events.extend(event for event in rendered if begin <= event[0] < end)
+        return events
+
+    def close(self) -> None:
+        """Stop the worker processes and free the shared memory slots."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        with self._lock:
+            self._cycles.clear()
+            for slot in self._slots:
+                slot.close()
+                slot.unlink()
+            self._slots.clear()
+            self._free_slots.clear()
+
+    def _submit(self, source: str, cycle: int) -> Tuple[Future, shared_memory.SharedMemory]:
+        if self._free_slots:
+            slot = self._free_slots.pop()
+        else:
+            slot = shared_memory.SharedMemory(create=True, size=SLOT_SIZE)
+            self._slots.append(slot)
+        return self._executor.submit(_render, source, cycle, slot.name), slot
+
+    def _read(self, name: str, cycle: int, rendered: tuple) -> List[RenderedEvent]:
+        """Decode the batch of a rendered cycle and replace the target placeholders."""
+        future, slot = rendered
+        size, batch = future.result()
+        events = pickle.loads(slot.buf[:size] if batch is None else batch)
+        for _, _, value in events:
+            target = value.get("out") if isinstance(value, dict) else None
+            if isinstance(target, RenderTarget):
+                value["out"] = self._targets.get(target.name)
+        with self._lock:
+            cycles = self._cycles.get(name)
+            if cycles is not None and cycles.get(cycle) is rendered:
+                cycles[cycle] = events
+                self._free_slots.append(slot)
+        return events
+
+    def _drop(self, name: str) -> List[Any]:
+        """Forget the cycles of a stream. Returns them, to be released (see `_release`)."""
+        return list(self._cycles.pop(name, {}).values())
+
+    def _release(self, cycles: List[Any]) -> None:
+        """Give the slots of cycles back once they cannot be written to anymore. Must be
+        called without holding the lock: callbacks of finished futures run immediately."""
+        for rendered in cycles:
+            if isinstance(rendered, tuple):
+                future, slot = rendered
+                future.add_done_callback(lambda _, slot=slot: self._free_slot(slot))
+
+    def _free_slot(self, slot: shared_memory.SharedMemory) -> None:
+        with self._lock:
+            if slot in self._slots:
+                self._free_slots.append(slot)
@@ -145,10 +145,13 @@ class CarouselStream(BaseCarouselStream):
         if "out" not in event or not isinstance(event.get("out", None), OSC):
             return
 
-        output = event.pop("out")
+        # Haps (and their values) can be shared by several players: no in-place changes
+        output = event["out"]
         try:
             msg = []
             for key, val in event.items():
+                if key == "out":
+                    continue
                 if isinstance(val, Fraction):
                     val = float(val)
                 msg.append(key)
@@ -173,7 +176,10 @@ class CarouselStream(BaseCarouselStream):
                     correct_msg.remove(["s"])
                 except ValueError:
                     pass
-            output.send(address="/dirt/play", messages=[correct_msg], timestamp=unix_timestamp)
+            if self._ring is None or not self._ring.send(
+                output, "/dirt/play", correct_msg, unix_timestamp
+            ):
+                output.send(address="/dirt/play", messages=[correct_msg], timestamp=unix_timestamp)
         except Exception as e:
             logging.log(
                 logging.ERROR,
@@ -1,5 +1,5 @@
-from typing import Callable, Any, List
-from functools import wraps, partial
+from typing import Callable, Any, List, Tuple
+from functools import wraps, partial, lru_cache
 
 
 def remove_nones(lst) -> list:
@@ -48,6 +48,22 @@ def xorwise(x: int) -> int:
     return (b << 5) ^ b
 
 
+_MASK64 = (1 << 64) - 1
+
+
+def splitmix64(x: int) -> int:
+    """
+    SplitMix64 mixing function: a counter-based RNG, the n-th number of a stream is
+    `splitmix64(n)` (as a 64 bits unsigned integer).
+
+    cf. Steele, Lea, Flood (2014). "Fast splittable pseudorandom number generators".
+    """
+    x = (x + 0x9E3779B97F4A7C15) & _MASK64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return x ^ (x >> 31)
+
+
 def bjorklund(k: int, n: int, safe=True) -> List[int]:
     """Applies Bjorklund's algorithm for generating an euclidean rhythm sequence"""
 
@@ -84,3 +100,14 @@ def bjorklund(k: int, n: int, safe=True) -> List[int]:
             remainders = new_remainders
 
     return flatten(bins + remainders)
+
+
+@lru_cache(maxsize=4096)
+def euclid_rhythm(k: int, n: int, rotation: int = 0) -> Tuple[int, ...]:
+    """Returns the euclidean rhythm of `k` onsets in `n` steps (see `bjorklund`), rotated
+    to the left by `rotation` steps, as an immutable tuple of bits. Each rhythm of the
+    table is only computed once."""
+    bits = tuple(bjorklund(k, n))
+    if rotation:
+        bits = bits[rotation:] + bits[:rotation]
+    return bits
@@ -9,10 +9,10 @@ from typing import Optional
 
 env = get_global_environment()
 
-carousel_osc = OSC(name="carousel", host="127.0.0.1", port=57120, clock=env.clock)
-env.subscribe(carousel_osc)
-
-CarouselManager = CarouselPatternManager()
+# Created by start_carousel: importing the package has no side effect
+carousel_osc: Optional[OSC] = None
+CarouselManager: Optional[CarouselPatternManager] = None
+P: Optional[CarouselPatternManager] = None
 
 RATE = 1 / 20
 FRAME = RATE * 1e6
@@ -31,18 +31,38 @@ def vortex_clock_callback(start, ticks: int, session: "LinkSession", now: int |
     )
     if env.clock._playing:
         try:
-            for player in CarouselManager._players.values():
-                player.notify_tick(
-                    current_cycle=(cycle_from, cycle_to),
-                    link_session=session,
-                    cycles_per_second=env.clock.cps,
-                    beats_per_cycle=env.clock._denominator,
-                    now=now,
-                )
+            # Subtrees shared by several players are queried once per frame
+            with shared_queries():
+                for player in CarouselManager._players.values():
+                    player.notify_tick(
+                        current_cycle=(cycle_from, cycle_to),
+                        link_session=session,
+                        cycles_per_second=env.clock.cps,
+                        beats_per_cycle=env.clock._denominator,
+                        now=now,
+                    )
         except Exception as _:
             print(_)
 
     return (logical_now - now) / 1e6
 
 
-P = CarouselManager
+def start_carousel(host: str = "127.0.0.1", port: int = 57120) -> CarouselPatternManager:
+    """Open the carousel OSC port and create the pattern manager (P) of the global
+    environment, then register the carousel scheduler on its clock.
+
+    Args:
+        host (str): The host of the carousel OSC port.
+        port (int): The port of the carousel OSC port.
+
+    Returns:
+        CarouselPatternManager: The pattern manager.
+    """
+    global carousel_osc, CarouselManager, P
+    if CarouselManager is None:
+        carousel_osc = OSC(name="carousel", host=host, port=port, clock=env.clock)
+        env.subscribe(carousel_osc)
+        CarouselManager = P = CarouselPatternManager()
+        if env.clock is not None:
+            env.clock._carousel_clock_callback = vortex_clock_callback
+    return CarouselManager
@@ -1,5 +1,9 @@
 from ..Pattern import Pattern
 from typing import Optional
+from ....utils import lazy_import
+
+# NumPy is only needed by the batch evaluation (take) of the patterns
+np = lazy_import("numpy")
 
 
 class Pexp(Pattern):
@@ -25,6 +29,12 @@ class Pexp(Pattern):
         n_value = self._resolve_pattern(self.n, iterator)
         return min_value * (max_value / min_value) ** (index / n_value)
 
+    def take(self, start: int, n: int) -> list:
+        if any(isinstance(value, Pattern) for value in (self.min, self.max, self.n)):
+            return super().take(start, n)
+        index = np.arange(start, start + n) % self.n
+        return (self.min * (self.max / self.min) ** (index / self.n)).tolist()
+
 
 class Plin(Pattern):
     """
@@ -55,6 +65,12 @@ class Plin(Pattern):
         )
         return start_value + (end_value - start_value) * index / self.n
 
+    def take(self, start: int, n: int) -> list:
+        if isinstance(self.start, Pattern) or isinstance(self.end, Pattern):
+            return super().take(start, n)
+        index = np.arange(start, start + n) % self.n
+        return (self.start + (self.end - self.start) * index / self.n).tolist()
+
 
 class Plog(Pattern):
     """
@@ -107,6 +123,13 @@ class Pgeom(Pattern):
         index = iterator % self.len
         return self.start * (self.ratio**index)
 
+    def take(self, start: int, n: int) -> list:
+        # Integer powers are left to Python, which does not overflow
+        if self.len is None or not isinstance(self.ratio, float):
+            return super().take(start, n)
+        index = np.arange(start, start + n) % self.len
+        return (self.start * self.ratio**index).tolist()
+
 
 class Parr(Pattern):
     """
@@ -133,3 +156,9 @@ class Parr(Pattern):
 
         index = iterator % self.len
         return self.start + index * self.step
+
+    def take(self, start: int, n: int) -> list:
+        if self.len is None:
+            return super().take(start, n)
+        index = np.arange(start, start + n) % self.len
+        return (self.start + index * self.step).tolist()
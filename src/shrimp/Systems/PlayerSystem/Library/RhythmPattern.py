@@ -39,6 +39,17 @@ class Peuclid(Pattern):
         self.rhythm = euclidian_rhythm(pulses, length, rotate)
         return base if self.rhythm[iterator % len(self.rhythm)] == 1 else Rest(base)
 
+    def take(self, start: int, n: int) -> list:
+        parameters = (self.pulses, self.length, self.rotate, self.base)
+        if any(isinstance(parameter, Pattern) for parameter in parameters):
+            return super().take(start, n)
+        self.rhythm = rhythm = euclidian_rhythm(self.pulses, self.length, self.rotate)
+        base = self.base
+        return [
+            base if rhythm[iterator % len(rhythm)] == 1 else Rest(base)
+            for iterator in range(start, start + n)
+        ]
+
     def __len__(self):
         return self.length
 
@@ -104,6 +115,15 @@ class Pbin(Pattern):
         value = base if rhythm[index] == 1 else Rest(base)
         return value
 
+    def take(self, start: int, n: int) -> list:
+        if isinstance(self._number, Pattern) or isinstance(self._base, Pattern):
+            return super().take(start, n)
+        rhythm, base = self.binary_rhythm(self._number), self._base
+        return [
+            base if rhythm[iterator % len(rhythm)] == 1 else Rest(base)
+            for iterator in range(start, start + n)
+        ]
+
 
 class Pex(Pattern):
     """A pattern class that generates values based on hexadecimal values."""
@@ -172,6 +192,17 @@ class Pxo(Pattern):
         index = iterator % len(pattern)
         return self._parse_char(pattern[index], default_duration)
 
+    def take(self, start: int, n: int) -> list:
+        if isinstance(self._pattern, Pattern) or isinstance(self._default_duration, Pattern):
+            return super().take(start, n)
+        pattern, default_duration = self._pattern, self._default_duration
+        if not isinstance(pattern, str):
+            raise ValueError("Resolved pattern must be a string.")
+        return [
+            self._parse_char(pattern[iterator % len(pattern)], default_duration)
+            for iterator in range(start, start + n)
+        ]
+
 
 class Pgolomb(Pattern):
     def __init__(self, gen: int, multiplication: float, rotation: int):
@@ -198,3 +229,7 @@ class Pgolomb(Pattern):
 
     def __call__(self, iterator: int):
         return self._pattern[iterator % len(self._pattern)]
+
+    def take(self, start: int, n: int) -> list:
+        pattern = self._pattern
+        return [pattern[iterator % len(pattern)] for iterator in range(start, start + n)]
@@ -6,6 +6,10 @@ from ..Scales import SCALES
 from dataclasses import dataclass
 import logging
 from .SequenceTransformer import *
+from . import SequenceTransformer as transformers
+
+# Number of transformation results cached by condition outcomes
+TRANSFORMATION_CACHE_SIZE = 32
 
 
 class SequencePattern(Pattern):
@@ -25,31 +29,47 @@ class SequencePattern(Pattern):
         self._length = length
         self.sequence = sequence
         self._stack = []
+        self._invalidate_transformations()
 
     def mul(self, mult: int | float) -> Self:
         self._stack.append(
-            SequenceTransformation(condition=lambda: True, transformer=lambda target: mul(target))
+            SequenceTransformation(
+                condition=always,
+                transformer=lambda target: transformers.mul(target, mult),
+                deterministic=True,
+            )
         )
         return self
 
     def div(self, div: int | float) -> Self:
         self._stack.append(
-            SequenceTransformation(condition=lambda: True, transformer=lambda target: div(target))
+            SequenceTransformation(
+                condition=always,
+                transformer=lambda target: transformers.div(target, div),
+                deterministic=True,
+            )
         )
         return self
 
     def add(self, add: int | float) -> Self:
         self._stack.append(
-            SequenceTransformation(condition=lambda: True, transformer=lambda target: add(target))
+            SequenceTransformation(
+                condition=always,
+                transformer=lambda target: transformers.add(target, add),
+                deterministic=True,
+            )
         )
         return self
 
     def replace(self, new_seq: List[Any] | Any) -> Self:
         self._stack.append(
             SequenceTransformation(
-                condition=lambda: True, transformer=lambda target: replace(target, new_seq)
+                condition=always,
+                transformer=lambda target: replace(target, new_seq),
+                deterministic=True,
             )
         )
+        return self
 
     def every(self, n: int, method: Callable, *args, **kwargs) -> Self:
         """
@@ -70,6 +90,7 @@ class SequencePattern(Pattern):
             SequenceTransformation(
                 condition=lambda: int(self.env.clock.beat) % n == 0,
                 transformer=lambda target: method(target, *args, **kwargs),
+                deterministic=method in PURE_TRANSFORMERS,
             )
         )
 
@@ -94,6 +115,7 @@ class SequencePattern(Pattern):
             SequenceTransformation(
                 condition=lambda: int(self.env.clock.beat) % self.env._clock._denominator == beat,
                 transformer=lambda target: method(target, *args, **kwargs),
+                deterministic=method in PURE_TRANSFORMERS,
             )
         )
 
@@ -118,6 +140,7 @@ class SequencePattern(Pattern):
             SequenceTransformation(
                 condition=lambda: self.env.clock.bar % cycle == bar,
                 transformer=lambda target: method(target, *args, **kwargs),
+                deterministic=method in PURE_TRANSFORMERS,
             )
         )
 
@@ -147,6 +170,7 @@ class SequencePattern(Pattern):
             SequenceTransformation(
                 condition=lambda: _condition(),
                 transformer=lambda target: method(target, *args, **kwargs),
+                deterministic=method in PURE_TRANSFORMERS,
             )
         )
 
@@ -177,6 +201,7 @@ class SequencePattern(Pattern):
             SequenceTransformation(
                 condition=lambda: _condition(),
                 transformer=lambda target: method(target, *args, **kwargs),
+                deterministic=method in PURE_TRANSFORMERS,
             )
         )
         return self
@@ -200,6 +225,7 @@ class SequencePattern(Pattern):
             SequenceTransformation(
                 condition=condition,
                 transformer=lambda target: method(target, *args, **kwargs),
+                deterministic=method in PURE_TRANSFORMERS,
             )
         )
 
@@ -217,14 +243,15 @@ class SequencePattern(Pattern):
         """
         self._stack.append(
             SequenceTransformation(
-                condition=lambda: True,
+                condition=always,
                 transformer=lambda target: stack(target, sequence),
+                deterministic=True,
             )
         )
 
         return self
 
-    def shuffle(self, condition=lambda: True) -> Self:
+    def shuffle(self, condition: Callable = always) -> Self:
         """
         Shuffles the sequence of the target.
 
@@ -232,7 +259,7 @@ class SequencePattern(Pattern):
             condition: A callable that determines whether the shuffle should be applied.
                        If the condition returns True, the shuffle will be applied.
                        If the condition returns False, the shuffle will be skipped.
-                       Defaults to lambda: True.
+                       Defaults to always.
 
         Returns:
             self: The current instance of the SequencePattern object.
@@ -252,7 +279,7 @@ class SequencePattern(Pattern):
 
         return self
 
-    def reverse(self, condition=lambda: True) -> Self:
+    def reverse(self, condition: Callable = always) -> Self:
         """
         Reverses the sequence of the target.
 
@@ -260,7 +287,7 @@ class SequencePattern(Pattern):
             condition: A callable that determines whether the reverse should be applied.
                        If the condition returns True, the reverse will be applied.
                        If the condition returns False, the reverse will be skipped.
-                       Defaults to lambda: True.
+                       Defaults to always.
 
         Returns:
             self: The current instance of the SequencePattern object.
@@ -270,12 +297,13 @@ class SequencePattern(Pattern):
             SequenceTransformation(
                 condition=condition,
                 transformer=lambda target: target[::-1],
+                deterministic=True,
             )
         )
 
         return self
 
-    def mirror(self, condition: Callable = lambda: True) -> Self:
+    def mirror(self, condition: Callable = always) -> Self:
         """
         Mirrors the sequence of the target.
 
@@ -283,7 +311,7 @@ class SequencePattern(Pattern):
             condition: A callable that determines whether the mirror should be applied.
                        If the condition returns True, the mirror will be applied.
                        If the condition returns False, the mirror will be skipped.
-                       Defaults to lambda: True.
+                       Defaults to always.
 
         Returns:
             self: The current instance of the SequencePattern
@@ -293,12 +321,13 @@ class SequencePattern(Pattern):
             SequenceTransformation(
                 condition=condition,
                 transformer=lambda target: target + target[-2::-1],
+                deterministic=True,
             )
         )
 
         return self
 
-    def sort(self, reverse=False, condition=lambda: True) -> Self:
+    def sort(self, reverse=False, condition: Callable = always) -> Self:
         """
         Sorts the values of the current sequence.
 
@@ -307,7 +336,7 @@ class SequencePattern(Pattern):
             condition: A callable that determines whether the sort should be applied.
                        If the condition returns True, the sort will be applied.
                        If the condition returns False, the sort will be skipped.
-                       Defaults to lambda: True.
+                       Defaults to always.
 
         Returns:
             self: The current instance of the SequencePattern
@@ -317,12 +346,13 @@ class SequencePattern(Pattern):
             SequenceTransformation(
                 condition=condition,
                 transformer=lambda target: sorted(target, reverse=reverse),
+                deterministic=True,
             )
         )
 
         return self
 
-    def arp(self, seq, condition=lambda: True) -> Self:
+    def arp(self, seq, condition: Callable = always) -> Self:
         """
         Applies an arpeggiator to the values of the current sequence.
 
@@ -331,7 +361,7 @@ class SequencePattern(Pattern):
             condition: A callable that determines whether the arpeggiator should be applied.
                        If the condition returns True, the arpeggiator will be applied.
                        If the condition returns False, the arpeggiator will be skipped.
-                       Defaults to lambda: True.
+                       Defaults to always.
 
         Returns:
             self: The current instance of the SequencePattern
@@ -340,6 +370,7 @@ class SequencePattern(Pattern):
             SequenceTransformation(
                 condition=condition,
                 transformer=lambda target: arp(target, seq),
+                deterministic=True,
             )
         )
 
@@ -359,8 +390,9 @@ class SequencePattern(Pattern):
         """
         self._stack.append(
             SequenceTransformation(
-                condition=lambda: True,
+                condition=always,
                 transformer=lambda target: rotate(target, positions),
+                deterministic=True,
             )
         )
         return self
@@ -378,8 +410,9 @@ class SequencePattern(Pattern):
         """
         self._stack.append(
             SequenceTransformation(
-                condition=lambda: True,
+                condition=always,
                 transformer=lambda target: stretch(target, size),
+                deterministic=True,
             )
         )
         return self
@@ -393,8 +426,9 @@ class SequencePattern(Pattern):
         """
         self._stack.append(
             SequenceTransformation(
-                condition=lambda: True,
+                condition=always,
                 transformer=lambda target: filter_repeats(target),
+                deterministic=True,
             )
         )
         return self
@@ -412,7 +446,9 @@ class SequencePattern(Pattern):
         """
         self._stack.append(
             SequenceTransformation(
-                condition=lambda: True, transformer=lambda target: trim(target, size)
+                condition=always,
+                transformer=lambda target: trim(target, size),
+                deterministic=True,
             )
         )
         return self
@@ -430,8 +466,9 @@ class SequencePattern(Pattern):
         """
         self._stack.append(
             SequenceTransformation(
-                condition=lambda: True,
+                condition=always,
                 transformer=lambda target: ltrim(target, size),
+                deterministic=True,
             )
         )
         return self
@@ -457,8 +494,9 @@ class SequencePattern(Pattern):
         """
         self._stack.append(
             SequenceTransformation(
-                condition=lambda: True,
+                condition=always,
                 transformer=lambda target: repeat(target, n),
+                deterministic=True,
             )
         )
         return self
@@ -504,19 +542,71 @@ class SequencePattern(Pattern):
         else:
             return item
 
-    def __call__(self, iterator):
-        solved_pattern = list(self.sequence)
-        no_transformations = len(self._stack) == 0
-
-        if no_transformations:
-            return self._resolve_pattern(self._resolve_sequence(solved_pattern, iterator), iterator)
-
+    def _invalidate_transformations(self) -> None:
+        """Pre-apply the leading unconditional deterministic transformations of the stack
+        and reset the cache of transformation results."""
+        solved_pattern, applied = list(self.sequence), 0
         for pattern_transformation in self._stack:
-            if pattern_transformation.condition():
+            if not (
+                pattern_transformation.deterministic and pattern_transformation.condition is always
+            ):
+                break
+            solved_pattern = pattern_transformation.transformer(solved_pattern)
+            applied += 1
+        self._base_sequence = solved_pattern
+        self._pending = self._stack[applied:]
+        self._transformations_cache = {}
+        self._cached_sequence, self._cached_depth = self.sequence, len(self._stack)
+
+    def _transformed_sequence(self) -> list:
+        """Apply the transformations of the stack whose condition is currently met.
+
+        Deterministic transformations are cached for each vector of condition outcomes:
+        only the transformations following the first non-deterministic one (shuffle, user
+        methods) are applied again, on a copy. The returned list must not be modified."""
+        if self._cached_sequence is not self.sequence or self._cached_depth != len(self._stack):
+            self._invalidate_transformations()
+        pending = self._pending
+        outcomes = tuple(
+            pattern_transformation.condition is always or bool(pattern_transformation.condition())
+            for pattern_transformation in pending
+        )
+
+        cached = self._transformations_cache.get(outcomes)
+        if cached is None:
+            solved_pattern, stop = self._base_sequence, len(pending)
+            for index, pattern_transformation in enumerate(pending):
+                if not outcomes[index]:
+                    continue
+                if not pattern_transformation.deterministic:
+                    stop = index
+                    break
                 solved_pattern = pattern_transformation.transformer(solved_pattern)
+            if len(self._transformations_cache) >= TRANSFORMATION_CACHE_SIZE:
+                self._transformations_cache.pop(next(iter(self._transformations_cache)), None)
+            cached = self._transformations_cache[outcomes] = (solved_pattern, stop)
+
+        solved_pattern, stop = cached
+        if stop == len(pending):
+            return solved_pattern
+        solved_pattern = list(solved_pattern)
+        for index in range(stop, len(pending)):
+            if outcomes[index]:
+                solved_pattern = pending[index].transformer(solved_pattern)
+        return solved_pattern
 
+    def __call__(self, iterator):
+        solved_pattern = self._transformed_sequence()
         return self._resolve_pattern(self._resolve_sequence(solved_pattern, iterator), iterator)
 
+    def take(self, start: int, n: int) -> list:
+        """Return n consecutive values. Transformations are applied once for the batch."""
+        solved_pattern = self._transformed_sequence()
+        return [
+            self._resolve_pattern(self._resolve_sequence(solved_pattern, iterator), iterator)
+            for iterator in range(start, start + n)
+        ]
+
 
 class Pseq(SequencePattern):
     def __init__(self, *values, length: Optional[int] = None, **kwargs):
@@ -553,6 +643,15 @@ class Pnote(SequencePattern):
         self._local_root = self._root if self._root is not None else global_config.root
         self._scale = self._raw_scale if self._raw_scale is not None else global_config.scale
         value = SequencePattern.__call__(self, iterator)
+        return self._to_note(value, iterator)
+
+    def take(self, start: int, n: int) -> list:
+        self._local_root = self._root if self._root is not None else global_config.root
+        self._scale = self._raw_scale if self._raw_scale is not None else global_config.scale
+        values = SequencePattern.take(self, start, n)
+        return [self._to_note(value, iterator) for iterator, value in enumerate(values, start)]
+
+    def _to_note(self, value, iterator: int):
         return (
             self._calculate_note(value, self._scale, self._local_root, iterator)
             if isinstance(value, int | float)
@@ -3,12 +3,20 @@ from typing import List, Any, Callable
 import random
 
 
+def always() -> bool:
+    """Condition of the transformations that are applied unconditionally."""
+    return True
+
+
 @dataclass
 class SequenceTransformation:
-    """Transformations to apply to a sequence in a SequencePattern."""
+    """Transformations to apply to a sequence in a SequencePattern. Deterministic
+    transformations always return the same result for the same input, without
+    modifying it: their results can be cached."""
 
     condition: Callable
     transformer: Callable
+    deterministic: bool = False
 
     def __repr__(self):
         return f"Condition: {self.condition}, Transformer: {self.transformer}"
@@ -266,3 +274,26 @@ def ltrim(seq, size):
         list: The modified sequence object.
     """
     return seq[size:]
+
+
+# Transformations returning the same result for the same input, without modifying it
+PURE_TRANSFORMERS = frozenset(
+    {
+        replace,
+        add,
+        div,
+        mul,
+        arp,
+        stack,
+        repeat,
+        reverse,
+        mirror,
+        sort,
+        lace,
+        rotate,
+        stretch,
+        filter_repeats,
+        trim,
+        ltrim,
+    }
+)
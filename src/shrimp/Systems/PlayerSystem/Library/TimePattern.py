@@ -82,6 +82,10 @@ class Psine(TimePattern):
             max_val - min_val
         ) + min_val
 
+    def take(self, start: int, n: int) -> list:
+        # The value only depends on the clock, which does not move during the batch
+        return [self(start)] * n
+
 
 class Psaw(Pattern):
     """
@@ -46,6 +46,20 @@ class Pattern(ABC):
         """Generate the next value in the pattern sequence."""
         pass
 
+    def take(self, start: int, n: int) -> list:
+        """Return n consecutive values of the pattern, starting at iterator start.
+        Patterns that can compute a batch of values at once override this method."""
+        return [self(iterator) for iterator in range(start, start + n)]
+
+    @staticmethod
+    def _take(pattern: Any, start: int, n: int) -> list:
+        """Take n values of a pattern, a callable or a constant value."""
+        if isinstance(pattern, Pattern):
+            return pattern.take(start, n)
+        elif callable(pattern):
+            return [pattern(iterator) for iterator in range(start, start + n)]
+        return [pattern] * n
+
     def _resolve_pattern(self, pattern: Any, iterator: int) -> Any:
         if isinstance(pattern, Pattern):
             return pattern(iterator)
@@ -76,7 +90,7 @@ class Pattern(ABC):
             None
         """
         # Generate the data
-        table_data = [(i, self(i)) for i in range(num_iterations)]
+        table_data = list(enumerate(self.take(0, num_iterations)))
 
         # Find the maximum width for each cell
         cell_width = max(max(len(str(i)), len(str(v))) for i, v in table_data) + (
@@ -227,6 +241,11 @@ class ArithmeticPattern(Pattern):
         )
         return operation_result
 
+    def take(self, start: int, n: int) -> list:
+        values1 = self._take(self.pattern1, start, n)
+        values2 = self._take(self.pattern2, start, n)
+        return [self.operation(value1, value2) for value1, value2 in zip(values1, values2)]
+
     def __len__(self) -> int:
         return len(self.pattern1)
 
@@ -381,6 +400,9 @@ class ConstantPattern(Pattern):
     def __call__(self, iterator: int) -> Any:
         return self.value
 
+    def take(self, start: int, n: int) -> list:
+        return [self.value] * n
+
 
 class IntegerPattern(Pattern):
     """A pattern that wraps another pattern and always returns integer values."""
@@ -393,6 +415,9 @@ class IntegerPattern(Pattern):
         result = self.source_pattern(iterator)
         return int(round(result))
 
+    def take(self, start: int, n: int) -> list:
+        return [int(round(result)) for result in self.source_pattern.take(start, n)]
+
     def __len__(self) -> int:
         return len(self.source_pattern)
 
@@ -1,21 +1,116 @@
 from ...environment import Subscriber
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TypeVar, Callable, ParamSpec, Optional, Dict, Self, Any, List
 from ...Time.Clock import Clock, TimePos
-from types import LambdaType, GeneratorType
-from inspect import isgeneratorfunction
+from types import LambdaType
 from .Pattern import Pattern
 from .Rest import Rest
-from .Library.TimePattern import TimePattern
 from dataclasses import dataclass
 import traceback
-from inspect import isgeneratorfunction, isgenerator
-from collections.abc import Iterable
+from inspect import isgenerator
+from collections.abc import Iterator
+from collections import deque
+import threading
 import logging
 
 P = ParamSpec("P")
 T = TypeVar("T")
 
+# Values that never need to be resolved any further
+_SCALARS = frozenset({int, float, bool, str, bytes, Rest, type(None)})
+
+
+def _compile_arg(value: Any) -> tuple[bool, Any]:
+    """Classify a positional argument once. Returns (True, value) for constants, and
+    (False, resolver) otherwise, the resolver being called with the pattern index."""
+    if isinstance(value, Pattern):
+        return False, value
+    elif isinstance(value, (list, tuple, str, bytes)):
+        return True, value
+    elif isgenerator(value) or isinstance(value, Iterator):
+        return False, lambda _: next(value)
+    elif callable(value):
+        return False, lambda _: value()
+    return True, value
+
+
+def _compile_kwarg(value: Any) -> tuple[bool, Any]:
+    """Classify a keyword argument value once. Returns (True, value) for constants, and
+    (False, resolver) otherwise, the resolver being called with the pattern index. Values
+    produced by patterns, generators and callables are resolved recursively."""
+    if isinstance(value, Pattern):
+        return False, lambda i: _resolve_kwarg(value(i), i)
+    elif isinstance(value, (list, tuple)):
+        items = [_compile_kwarg(item) for item in value]
+        if all(constant for constant, _ in items):
+            return True, [item for _, item in items]
+        return False, lambda i: [item if constant else item(i) for constant, item in items]
+    elif isinstance(value, dict):
+        items = {key: _compile_kwarg(item) for key, item in value.items()}
+        if all(constant for constant, _ in items.values()):
+            return True, {key: item for key, (_, item) in items.items()}
+        return False, lambda i: {
+            key: item if constant else item(i) for key, (constant, item) in items.items()
+        }
+    elif isinstance(value, (str, bytes)):
+        return True, value
+    elif isgenerator(value) or isinstance(value, Iterator):
+        return False, lambda i: _resolve_kwarg(next(value), i)
+    elif callable(value):
+
+        def _call(i: int) -> Any:
+            try:
+                return _resolve_kwarg(value(), i)
+            except TypeError:
+                return _resolve_kwarg(value(i), i)
+
+        return False, _call
+    return True, value
+
+
+def _resolve_kwarg(value: Any, i: int) -> Any:
+    """Resolve a value produced while playing (by a pattern, a callable, ...)."""
+    if type(value) in _SCALARS:
+        return value
+    constant, resolver = _compile_kwarg(value)
+    return resolver if constant else resolver(i)
+
+
+@dataclass
+class SenderPlan:
+    """
+    Resolver plan of a Sender. Arguments are classified once (constant, pattern, callable,
+    generator) so that resolving them on each iteration does not need any type check.
+    """
+
+    args: tuple[tuple[bool, Any], ...]
+    kwargs: tuple[tuple[str, bool, Any], ...]
+    period: Any
+    constant_period: bool
+    nudge: Any
+    swing: Any
+    limit: Optional[int]
+
+    def resolve(self, i: int) -> tuple[tuple, dict[str, Any]]:
+        """Resolve args and kwargs for a given pattern index."""
+        args = tuple(value if constant else value(i) for constant, value in self.args)
+        kwargs = {key: value if constant else value(i) for key, constant, value in self.kwargs}
+        return args, kwargs
+
+
+@dataclass
+class LookaheadEvent:
+    """An event computed ahead of time by a Player in lookahead mode."""
+
+    time: int | float
+    nudge: int | float
+    pattern: "Sender"
+    args: tuple
+    kwargs: dict[str, Any]
+    silence: bool
+    iterator: int
+    state: tuple  # player state before this event, restored when the future is invalidated
+
 
 @dataclass
 class Sender:
@@ -29,6 +124,22 @@ class Sender:
     manual_polyphony: bool = False
     iterations: int = 0
     limit: Optional[int] = None
+    plan: Optional[SenderPlan] = field(default=None, repr=False, compare=False)
+
+    def compile(self) -> SenderPlan:
+        """Compile (once) the resolver plan of this sender."""
+        if self.plan is None:
+            period = self.kwargs.get("period", 1)
+            self.plan = SenderPlan(
+                args=tuple(_compile_arg(arg) for arg in self.args),
+                kwargs=tuple((key, *_compile_kwarg(value)) for key, value in self.kwargs.items()),
+                period=period,
+                constant_period=not isinstance(period, Callable | LambdaType | Pattern),
+                nudge=self.kwargs.get("nudge", 0),
+                swing=self.kwargs.get("swing", 0),
+                limit=self.kwargs.get("limit", None),
+            )
+        return self.plan
 
 
 class Player(Subscriber):
@@ -48,6 +159,15 @@ class Player(Subscriber):
         self._until: Optional[int] = None
         self._active: bool = True
 
+        # Lookahead mode: events computed ahead of time (see the lookahead property)
+        self._lookahead: int = 0
+        self._lookahead_active: bool = False
+        # Queue size of the running player: changes of lookahead apply on the next start
+        self._lookahead_size: int = 0
+        self._lookahead_base: tuple[int | float, bool] = (0, True)
+        self._queue: deque[LookaheadEvent] = deque()
+        self._lookahead_lock = threading.RLock()
+
         # Registering handlers
         self.register_handler("all_notes_off", self.stop)
         self.register_handler("children_reset", lambda _: self._react_to_play_event())
@@ -66,6 +186,19 @@ class Player(Subscriber):
         """Return the active state of the player."""
         return self._active
 
+    @property
+    def lookahead(self) -> int:
+        """Number of events computed ahead of time, 0 if lookahead is disabled."""
+        return self._lookahead
+
+    @lookahead.setter
+    def lookahead(self, value: int):
+        """Set the number of events computed ahead of time. In lookahead mode, the player
+        resolves its next events (arguments and absolute beat times) in batches and plays
+        them from a single clock event. Patterns are resolved when events are computed,
+        not when they are played. Takes effect the next time the player is started."""
+        self._lookahead = max(0, int(value))
+
     @property
     def current_pattern(self):
         """Return the current pattern."""
@@ -118,73 +251,14 @@ class Player(Subscriber):
     def _react_to_play_event(self, *args, **kwargs):
         """React to the play event. This method is called when the "play" event is triggered."""
         # Reset the iterator and iterations on sender
-        if self.pattern is not None:
-            self.pattern.iterations = 0
-        self.iterator = -1
-        self._silence_count = 0
-
-    # Argument and keyword argument resolvers
-
-    def _args_resolver(self, args: tuple[Any]) -> tuple[Any]:
-        """Resolve pattern arguments. Each pattern is submitted along with *args and **kwargs.
-        These arguments can be of many different types, including Patterns, Callables, and plain
-        values. This method resolves the arguments recursively in order to feed a valid argument
-        to the PlayerPattern send_method.
-
-        Args:
-            args (tuple): The arguments
-
-        Returns:
-            tuple: The resolved arguments
-        """
-        new_args = ()
-
-        for arg in args:
-            if isinstance(arg, Pattern):
-                new_args += (arg(self.iterator - self._silence_count),)
-            elif isinstance(arg, Callable | LambdaType):
-                new_args += (arg(),)
-            elif isinstance(arg, TimePattern):
-                new_args += (arg(self._clock.now),)
-            elif isinstance(arg, (list, tuple)):
-                new_args += (arg,)
-            elif self.__is_generator_or_iterable(arg):
-                new_args += (next(arg),)
-
-        return new_args  # type: ignore
-
-    def _kwargs_resolver(self, kwargs: dict[str, Any]) -> dict[str, Any]:
-        """Resolve pattern keyword arguments. This method is recursive and can handle nested patterns.
-        Each pattern is submitted along with *args and **kwargs. These arguments can be of many different
-        types, including Patterns, Callables, and plain values. This method resolves the keyword arguments
-        recursively to ensure all values are fully resolved.
-
-        Args:
-            kwargs (dict): The keyword arguments of the pattern.
-
-        Returns:
-            dict: The fully resolved keyword arguments
-        """
-
-        def resolve_value(value: Any) -> Any:
-            """Resolve a value recursively."""
-            if isinstance(value, Pattern):
-                return resolve_value(value(self.iterator - self._silence_count))
-            elif isinstance(value, (list, tuple)):
-                return [resolve_value(item) for item in value]
-            elif isinstance(value, dict):
-                return {k: resolve_value(v) for k, v in value.items()}
-            elif self.__is_generator_or_iterable(value):
-                return resolve_value(next(value))
-            elif isinstance(value, Callable | LambdaType):
-                try:
-                    return resolve_value(value())
-                except TypeError:
-                    return resolve_value(value(self.iterator - self._silence_count))
-            else:
-                return value
-
-        return {key: resolve_value(value) for key, value in kwargs.items()}
+        with self._lookahead_lock:
+            if self.pattern is not None:
+                self.pattern.iterations = 0
+            self.iterator = -1
+            self._silence_count = 0
+            # The clock restarts its children at beat 0
+            self._queue.clear()
+            self._lookahead_base = (0, True)
 
     def stop(self, _: dict = {}):
         """Method to stop a player.
@@ -204,6 +278,8 @@ class Player(Subscriber):
         self._current_pattern_index = 0
         self._iterator = -1
         self._silence_count = 0
+        self._queue.clear()
+        self._lookahead_active = False
 
     def play(self) -> None:
         """Play the current pattern."""
@@ -238,6 +314,8 @@ class Player(Subscriber):
             begin = patterns.kwargs.get("begin", False)
 
         is_an_update = self._patterns is not None
+        for sender in patterns if isinstance(patterns, list) else [patterns]:
+            sender.compile()
 
         def _callback(reset_iterator: bool = False):
             if quant:
@@ -253,12 +331,46 @@ class Player(Subscriber):
                 self._patterns = [patterns] if isinstance(patterns, Sender) else patterns
                 self.current_pattern.iterations = current_pattern_iteration
 
-        if self._name in self._clock._events:
+        if self._name in self._clock._events and self._lookahead_active:
+            with self._lookahead_lock:
+                # Live edit: recompute the events that have not been played yet
+                self._rewind_lookahead()
+                if quant:
+                    time_reference = int(self._clock.now) + quant
+                    if self._queue:
+                        self._queue[0].time = time_reference
+                    self._lookahead_base = (time_reference, not self._queue)
+                    _callback(reset_iterator=True)
+                else:
+                    _callback()
+                self._fill_lookahead()
+                self._sync_lookahead()
+        elif self._name in self._clock._events:
             if quant:
                 self._clock._events[self._name].next_time = int(self._clock.now) + quant
                 _callback(reset_iterator=True)
             else:
                 _callback()
+        elif self._lookahead:
+            logging.info(f"(Player) {self._name} starting at {round(self._clock.beat, 2)}.")
+            self._patterns = [patterns] if isinstance(patterns, Sender) else patterns
+            time_reference = int(self._clock.next_bar) if begin is False else begin
+            with self._lookahead_lock:
+                self._queue.clear()
+                self._lookahead_active = True
+                self._lookahead_size = self._lookahead
+                self._lookahead_base = (time_reference, True)
+                self._fill_lookahead()
+                first = self._queue[0]
+                self._clock.add(
+                    name=self._name,
+                    func=self._play_lookahead,
+                    time_reference=first.time,
+                    time=0,
+                    nudge=first.nudge,
+                    once=False,
+                    passthrough=False,
+                )
         else:
             logging.info(f"(Player) {self._name} starting at {round(self._clock.beat, 2)}.")
             self._patterns = [patterns] if isinstance(patterns, Sender) else patterns
@@ -301,8 +413,7 @@ class Player(Subscriber):
         Returns:
             None
         """
-        args = self._args_resolver(pattern.args)
-        kwargs = self._kwargs_resolver(pattern.kwargs)
+        args, kwargs = pattern.compile().resolve(self.iterator - self._silence_count)
         self._speed = kwargs.get("speed", 1)
         end = kwargs.get("end", False)
         if end:
@@ -357,17 +468,16 @@ class Player(Subscriber):
         Returns:
             None
         """
+        plan = self.current_pattern.compile()
+
         # These are kwargs link to time that we should handle and process manually!
-        kwargs = {
-            "period": lambda: self.current_pattern.kwargs.get("period", 1),
-            "nudge": self.current_pattern.kwargs.get("nudge", 0),
-            "swing": self.current_pattern.kwargs.get("swing", 0),
-        }
+        kwargs = {"period": plan.period, "nudge": plan.nudge, "swing": plan.swing}
 
-        self._resolve_period(kwargs)
+        if not plan.constant_period:
+            self._resolve_period(kwargs)
         schedule_silence = self._process_silence(kwargs)
         self._handle_swing(schedule_silence, kwargs)
-        self.current_pattern.limit = self.current_pattern.kwargs.get("limit", None)
+        self.current_pattern.limit = plan.limit
         kwargs["time"] = kwargs["period"] * self._speed
 
         self._iterator, self.current_pattern.iterations = (
@@ -443,6 +553,138 @@ class Player(Subscriber):
         # Adding the next pattern start immediately after the current one
         self._push(True)
 
+    # Lookahead mode
+
+    def _fill_lookahead(self) -> None:
+        """Compute events ahead of time until the lookahead queue is full. This mirrors
+        what _push and _func do for a single event, without scheduling anything."""
+        deadline, first_time = self._lookahead_base
+        while self._patterns and len(self._queue) < self._lookahead_size:
+            pattern = self.current_pattern
+            plan = pattern.compile()
+            state = (
+                deadline,
+                first_time,
+                self._iterator,
+                self._silence_count,
+                self._current_pattern_index,
+                pattern.iterations,
+                self._speed,
+            )
+
+            kwargs = {"period": plan.period, "nudge": plan.nudge, "swing": plan.swing}
+            if not plan.constant_period:
+                self._resolve_period(kwargs)
+            silence = self._process_silence(kwargs)
+            self._handle_swing(silence, kwargs)
+            pattern.limit = plan.limit
+            self._iterator, pattern.iterations = self._iterator + 1, pattern.iterations + 1
+
+            period = kwargs["period"]
+            period = period.duration if isinstance(period, Rest) else period
+            time = (deadline - period if first_time else deadline) + period * self._speed
+
+            args, resolved = (), {}
+            if not silence:
+                args, resolved = plan.resolve(self._iterator - self._silence_count)
+                self._speed = resolved.get("speed", 1)
+
+            self._queue.append(
+                LookaheadEvent(
+                    time=time,
+                    nudge=kwargs["nudge"],
+                    pattern=pattern,
+                    args=args,
+                    kwargs=resolved,
+                    silence=silence,
+                    iterator=self._iterator,
+                    state=state,
+                )
+            )
+            deadline, first_time = time, False
+
+            if not silence and pattern.limit is not None and pattern.iterations >= pattern.limit:
+                self._current_pattern_index = (self._current_pattern_index + 1) % len(
+                    self._patterns
+                )
+                self.current_pattern.iterations = 0
+                self._iterator, self._silence_count = -1, 0
+                first_time = True
+
+        self._lookahead_base = (deadline, first_time)
+
+    def _rewind_lookahead(self) -> None:
+        """Drop the events computed ahead of time and restore the player state that
+        preceded them. Like the pending event of the regular mode, the next event is kept:
+        it is already scheduled on the clock."""
+        if len(self._queue) < 2:
+            return
+        (
+            deadline,
+            first_time,
+            self._iterator,
+            self._silence_count,
+            self._current_pattern_index,
+            iterations,
+            self._speed,
+        ) = self._queue[1].state
+        if self._patterns:
+            self.current_pattern.iterations = iterations
+        head = self._queue.popleft()
+        self._queue.clear()
+        self._queue.append(head)
+        self._lookahead_base = (deadline, first_time)
+
+    def _sync_lookahead(self) -> None:
+        """Point the clock event of the player to the next event of the queue."""
+        event = self._clock._events.get(self._name)
+        if event is None or not self._queue:
+            return
+        head = self._queue[0]
+        event.next_time, event.nudge, event.has_played = head.time, head.nudge, False
+
+    def _play_lookahead(self) -> None:
+        """Clock callback of the lookahead mode: play the due events of the queue, refill
+        it when half of it has been played and reschedule the clock event."""
+        with self._lookahead_lock:
+            if not self._queue:
+                self._fill_lookahead()
+            now = self._clock.beat
+            while self._queue and self._queue[0].time + self._queue[0].nudge <= now:
+                if not self._play_event(self._queue.popleft()):
+                    return
+            if len(self._queue) <= self._lookahead_size // 2:
+                self._fill_lookahead()
+            self._sync_lookahead()
+
+    def _play_event(self, event: LookaheadEvent) -> bool:
+        """Play an event computed ahead of time. Returns False if the player stopped."""
+        if event.silence:
+            return True
+
+        end = event.kwargs.get("end", False)
+        if end and self._clock.now >= end:
+            logging.info(f"End time reached for {self._name}.")
+            self.stop()
+            return False
+
+        until = event.pattern.kwargs.get("until", None)
+        if until is not None and event.iterator >= until:
+            self.stop()
+            return False
+
+        self.active = event.kwargs.get("active", True)
+        try:
+            if self._active:
+                if event.pattern.manual_polyphony:
+                    self._handle_manual_polyphony(event.pattern, event.args, event.kwargs)
+                else:
+                    event.pattern.send_method(*event.args, **event.kwargs)
+        except Exception as e:
+            print(f"Error with {event.pattern.send_method}: {e}, {event.args}, {event.kwargs}")
+            traceback.print_exc()
+        return True
+
     def _handle_manual_polyphony(self, pattern: Sender, args: tuple, kwargs: dict) -> None:
         """Internal function to handle polyphony manually. This method is required for scheduling
         synthesizers written with SignalFlow (Synths/ folder). In other cases, polyphony is natively
@@ -521,14 +763,3 @@ class Player(Subscriber):
             args=args,
             kwargs=kwargs,
         )
-
-    @staticmethod
-    def __is_generator_or_iterable(arg: Any) -> bool:
-        """Check if the argument is a generator or an iterable."""
-        tests = [
-            isgeneratorfunction(arg),
-            isgenerator(arg),
-            isinstance(arg, GeneratorType),
-            isinstance(arg, Iterable),
-        ]
-        return any(tests)
@@ -43,12 +43,16 @@ class Clock(Subscriber):
         self._carousel_clock_callback: Optional[Callable] = lambda a, b, c, d: 0.1
         self._stop_event: threading.Event = threading.Event()
         self._events: Dict[str, PriorityEvent] = {}
-        self._playing: bool = True
         self._link = link.Link(tempo)
         self._link_epoch = self._link.clock().micros()
         self.env: Optional[Environment] = None
         self._link.enabled = True
         self._link.startStopSyncEnabled = True
+        # Transport state machine: play/pause are only dispatched on transitions
+        self._playing: bool = self._link.captureSessionState().isPlaying()
+        self._transport_debounce: float = 0.01
+        self._transport_change_since: Optional[float] = None
+        self._transitions: Dict[str, int] = {"play": 0, "pause": 0}
         self._internal_time = 0.0
         self._beat, self._bar, self._phase = 0, 0, 0
         self._nominator, self._denominator = 4, 4
@@ -72,6 +76,27 @@ class Clock(Subscriber):
         """Enable or disable the sync of the clock"""
         self._link.startStopSyncEnabled = value
 
+    @property
+    def transport_debounce(self) -> float:
+        """Time (in seconds) a start/stop change coming from the Link session must last
+        before the clock follows it"""
+        return self._transport_debounce
+
+    @transport_debounce.setter
+    def transport_debounce(self, value: float):
+        """Set the transport debounce time in seconds"""
+        self._transport_debounce = value
+
+    @property
+    def transitions(self) -> Dict[str, int]:
+        """Return the number of play and pause transitions since the clock was created"""
+        return dict(self._transitions)
+
+    @property
+    def link(self):
+        """Return the Link instance of the clock, holding the shared session timeline"""
+        return self._link
+
     @property
     def peers(self) -> int:
         """Return the peers of the clock"""
@@ -207,11 +232,12 @@ class Clock(Subscriber):
             self._carousel_thread.start()
 
     def _reset_children_times(self) -> None:
-        self.env.dispatch(self, "children_reset", {})
+        if self.env:
+            self.env.dispatch(self, "children_reset", {})
         for child in self._events.values():
             child.next_time = 0
 
-    def play(self) -> None:
+    def play(self, _: dict = {}) -> None:
         """Play the clock: start the clock and update the session state to request play.
         This method cannot be called if the clock is already playing. This method will
         reset the children times and request a beat at time 0. This method will also dispatch
@@ -222,9 +248,9 @@ class Clock(Subscriber):
         session.requestBeatAtTime(0, self._link.clock().micros(), self._denominator)
         session.setIsPlaying(True, self._link.clock().micros())
         self._link.commitSessionState(session)
-        self._reset_children_times()
+        self._set_transport(True)
 
-    def pause(self) -> None:
+    def pause(self, _: dict = {}) -> None:
         """Pause mechanism: pause the clock and update the session state to request pause.
         This method cannot be called if the clock is already paused.
 
@@ -238,9 +264,31 @@ class Clock(Subscriber):
         session = self._link.captureSessionState()
         session.setIsPlaying(False, self._link.clock().micros())
         self._link.commitSessionState(session)
-        if self.env:
+        self._set_transport(False)
+
+    def _set_transport(self, playing: bool) -> None:
+        """Transport state transition. This is the only place where play (children_reset)
+        and pause messages are dispatched, once per transition."""
+        self._playing = playing
+        self._transport_change_since = None
+        self._transitions["play" if playing else "pause"] += 1
+        if playing:
+            self._reset_children_times()
+        elif self.env:
             self.env.dispatch(self, "pause", {})
 
+    def _follow_transport(self, playing: bool) -> None:
+        """Follow the start/stop state of the Link session. Changes are debounced: they
+        are only applied once they have lasted for self.transport_debounce seconds."""
+        if playing == self._playing:
+            self._transport_change_since = None
+            return
+        now = time_module.perf_counter()
+        if self._transport_change_since is None:
+            self._transport_change_since = now
+        if now - self._transport_change_since >= self._transport_debounce:
+            self._set_transport(playing)
+
     def precise_wait(self, duration) -> None:
         """
         Wait for a specified duration using a combination of sleep and busy-waiting.
@@ -266,6 +314,8 @@ class Clock(Subscriber):
         self._stop_event.set()
         if self.env:
             self.env.dispatch(self, "stop", {})
+            # Let subscribers close their ports if they are stopped asynchronously
+            self.env.drain()
         self._clock_thread.join()
 
     def _update_time(self):
@@ -277,15 +327,13 @@ class Clock(Subscriber):
         """
         link_state = self._link.captureSessionState()
         self.internal_time = self._link.clock().micros()
-        self._playing = link_state.isPlaying()
         self._beat, self._phase, self._tempo = (
             link_state.beatAtTime(self.internal_time, self._denominator),
             link_state.phaseAtTime(self.internal_time, self._denominator),
             link_state.tempo(),
         )
         self._bar = self._beat // self._denominator
-        if not self._playing:
-            self.pause()
+        self._follow_transport(link_state.isPlaying())
 
     def _run_carousel(self):
 
@@ -1,5 +1,3 @@
-from shrimp import *
-from ptpython.repl import embed
 from shrimp.configuration import read_configuration, get_ptpython_history_file
 import logging
 
@@ -16,6 +14,10 @@ def exit():
 
 
 if __name__ == "__main__":
+    # Not at the top of the module: processes spawned by the render backend import this
+    # module too, and must not start a session
+    from shrimp import *
+
     match CONFIGURATION["editor"]["default_shell"]:
         case "ptpython":
             logging.info("Entering ptpython shell.")
@@ -3,7 +3,6 @@ import json
 import os
 import appdirs
 import pathlib
-import mido
 import sys
 
 APPNAME = "Shrimp"
@@ -24,20 +23,24 @@ def _ensure_log_file_exists():
         print(f"An error occurred while ensuring the log file exists: {e}")
 
 
-_ensure_log_file_exists()
-
-logging.basicConfig(
-    level=logging.DEBUG,
-    format="%(asctime)s  [%(levelname)s] %(message)s",
-    datefmt="%H:%M:%S",
-    filename=os.path.join(USER_DIRECTORY, "shrimp.log"),
-    filemode="w",
-)
+def setup_logging() -> None:
+    """Log to the log file of the user directory. The log file is truncated: it only holds
+    the logs of the current session."""
+    _ensure_log_file_exists()
+    logging.basicConfig(
+        level=logging.DEBUG,
+        format="%(asctime)s  [%(levelname)s] %(message)s",
+        datefmt="%H:%M:%S",
+        filename=LOG_FILE,
+        filemode="w",
+    )
 
 
 def _find_default_output_midi_port() -> str:
     """Find the default MIDI port to use by default when config is created."""
     if sys.platform in "win32":
+        import mido
+
         port_list = mido.get_output_names()
         if port_list:
             return port_list[0]
@@ -50,6 +53,8 @@ def _find_default_output_midi_port() -> str:
 def _find_default_input_midi_port() -> str:
     """Find the default MIDI port to use by default when config is created."""
     if sys.platform in "win32":
+        import mido
+
         port_list = mido.get_input_names()
         if port_list:
             return port_list[0]
@@ -82,6 +87,7 @@ def _create_default_configuration() -> dict:
             "default_tempo": 135,
             "time_grain": 0.01,
             "delay": 0,
+            "async_dispatch": False,
         },
         "midi": {
             "out_ports": [
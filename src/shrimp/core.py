@@ -0,0 +1,46 @@
+"""
+Headless entry point of Shrimp.
+
+Exposes the pattern engines, the scheduler and the I/O classes without any import-time
+side effect: no configuration is read, no clock or thread is started, no port is opened
+and no display is needed. Everything starts on request, which makes this module suitable
+for worker processes and benchmark harnesses:
+
+    from shrimp.core import get_global_environment, Clock, Player
+
+    env = get_global_environment()
+    clock = Clock(tempo=120)
+    env.add_clock(clock)
+    clock._start()
+"""
+
+from .environment import Environment, Subscriber, get_global_environment
+from .configuration import read_configuration
+from .Time.Clock import Clock
+from .IO.midi import MIDIOut, MIDIIn, list_midi_ports
+from .IO.osc import OSC
+from .Systems.PlayerSystem.PatternPlayer import Player, Sender
+from .Systems.PlayerSystem.Pattern import Pattern as PlayerPattern
+from .Systems.PlayerSystem.Rest import Rest
+from .Systems.Carousel.Pattern import Pattern
+from .Systems.Carousel.CarouselManager import CarouselPatternManager
+from .Systems.Carousel import start_carousel
+
+__all__ = [
+    "Environment",
+    "Subscriber",
+    "get_global_environment",
+    "read_configuration",
+    "Clock",
+    "MIDIOut",
+    "MIDIIn",
+    "list_midi_ports",
+    "OSC",
+    "Player",
+    "Sender",
+    "PlayerPattern",
+    "Rest",
+    "Pattern",
+    "CarouselPatternManager",
+    "start_carousel",
+]
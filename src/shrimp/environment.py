@@ -1,8 +1,54 @@
-from typing import Optional, TYPE_CHECKING
+from typing import Optional, Callable, Dict, Iterable, Tuple, TYPE_CHECKING
+import threading
+import logging
+import queue
 
 if TYPE_CHECKING:
     from .Time.Clock import Clock
 
+# Messages that do not need to be handled in the thread that dispatched them.
+# children_reset is not one of them: players reschedule themselves on the clock thread
+# from the time references it resets.
+ASYNC_MESSAGES = frozenset({"pause", "stop", "all_notes_off"})
+
+
+class _DispatchWorker:
+    """Worker thread running message handlers in the order they were submitted"""
+
+    def __init__(self):
+        self._queue: queue.Queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(self, message_type: str, callback: Callable, data: dict) -> None:
+        """Queue a handler call"""
+        self._queue.put((message_type, callback, data))
+
+    def drain(self) -> None:
+        """Wait until every queued handler has been called"""
+        if threading.current_thread() is not self._thread:
+            self._queue.join()
+
+    def stop(self) -> None:
+        """Call the remaining handlers and stop the worker thread"""
+        self._queue.put(None)
+        if threading.current_thread() is not self._thread:
+            self._thread.join()
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                message_type, callback, data = item
+                try:
+                    callback(data)
+                except Exception as e:
+                    logging.error(f"Error in {message_type} handler: {e}")
+            finally:
+                self._queue.task_done()
+
 
 class Environment:
     """The Environment class is a global object that holds all the components of the system."""
@@ -10,6 +56,12 @@ class Environment:
     def __init__(self):
         self._subscribers = []
         self._clock: Optional["Clock"] = None
+        # Index from message type to (subscriber, handler) pairs. Entries are tuples that
+        # are replaced, never mutated, so dispatch can iterate them without locking.
+        self._handlers: Dict[str, Tuple[Tuple["Subscriber", Callable], ...]] = {}
+        self._lock = threading.Lock()
+        self._async_messages: frozenset = frozenset()
+        self._workers: list[_DispatchWorker] = []
 
     @property
     def clock(self):
@@ -38,21 +90,102 @@ class Environment:
             subscriber: The component to subscribe to the global environment
 
         """
-        self._subscribers.append(subscriber)
-        subscriber.env = self
+        with self._lock:
+            if subscriber in self._subscribers:
+                return
+            self._subscribers.append(subscriber)
+            subscriber.env = self
+            for message_type, callback in subscriber.message_handlers.items():
+                self._index_handler(subscriber, message_type, callback)
+
+    def unsubscribe(self, subscriber: "Subscriber") -> None:
+        """Unsubscribe a component from the global environment. It will not receive
+        messages anymore.
+
+        Args:
+            subscriber: The component to unsubscribe from the global environment
+        """
+        with self._lock:
+            if subscriber not in self._subscribers:
+                return
+            self._subscribers.remove(subscriber)
+            for message_type in subscriber.message_handlers:
+                self._unindex_handler(subscriber, message_type)
+
+    def _on_register_handler(self, subscriber: "Subscriber", message_type: str, callback):
+        """Keep the index up to date when a subscriber registers a handler"""
+        with self._lock:
+            if subscriber in self._subscribers:
+                self._index_handler(subscriber, message_type, callback)
+
+    def _index_handler(self, subscriber: "Subscriber", message_type: str, callback) -> None:
+        """Add or replace the handler of a subscriber for a message type"""
+        entries = list(self._handlers.get(message_type, ()))
+        for i, (other, _) in enumerate(entries):
+            if other is subscriber:
+                entries[i] = (subscriber, callback)
+                break
+        else:
+            entries.append((subscriber, callback))
+        self._handlers[message_type] = tuple(entries)
+
+    def _unindex_handler(self, subscriber: "Subscriber", message_type: str) -> None:
+        """Remove the handler of a subscriber for a message type"""
+        entries = tuple(e for e in self._handlers.get(message_type, ()) if e[0] is not subscriber)
+        if entries:
+            self._handlers[message_type] = entries
+        else:
+            self._handlers.pop(message_type, None)
+
+    def enable_async_dispatch(
+        self, message_types: Iterable[str] = ASYNC_MESSAGES, workers: int = 1
+    ) -> None:
+        """Handle some message types in worker threads instead of the dispatching thread.
+        Dispatching them (e.g. pausing from the clock thread) will never block on I/O.
+
+        Handlers of a given subscriber always run on the same worker, so a subscriber
+        receives asynchronous messages in the order they were dispatched.
+
+        Args:
+            message_types: The message types to dispatch asynchronously
+            workers: The number of worker threads
+        """
+        self.disable_async_dispatch()
+        self._workers = [_DispatchWorker() for _ in range(max(1, workers))]
+        self._async_messages = frozenset(message_types)
+
+    def disable_async_dispatch(self) -> None:
+        """Handle all messages synchronously again, after handling the queued ones"""
+        self._async_messages = frozenset()
+        workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.stop()
+
+    def drain(self) -> None:
+        """Wait until all asynchronous messages dispatched so far have been handled"""
+        for worker in self._workers:
+            worker.drain()
 
     def dispatch(self, sender, message_type: str, data: dict) -> None:
         """
-        Dispatch a message to all subscribers
+        Dispatch a message to all subscribers handling this message type
 
         Args:
             sender: The sender of the message
             message_type: The type of message
             data: The data of the
         """
-        for subscriber in self._subscribers:
-            if subscriber != sender and message_type in subscriber.message_handlers:
-                subscriber.message_handlers[message_type](data)
+        workers = self._workers
+        if message_type in self._async_messages and workers:
+            for subscriber, callback in self._handlers.get(message_type, ()):
+                if subscriber is not sender:
+                    worker = workers[(id(subscriber) >> 4) % len(workers)]
+                    worker.submit(message_type, callback, data)
+            return
+
+        for subscriber, callback in self._handlers.get(message_type, ()):
+            if subscriber is not sender:
+                callback(data)
 
 
 class Subscriber:
@@ -64,6 +197,9 @@ class Subscriber:
     def register_handler(self, message_type: str, callback):
         """Register a message handler"""
         self.message_handlers[message_type] = callback
+        env = getattr(self, "env", None)
+        if env is not None:
+            env._on_register_handler(self, message_type, callback)
 
 
 environment = Environment()
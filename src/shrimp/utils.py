@@ -1,11 +1,11 @@
-from importlib.metadata import version
-from rich.panel import Panel
 from rich import print
 from typing import Callable, ParamSpec, TypeVar
-from pyfiglet import figlet_format
+from types import ModuleType
+import importlib.util
 import shutil
 import random
 import functools
+import sys
 
 P = ParamSpec("P")
 T = TypeVar("T")
@@ -13,6 +13,31 @@ T = TypeVar("T")
 MISSING = object()
 
 
+def lazy_import(name: str) -> ModuleType:
+    """
+    Import a module lazily: the module is only executed when one of its attributes is
+    accessed for the first time. Used for slow dependencies that are not needed to
+    start the program (MIDI backends, GUI automation, ...).
+
+    Args:
+        name (str): The absolute name of the module to import.
+
+    Returns:
+        ModuleType: The module, loaded on first attribute access.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
 def alias_param(name: str, alias: str):
     """
     Alias a keyword parameter in a function. Throws a TypeError when a value is
@@ -39,10 +64,15 @@ def alias_param(name: str, alias: str):
 def info_message(message: str, should_print: bool = False) -> None:
     """Print an information message"""
     if should_print:
+        from rich.panel import Panel
+
         print(Panel(f"[bold blue]{message}[/bold blue]"))
 
 
 def greeter() -> None:
+    from importlib.metadata import version
+    from pyfiglet import figlet_format
+
     font_choice = random.choice(["roman", "basic", "computer"])
     banner = figlet_format("Shrimp", font=font_choice)
     # Detect terminal size
@@ -1,10 +1,12 @@
 import math
+import threading
 from itertools import groupby
 
 from shrimp.Systems.Carousel import s, speed, n, create_param, create_params
 
 from shrimp.Systems.Carousel import (
     Hap,
+    Pattern,
     TimeSpan,
     choose,
     choose_cycles,
@@ -18,12 +20,19 @@ from shrimp.Systems.Carousel import (
     randcat,
     rev,
     saw,
+    sequence,
+    shared_queries,
+    signal,
     slowcat,
     stack,
+    time_to_rand,
     timecat,
+    times_to_rands,
     wchoose,
     wchoose_with,
 )
+from shrimp.Systems.Carousel.Render import ProcessRenderer, compile_source
+from shrimp.Systems.Carousel.Utils import euclid_rhythm, bjorklund
 
 
 def assert_equal_patterns(input, expected, span=None):
@@ -33,6 +42,12 @@ def assert_equal_patterns(input, expected, span=None):
     assert sorted(input.query(span)) == sorted(expected.query(span))
 
 
+def recorded(pattern, queries, key=None):
+    """Wraps a pattern to record its queries: the query span, or `key`, is appended to
+    `queries` each time the pattern is queried"""
+    return Pattern(lambda span: queries.append(span if key is None else key) or pattern.query(span))
+
+
 def test_add():
     """Test the addition of a numerical value to a pattern"""
     assert_equal_patterns(pure(3) + 2, pure(5))
@@ -565,3 +580,173 @@ def test_create_params():
     assert s("bd").foo(17).bar(42).first_cycle() == [
         Hap(TimeSpan(0, 1), TimeSpan(0, 1), {"s": "bd", "foo": 17, "bar": 42})
     ]
+
+
+def test_process_renderer():
+    """Cycles rendered by worker processes should match the local queries"""
+    target = object()
+    source = "s('bd [cp cp] <hh sn>').n(irand(8).segment(4)) >> out(dest)"
+    pattern = compile_source(source, {"dest": target})
+    renderer = ProcessRenderer(workers=1, targets={"dest": target})
+    try:
+        renderer.set_source("d1", source)
+        for begin, end in [(0, 1), (1, 2), (2.25, 2.75)]:
+            assert renderer.events("d1", begin, end, timeout=None) == [
+                (float(hap.whole.begin), float(hap.whole.end), hap.value)
+                for hap in pattern.onsets_only().query(TimeSpan(begin, end))
+            ]
+        assert renderer.events("d2", 0, 1) is None
+    finally:
+        renderer.close()
+
+
+def test_process_renderer_source_change():
+    """Changing or removing a source after its cycles are rendered should not block"""
+    renderer = ProcessRenderer(workers=1, targets={"dest": None})
+    events = []
+
+    def edit():
+        renderer.set_source("d1", "s('bd sn') >> out(dest)")
+        renderer.events("d1", 0, 3, timeout=None)
+        renderer.events("d1", 3, 4, timeout=None)
+        renderer.set_source("d1", "s('hh*4') >> out(dest)")
+        events.append(renderer.events("d1", 0, 1, timeout=None))
+        renderer.events("d1", 3, 4, timeout=None)
+        renderer.remove("d1")
+
+    thread = threading.Thread(target=edit, daemon=True)
+    thread.start()
+    thread.join(60)
+    # A deadlocked renderer keeps its lock: it cannot be closed
+    assert not thread.is_alive()
+    try:
+        assert [len(e) for e in events] == [4]
+        assert renderer.events("d1", 0, 1) is None
+    finally:
+        renderer.close()
+
+
+def test_applicative_operators():
+    """Operator methods should take the structure from the left, right or both patterns"""
+    haps = n("0 1").addleft(n("10 20 30 40")).first_cycle()
+    assert [(hap.whole, hap.value["n"]) for hap in haps] == [
+        (TimeSpan(0, 0.5), 10),
+        (TimeSpan(0, 0.5), 20),
+        (TimeSpan(0.5, 1), 31),
+        (TimeSpan(0.5, 1), 41),
+    ]
+    assert_equal_patterns(n("0 1").addright(n("10 20 30 40")), n("10 20 31 41"))
+    assert_equal_patterns(n("0 1").mulright(n("2 3")), n("0 3"))
+    assert_equal_patterns(n("4 8").subboth(n("1")), n("3 7"))
+
+
+def test_constant_arguments():
+    """Constant arguments should give the same haps as the equivalent pure patterns"""
+    pat = s("bd [sn cp] hh").n("0 1 2 3")
+    for span in [TimeSpan(0, 1), TimeSpan(3, 4), TimeSpan(1.25, 1.75)]:
+        for constant, lifted in [
+            (pat.fast(3), pat.fast(pure(3))),
+            (pat.slow(1.5), pat.slow(pure(1.5))),
+            (pat.late(0.25), pat.late(pure(0.25))),
+            (pat.sometimes_by(0.3, rev), pat.sometimes_by(pure(0.3), rev)),
+            (pat.somecycles_by(0.5, rev), pat.somecycles_by(pure(0.5), rev)),
+        ]:
+            assert constant.query(span) == lifted.query(span)
+
+
+def test_hash_consing():
+    """Declarative constructors with equal arguments should build the same pattern"""
+    assert s("bd*4") is s("bd*4")
+    assert pure(1) is pure(1) and pure(1) is not pure(1.0)
+    assert stack(s("bd"), n(1)) is stack(s("bd"), n(1))
+    assert s("bd sn").fast(2) is s("bd sn").fast(2)
+    assert s("bd sn").fast(2) is not s("bd sn").fast(3)
+    assert n([1, 2]) is not n([1, 2])
+
+
+def test_shared_queries():
+    """Within shared_queries, a shared subtree should be queried once per span"""
+    spans = []
+    leaf = recorded(s("bd cp"), spans)
+    players = [stack(leaf).fast(2).with_value(lambda v, i=i: {**v, "n": i}) for i in range(10)]
+    span = TimeSpan(0, 1 / 4)
+    with shared_queries():
+        haps = [player.query(span) for player in players]
+    assert len(spans) == 1
+    assert [hap.value for hap in haps[3]] == [{"s": "bd", "n": 3}]
+    players[0].query(span)
+    assert len(spans) == 2
+
+
+def test_euclid_rhythm():
+    """Euclidean rhythms should be computed from the table, like struct over booleans"""
+    assert euclid_rhythm(3, 8) == (1, 0, 0, 1, 0, 0, 1, 0) == tuple(bjorklund(3, 8))
+    assert euclid_rhythm(3, 8, 2) == (0, 1, 0, 0, 1, 0, 1, 0)
+    assert euclid_rhythm(5, 13) is euclid_rhythm(5, 13)
+    pat = s("bd [sn cp]").n("0 1 2")
+    for k, n_, rot in [(3, 8, 0), (5, 8, 2), (7, 16, 3)]:
+        expected = pat.struct(sequence(list(euclid_rhythm(k, n_, rot))))
+        for span in [TimeSpan(0, 1), TimeSpan(2, 3), TimeSpan(0.3, 0.7)]:
+            assert pat.euclid(k, n_, rot).query(span) == expected.query(span)
+
+
+def test_struct_mask_spans():
+    """struct and mask should split haps on the structure, also over partial spans"""
+    pat = s("bd [sn cp]")
+    span = TimeSpan(0.375, 0.875)
+    assert pat.struct([1, 0, 1, 1]).query(span) == pat.struct("1 0 1 1").query(span)
+    assert [(hap.whole, hap.part) for hap in pat.mask("1 0 1 1").query(span)] == [
+        (TimeSpan(0.5, 0.75), TimeSpan(0.5, 0.75)),
+        (TimeSpan(0.75, 1), TimeSpan(0.75, 0.875)),
+    ]
+
+
+def test_stack_order():
+    """Stacked haps should be sorted by onset, in the order of the layers at equal onsets"""
+    haps = stack(s("a b"), s("c d e f"), s("g").rev()).query(TimeSpan(0, 1))
+    assert [hap.value["s"] for hap in haps] == ["a", "c", "g", "d", "b", "e", "f"]
+
+
+def test_layers_share_queries():
+    """Layers of a pattern should query it once per span"""
+    spans = []
+    base = recorded(s("bd sn"), spans)
+    layered = base.layer(*[lambda p, i=i: p.gain(i) for i in range(8)])
+    assert len(layered.query(TimeSpan(0, 1))) == 16
+    assert len(spans) == 1
+
+
+def test_timecat_visits_overlapping_children():
+    """Sequences should only query the children overlapping the span"""
+    queried = []
+    pat = timecat(*[(1 + i % 2, recorded(pure(i), queried, i)) for i in range(16)])
+    assert [hap.value for hap in pat.query(TimeSpan(0.5, 0.6))] == [8, 9]
+    assert queried == [8, 9]
+    assert [hap.value for hap in pat.query(TimeSpan(1, 2))] == list(range(16))
+
+
+def test_choose_cycles_queries_one_pattern():
+    """Random alternations should only query the pattern picked for each cycle"""
+    queried = []
+    haps = choose_cycles(*[recorded(pure(i), queried, i) for i in range(3)]).query(TimeSpan(0, 4))
+    assert queried == [hap.value for hap in haps] == [0, 1, 1, 1]
+
+
+def test_seeded_randomness():
+    """Seeds should select reproducible random streams, batches should match scalars"""
+    span = TimeSpan(0, 4)
+    assert rand(seed=0).segment(8).query(span) == rand().segment(8).query(span)
+    assert rand(seed=7).segment(8).query(span) == rand(seed=7).segment(8).query(span)
+    assert rand(seed=7).segment(8).query(span) != rand().segment(8).query(span)
+    times = [TimeSpan(i / 16, (i + 1) / 16).midpoint() for i in range(-100, 100)]
+    for seed in [0, 7]:
+        assert times_to_rands(times, seed) == [time_to_rand(t, seed) for t in times]
+        assert times_to_rands(times[:8], seed) == [time_to_rand(t, seed) for t in times[:8]]
+    pat = pure("sd").fast(8)
+    assert pat.degrade_by(0.5, seed=7).query(span) == pat.degrade_by(0.5, rand(seed=7)).query(span)
+
+
+def test_perlin_signal():
+    """The perlin signal should give the same values as perlin noise of the time"""
+    for span in [TimeSpan(0.1, 0.2), TimeSpan(2.375, 3.5), TimeSpan(-1.25, -1), TimeSpan(7, 7)]:
+        assert perlin().query(span) == perlin(signal(lambda t: t + 0)).query(span)
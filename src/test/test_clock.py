@@ -1,4 +1,5 @@
 from shrimp import Clock, read_configuration
+from shrimp.environment import Environment
 import math
 
 
@@ -54,3 +55,36 @@ def test_clock_remove_by_func():
     CLOCK.add(func=children_func, name="test")
     CLOCK.remove_by_func(children_func)
     assert "test" not in CLOCK.children.keys()
+
+
+def test_clock_transport_steady_state():
+    """The clock should only dispatch play/pause messages on transport transitions"""
+    clock = Clock(120, grain=0.001, delay=0)
+    clock._link.enabled = False  # do not follow other Link peers
+    env, dispatched = Environment(), []
+    env.dispatch = lambda sender, message_type, data: dispatched.append(message_type)
+    clock.env = env
+
+    for _ in range(100):
+        clock._update_time()
+    clock.play()
+    for _ in range(100):
+        clock._update_time()
+    clock.pause()
+    for _ in range(100):
+        clock._update_time()
+
+    assert dispatched == ["children_reset", "pause"]
+    assert clock.transitions == {"play": 1, "pause": 1}
+
+
+def test_clock_transport_debounce():
+    """Start/stop changes coming from Link should be debounced"""
+    clock = Clock(120, grain=0.001, delay=0)
+    clock._link.enabled = False
+    clock.transport_debounce = 60
+    clock._follow_transport(not clock._playing)
+    assert clock.transitions == {"play": 0, "pause": 0}
+    clock.transport_debounce = 0
+    clock._follow_transport(not clock._playing)
+    assert sum(clock.transitions.values()) == 1
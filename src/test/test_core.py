@@ -0,0 +1,22 @@
+import subprocess
+import sys
+import os
+
+HEADLESS = """
+import sys, threading
+import shrimp.core
+from shrimp import Clock, Player, configuration
+assert threading.active_count() == 1, threading.enumerate()
+assert "shrimp.session" not in sys.modules
+assert shrimp.core.get_global_environment().clock is None
+"""
+
+
+def test_core_import_is_headless():
+    """Importing the headless entry point should not start threads, ports or a session"""
+    environment = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    environment.pop("DISPLAY", None)
+    result = subprocess.run(
+        [sys.executable, "-c", HEADLESS], env=environment, capture_output=True, text=True
+    )
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,98 @@
+from shrimp.environment import Environment, Subscriber
+import threading
+
+
+class Recorder(Subscriber):
+    def __init__(self, *message_types):
+        super().__init__()
+        self.received = []
+        for message_type in message_types:
+            self.register_handler(message_type, lambda _, t=message_type: self.received.append(t))
+
+
+def test_dispatch_by_message_type():
+    """Messages should only reach the subscribers handling their type"""
+    env = Environment()
+    a, b = Recorder("play"), Recorder("stop")
+    env.subscribe(a)
+    env.subscribe(b)
+    env.dispatch(None, "play", {})
+    env.dispatch(None, "stop", {})
+    env.dispatch(None, "unknown", {})
+    assert a.received == ["play"]
+    assert b.received == ["stop"]
+
+
+def test_dispatch_skips_sender():
+    """The sender of a message should not receive it"""
+    env = Environment()
+    a, b = Recorder("play"), Recorder("play")
+    env.subscribe(a)
+    env.subscribe(b)
+    env.dispatch(a, "play", {})
+    assert a.received == [] and b.received == ["play"]
+
+
+def test_register_handler_after_subscribe():
+    """Handlers registered after subscribing should be dispatched to"""
+    env = Environment()
+    a = Recorder()
+    env.subscribe(a)
+    a.register_handler("pause", lambda _: a.received.append("late"))
+    env.dispatch(None, "pause", {})
+    assert a.received == ["late"]
+
+
+def test_unsubscribe():
+    """Unsubscribed components should not receive messages anymore"""
+    env = Environment()
+    a = Recorder("play", "stop")
+    env.subscribe(a)
+    env.subscribe(a)
+    env.dispatch(None, "play", {})
+    env.unsubscribe(a)
+    env.dispatch(None, "play", {})
+    env.dispatch(None, "stop", {})
+    assert a.received == ["play"]
+    assert a not in env.subscribers
+
+
+def test_async_dispatch():
+    """Asynchronous messages should be handled in order, outside of the dispatching thread"""
+    env = Environment()
+    a = Recorder("play")
+    threads = []
+    a.register_handler("pause", lambda data: threads.append(threading.current_thread()))
+    a.register_handler("stop", lambda data: a.received.append(data["n"]))
+    env.subscribe(a)
+    env.enable_async_dispatch(message_types=["pause", "stop"], workers=2)
+    for n in range(100):
+        env.dispatch(None, "stop", {"n": n})
+    env.dispatch(None, "pause", {})
+    env.drain()
+    assert a.received == list(range(100))
+    assert threads[0] is not threading.current_thread()
+    env.disable_async_dispatch()
+    env.dispatch(None, "play", {})
+    assert a.received[-1] == "play"
+
+
+def test_children_reset_is_synchronous():
+    """children_reset should be handled before the following play, in the dispatching thread"""
+    env = Environment()
+    a = Recorder()
+    handled = []
+    for message_type in ("children_reset", "play"):
+        a.register_handler(
+            message_type,
+            lambda _, t=message_type: handled.append((t, threading.current_thread())),
+        )
+    env.subscribe(a)
+    env.enable_async_dispatch()
+    env.dispatch(None, "children_reset", {})
+    env.dispatch(None, "play", {})
+    assert handled == [
+        ("children_reset", threading.current_thread()),
+        ("play", threading.current_thread()),
+    ]
+    env.disable_async_dispatch()
@@ -0,0 +1,105 @@
+from shrimp.IO.midi import MIDIClock, MIDIOut
+import time
+
+
+class FakePort:
+    """mido output port recording the messages sent, with the beat at which they are sent"""
+
+    def __init__(self, link=None):
+        self.link, self.messages = link, []
+
+    def send(self, message):
+        beat = self.link.beat() if self.link else None
+        self.messages.append((message.type, getattr(message, "pos", None), beat))
+
+    def types(self):
+        return [message_type for message_type, _, _ in self.messages]
+
+
+class FakeSessionState:
+    def __init__(self, link):
+        self._link = link
+
+    def isPlaying(self):
+        return self._link.playing
+
+    def beatAtTime(self, micros, quantum):
+        return (micros - self._link.origin) / self._link.micros_per_beat
+
+    def timeAtBeat(self, beat, quantum):
+        return self._link.origin + beat * self._link.micros_per_beat
+
+
+class FakeLink:
+    """Link session whose timeline starts at `origin` (in microseconds of the real clock)"""
+
+    def __init__(self, tempo: float, origin: float):
+        self.playing, self.origin = False, origin
+        self.micros_per_beat = 60e6 / tempo
+
+    def captureSessionState(self):
+        return FakeSessionState(self)
+
+    def clock(self):
+        return self
+
+    def micros(self):
+        return time.perf_counter() * 1e6
+
+    def beat(self):
+        return self.captureSessionState().beatAtTime(self.micros(), 4)
+
+
+class FakeClock:
+    def __init__(self, link: FakeLink):
+        self.link, self.time_signature = link, (4, 4)
+
+    def precise_wait(self, duration):
+        time.sleep(duration)
+
+
+def make_midi_clock(link=None):
+    out = MIDIOut("fake", clock=None)
+    out._midi_out_port, out._opened = FakePort(link), True
+    return MIDIClock(out, FakeClock(link)), out._midi_out_port
+
+
+def test_midi_clock_transport():
+    """Transport changes should send start, stop, and song position then continue"""
+    midi_clock, port = make_midi_clock()
+    midi_clock._transport(True, 0)
+    assert port.types() == ["start"] and midi_clock._tick == 0
+    midi_clock._transport(False, 2.5)
+    assert port.types() == ["start", "stop"] and midi_clock._tick is None
+    port.messages.clear()
+    midi_clock._transport(True, 10.3)
+    assert [(t, pos) for t, pos, _ in port.messages] == [("songpos", 42), ("continue", None)]
+    assert midi_clock._tick == 42 * 6
+
+
+def test_midi_clock_resume_past_song_position_range():
+    """Resuming past the last song position should continue without position"""
+    midi_clock, port = make_midi_clock()
+    midi_clock._transport(True, 5000.2)
+    assert port.types() == ["continue"] and midi_clock._tick == 20001 * 6
+    midi_clock._transport(True, 4095.75)
+    assert port.types()[-2:] == ["songpos", "continue"]
+    assert port.messages[-2][1] == MIDIClock.MAX_SONG_POSITION
+
+
+def test_midi_clock_ticks():
+    """The generator should start on the downbeat and send 24 ticks per beat, on time"""
+    link = FakeLink(tempo=300, origin=(time.perf_counter() + 0.05) * 1e6)
+    link.playing = True
+    midi_clock, port = make_midi_clock(link)
+    midi_clock.start()
+    time.sleep(0.35)
+    link.playing = False
+    time.sleep(0.05)
+    midi_clock.stop()
+
+    assert port.types()[0] == "start" and port.types()[-1] == "stop"
+    ticks = [beat for message_type, _, beat in port.messages if message_type == "clock"]
+    assert len(ticks) > 24
+    # Tick k is due at beat k/24: never early, and late by less than a tick and a half
+    assert all(k / 24 - 1e-3 <= beat < (k + 1.5) / 24 for k, beat in enumerate(ticks))
@@ -0,0 +1,162 @@
+from shrimp.IO.osc import OSC, _encode_message, _parse_packet, _timetag
+from osc4py3 import oscbuildparse
+from osc4py3.oscmethod import OSCARG_ADDRESS, OSCARG_DATA, OSCARG_DATAUNPACK
+import socket
+import struct
+import pytest
+
+
+MESSAGES = [
+    [],
+    [1, 2, 3],
+    [0.5, -1.25, 440.0],
+    ["s", "superpiano", "n", 60, "orbit", 0],
+    ["cps", 0.5625, "cycle", 12.25, "delta", 0.125, "s", "bd:3"],
+    [True, False, None],
+    [b"abcde", "pad", b""],
+]
+
+
+def encode_bundle(timetag, messages, address="/dirt/play"):
+    return oscbuildparse.encode_packet(
+        oscbuildparse.OSCBundle(
+            timetag=timetag,
+            elements=[oscbuildparse.OSCMessage(address, None, message) for message in messages],
+        )
+    )
+
+
+@pytest.mark.parametrize("message", MESSAGES)
+def test_encode_message(message):
+    """Messages should be encoded exactly like osc4py3 does"""
+    expected = oscbuildparse.encode_packet(oscbuildparse.OSCMessage("/dirt/play", None, message))
+    assert _encode_message("/dirt/play", message) == expected
+
+
+def test_encode_message_fallback():
+    """Arguments not handled by the fast encoder should be encoded by osc4py3"""
+    message = [oscbuildparse.OSCmidi(0, 144, 60, 100), [1, 2]]
+    expected = oscbuildparse.encode_packet(oscbuildparse.OSCMessage("/midi", None, message))
+    assert _encode_message("/midi", message) == expected
+
+
+@pytest.mark.parametrize("timestamp", [0.0, 1.5, 1700000000.0, 1700000000.25, 1712345678.875])
+def test_timetag_exact(timestamp):
+    """Timetags of exactly representable timestamps should match osc4py3"""
+    seconds, fraction = oscbuildparse.unixtime2timetag(timestamp)
+    assert _timetag(timestamp) == struct.pack(">II", seconds, fraction)
+
+
+@pytest.mark.parametrize("timestamp", [1700000000.1, 1712345678.123456, 1798765432.999999])
+def test_timetag_precision(timestamp):
+    """Timetags should never be further than a microsecond from osc4py3's"""
+    seconds, fraction = oscbuildparse.unixtime2timetag(timestamp)
+    expected = (seconds << 32) + fraction
+    assert abs(struct.unpack(">Q", _timetag(timestamp))[0] - expected) < 2**32 // 1_000_000
+
+
+def test_encode_bundle():
+    """Bundles should be encoded exactly like osc4py3 does"""
+    timestamp = 1700000000.5
+    encoded = [_encode_message("/dirt/play", message) for message in MESSAGES]
+    packet = b"".join(
+        [b"#bundle\0", _timetag(timestamp)] + [struct.pack(">i", len(m)) + m for m in encoded]
+    )
+    assert packet == encode_bundle(oscbuildparse.unixtime2timetag(timestamp), MESSAGES)
+
+
+def test_parse_packet():
+    """Parsed bundles should keep the latest arguments of each address"""
+    packet = oscbuildparse.encode_packet(
+        oscbuildparse.OSCBundle(
+            timetag=oscbuildparse.OSC_IMMEDIATELY,
+            elements=[
+                oscbuildparse.OSCMessage("/fader", None, [0.5, 1]),
+                oscbuildparse.OSCMessage("/fader", None, [0.25, 2]),
+                oscbuildparse.OSCMessage("/name", None, ["shrimp", True, b"xyz"]),
+            ],
+        )
+    )
+    values, handlers, called = {}, {}, []
+    handlers["/name"] = lambda *args: called.append(args)
+    _parse_packet(bytearray(packet), 0, len(packet), values, handlers)
+    assert values == {"/fader": (0.25, 2), "/name": ("shrimp", True, b"xyz")}
+    assert called == [("shrimp", True, b"xyz")]
+
+
+def test_parse_arguments():
+    """Strings, blobs and 64-bit numbers should be parsed on both parsing paths"""
+    numbers = _encode_message("/n", []).replace(b",\0\0\0", b",hd\0") + struct.pack(
+        ">qd", -(2**40), 0.1
+    )
+    mixed = (
+        b"/m\0\0,sbhs\0\0\0"
+        + b"caf\xc3\xa9\0\0\0"
+        + struct.pack(">i", 5)
+        + b"abcde\0\0\0"
+        + struct.pack(">q", 2**40 + 1)
+        + b"\0\0\0\0"
+    )
+    values = {}
+    for packet in (numbers, mixed):
+        _parse_packet(bytearray(packet), 0, len(packet), values, {})
+    assert values == {"/n": (-(2**40), 0.1), "/m": ("caf\xe9", b"abcde", 2**40 + 1, "")}
+
+
+@pytest.mark.parametrize(
+    "packet",
+    [
+        b"/n\0\0,ii\0" + struct.pack(">i", 1),  # truncated numbers
+        b"/s\0\0,is\0" + struct.pack(">i", 1) + b"abc",  # unterminated string
+        b"/b\0\0,b\0\0" + struct.pack(">i", 8) + b"abcd",  # truncated blob
+        b"/b\0\0,b\0\0" + struct.pack(">i", -8) + b"abcd",  # negative blob size
+        b"/x\0\0,x\0\0",  # unknown type tag
+        b"/address-without-end",
+        b"#bundle\0" + bytes(8) + struct.pack(">i", 64) + _encode_message("/n", [1]),
+        b"#bundle\0" + bytes(8) + struct.pack(">i", -4) + _encode_message("/n", [1]),
+        b"#bundle\0" + bytes(8) + b"\0\0",
+    ],
+)
+def test_parse_malformed_packet(packet):
+    """Malformed and truncated packets should be rejected, even with stale data in the
+    receive buffer after them"""
+    buffer = bytearray(packet + _encode_message("/stale", [1, 2, 3]))
+    values = {}
+    with pytest.raises((ValueError, IndexError, struct.error)):
+        _parse_packet(buffer, 0, len(packet), values, {})
+    assert "/stale" not in values
+
+
+def test_attach():
+    """Handlers should receive unpacked arguments or the arguments tuple; address patterns
+    and other argument schemes are not supported"""
+    osc = OSC("test", "127.0.0.1", 0, clock=None)
+    called = []
+    osc.attach("/unpack", lambda *args: called.append(args))
+    osc.attach("/explicit", lambda *args: called.append(args), argscheme=OSCARG_DATAUNPACK)
+    osc.attach("/data", called.append, argscheme=OSCARG_DATA)
+    for address in ("/unpack", "/explicit", "/data"):
+        osc._handlers[address](1, "a")
+    assert called == [(1, "a")] * 3
+    with pytest.raises(ValueError):
+        osc.attach("/a", print, argscheme=OSCARG_ADDRESS + OSCARG_DATAUNPACK)
+    with pytest.raises(ValueError):
+        osc.attach("/fader/*", print)
+    assert "/a" not in osc._handlers
+    osc._stop(None)
+
+
+def test_stop_closes_sockets():
+    """Stopping an OSC object should send the queued messages, then close its sockets"""
+    receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    receiver.bind(("127.0.0.1", 0))
+    receiver.settimeout(5)
+    osc = OSC("test", "127.0.0.1", receiver.getsockname()[1], clock=None)
+    osc.listen(0, "127.0.0.1")
+    osc.send("/ping", [[1, 2]])
+    osc._stop(None)
+    packet, values = bytearray(receiver.recv(1024)), {}
+    _parse_packet(packet, 0, len(packet), values, {})
+    receiver.close()
+    assert values == {"/ping": (1, 2)}
+    assert osc._in_socket is None and osc._socket.fileno() == -1
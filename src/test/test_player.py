@@ -0,0 +1,106 @@
+from shrimp.Time.Clock import Clock
+from shrimp.Systems.PlayerSystem.PatternPlayer import Player
+from shrimp.Systems.PlayerSystem.Library.SequencePattern import Pseq
+from shrimp.Systems.PlayerSystem.Pattern import Pattern
+from shrimp.Systems.PlayerSystem.Rest import Rest
+from collections.abc import Iterable
+
+
+def play(lookahead: int, until: float = 20, step: float = 0.005, change_to=None) -> list:
+    """Play a player on a manually ticked clock and return (beat, note) pairs. The lookahead
+    of the running player is set to `change_to` at beat 6"""
+    clock = Clock(120)
+    clock._link.enabled = False
+    clock._playing = True
+    played = []
+    sender = lambda **kwargs: Player._play_factory(
+        lambda **k: played.append((round(clock._beat, 3), k["n"])), **kwargs
+    )
+    player = Player("test", clock)
+    player.lookahead = lookahead
+    player >> [
+        sender(n=Pseq(1, 2, 3), period=Pseq(0.5, 0.25, Rest(0.5)), limit=5),
+        sender(n=Pseq(7, 8), period=1, swing=0.1, limit=3),
+    ]
+    beat = 0.0
+    while beat < until:
+        clock._beat = beat
+        if beat == 6 and change_to is not None:
+            player.lookahead = change_to
+        if beat == 12:
+            player >> sender(n=Pseq(10, 20, 30), period=0.75)
+        clock._execute_due_functions()
+        beat = round(beat + step, 3)
+    return played
+
+
+def test_player_lookahead():
+    """Lookahead mode should play the same events at the same times, live edits included.
+    Pattern transitions may happen one tick earlier: they are not rescheduled anymore."""
+    expected = play(lookahead=0)
+    assert len(expected) > 20
+    for lookahead in (1, 8):
+        played = play(lookahead=lookahead)
+        assert [note for _, note in played] == [note for _, note in expected]
+        assert all(abs(a - b) < 0.006 for (a, _), (b, _) in zip(played, expected))
+
+
+def test_player_lookahead_change():
+    """Changing the lookahead of a running player should only apply on the next start"""
+    expected = play(lookahead=0)
+    for lookahead, change_to in [(8, 0), (0, 8), (8, 2)]:
+        played = play(lookahead=lookahead, change_to=change_to)
+        assert [note for _, note in played] == [note for _, note in expected]
+        assert all(abs(a - b) < 0.006 for (a, _), (b, _) in zip(played, expected))
+
+
+def resolve_per_event(value, i):
+    """Keyword argument resolution of players before senders were compiled"""
+    if isinstance(value, Pattern):
+        return resolve_per_event(value(i), i)
+    elif isinstance(value, (list, tuple)):
+        return [resolve_per_event(item, i) for item in value]
+    elif isinstance(value, dict):
+        return {k: resolve_per_event(v, i) for k, v in value.items()}
+    elif isinstance(value, Iterable):
+        return resolve_per_event(next(value), i)
+    elif callable(value):
+        try:
+            return resolve_per_event(value(), i)
+        except TypeError:
+            return resolve_per_event(value(i), i)
+    return value
+
+
+def make_sender(rest):
+    return Player._play_factory(
+        lambda *args, **kwargs: None,
+        Pseq(1, 2, 3),
+        lambda: "called",
+        [4, 5],
+        9,
+        rest,
+        n=Pseq(60, 62, 64),
+        amp=lambda: 0.5,
+        index=lambda i: i * 2,
+        velocity=80,
+        dur=rest,
+        chord=[Pseq(60, 64), 67, (Pseq(1, 2), 3)],
+        params={"cutoff": Pseq(500, 1000), "q": 0.3},
+        count=iter(range(100)),
+        nested=Pseq(Pseq(1, 2), lambda: 7),
+    )
+
+
+def test_sender_plan():
+    """Compiled plans should resolve arguments like the per-event resolution did: patterns,
+    callables, generators and nested containers; constants and rests are kept as is"""
+    rest = Rest(0.5)
+    compiled, generic = make_sender(rest), make_sender(rest)
+    for i in range(12):
+        args, kwargs = compiled.compile().resolve(i)
+        assert kwargs == {key: resolve_per_event(v, i) for key, v in generic.kwargs.items()}
+        assert kwargs["dur"] is rest
+        # Per-event resolution dropped the scalar and rest positional arguments
+        assert args == (generic.args[0](i), "called", [4, 5], 9, rest)
+    assert compiled.compile() is compiled.plan
@@ -0,0 +1,76 @@
+from shrimp.Systems.PlayerSystem.Library.MathPattern import Pexp, Plin, Plog, Pgeom, Parr
+from shrimp.Systems.PlayerSystem.Library.SequencePattern import Pseq, Pnote
+from shrimp.Systems.PlayerSystem.Library.SequenceTransformer import reverse, shuffle
+from shrimp.Systems.PlayerSystem.Library.RhythmPattern import Peuclid, Pbin, Pxo
+from shrimp.Systems.PlayerSystem.Library.RandomPattern import Pchoose
+import random
+import math
+import pytest
+
+
+PATTERNS = [
+    Pexp(1, 8, 16),
+    Pexp(0.5, 2.0, 7),
+    Plin(0, 10, 4),
+    Plin(0.25, -3.5, 9),
+    Plog(1, 100, 5),
+    Pgeom(1, 2, 12),
+    Pgeom(0.5, 1.5, 10),
+    Parr(3, 2, 5),
+    Parr(0.1, 0.3, 11),
+    Pseq(1, 2, [3, 4], (5, 6)),
+    Pseq(1, Pseq(2, 3), 4),
+    Pnote(0, 2, 4, 7, root=60, scale=[0, 2, 4, 5, 7, 9, 11]),
+    Peuclid(3, 8),
+    Pbin(37, 2),
+    Pxo("xoxxo", 0.5),
+    Pseq(1, 2, 3) + 10,
+    (Pseq(1, 2, 3) * Plin(0, 1, 4)).int(),
+    2 ** Parr(0, 1, 8) - Pseq(1, 2),
+]
+
+
+def as_comparable(value):
+    return (type(value).__name__, getattr(value, "duration", value))
+
+
+@pytest.mark.parametrize("pattern", PATTERNS)
+def test_take(pattern):
+    """take(start, n) should return the same values as calling the pattern n times"""
+    expected = [pattern(i) for i in range(5, 45)]
+    values = pattern.take(5, 40)
+    assert len(values) == len(expected)
+    for value, other in zip(values, expected):
+        if isinstance(value, float):
+            assert math.isclose(value, other, rel_tol=1e-12)
+        else:
+            assert as_comparable(value) == as_comparable(other)
+
+
+def test_take_fallback():
+    """Patterns without a batch implementation should fall back to the per-index loop"""
+    pattern = Pchoose(4, 4, 4)
+    assert pattern.take(0, 8) == [4] * 8
+
+
+def test_sequence_transformations_cache():
+    """Cached transformations should follow their conditions and not allocate per call"""
+    state = {"on": False}
+    pattern = Pseq(1, 2, 3).add(10).mul(2).cond(lambda: state["on"], reverse).mirror()
+    assert pattern.take(0, 5) == [22, 24, 26, 24, 22]
+    assert pattern._transformed_sequence() is pattern._transformed_sequence()
+    state["on"] = True
+    assert pattern.take(0, 5) == [26, 24, 22, 24, 26]
+    state["on"] = False
+    assert pattern(2) == 26
+    pattern.trim(2)
+    assert pattern.take(0, 3) == [22, 24, 22]
+
+
+def test_sequence_transformations_not_deterministic():
+    """Non-deterministic transformations should be applied on every evaluation"""
+    random.seed(0)
+    pattern = Pseq(*range(16)).add(1).cond(lambda: True, shuffle).reverse()
+    first, second = pattern._transformed_sequence(), pattern._transformed_sequence()
+    assert sorted(first) == list(range(1, 17))
+    assert first != second and first is not second
@@ -0,0 +1,95 @@
+from shrimp.IO.ring import EventRing, RingOutput
+from shrimp.IO.osc import OSC, _encode_arguments, _encode_message, _parse_packet
+from shrimp.Systems.Carousel.Streams.CarouselStream import CarouselStream
+import socket
+import pytest
+
+
+def test_push_pop():
+    """Records should be read in order, with their blob, across wrap-arounds"""
+    ring = EventRing(capacity=4, blob_size=16)
+    try:
+        for i in range(10):
+            assert ring.push(i + 0.5, i % 3, 7, bytes([i]) * i)
+            assert len(ring) == 1
+            assert ring.pop() == (i + 0.5, i % 3, 7, bytes([i]) * i)
+        assert ring.pop() is None
+        with pytest.raises(ValueError):
+            ring.push(0.0, 0, 0, b"x" * 17)
+    finally:
+        ring.close()
+
+
+def test_full_ring():
+    """A full ring should refuse records until the consumer reads"""
+    ring = EventRing(capacity=3, blob_size=8)
+    try:
+        assert all(ring.push(float(i), 0, 0, b"") for i in range(3))
+        assert not ring.push(3.0, 0, 0, b"")
+        assert ring.pop()[0] == 0.0
+        assert ring.push(3.0, 0, 0, b"")
+        assert [ring.pop()[0] for _ in range(3)] == [1.0, 2.0, 3.0]
+    finally:
+        ring.close()
+
+
+def test_attach():
+    """A ring attached by name should share the records and the layout"""
+    producer = EventRing(capacity=8, blob_size=64)
+    consumer = EventRing(name=producer.name)
+    try:
+        assert (consumer.capacity, consumer.blob_size) == (8, 64)
+        arguments = _encode_arguments(["s", "bd", "n", 3, "gain", 0.5])
+        producer.push(1.25, 1, 2, arguments)
+        received = []
+        assert consumer.drain(lambda *record: received.append(bytes(record[3]))) == 1
+        expected = _encode_message("/dirt/play", ["s", "bd", "n", 3, "gain", 0.5])
+        assert b"/dirt/play\0\0" + received[0] == expected
+        assert len(producer) == 0
+    finally:
+        consumer.close()
+        producer.close()
+
+
+def make_output():
+    receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    receiver.bind(("127.0.0.1", 0))
+    receiver.settimeout(5)
+    return receiver, OSC("test", "127.0.0.1", receiver.getsockname()[1], clock=None)
+
+
+def test_ring_output():
+    """Messages sent through a ring should be sent like messages sent directly"""
+    receiver, osc = make_output()
+    output = RingOutput(capacity=4, blob_size=64, max_poll_interval=0.01)
+    try:
+        message = ["s", "bd", "n", 3, "gain", 0.5]
+        osc.send("/dirt/play", [message], 1700000000.5)
+        direct = receiver.recv(1024)
+        assert output.send(osc, "/dirt/play", message, 1700000000.5)
+        assert receiver.recv(1024) == direct
+        assert not output.send(osc, "/dirt/play", ["s", "x" * 64], None)
+    finally:
+        output.close()
+        osc._stop(None)
+        receiver.close()
+
+
+def test_stream_event_ring():
+    """A stream with an event ring should hand its SuperDirt messages to the ring"""
+    receiver, osc = make_output()
+    output = RingOutput(capacity=4, blob_size=128)
+    stream = CarouselStream(clock=None, name="d1")
+    stream._ring = output
+    try:
+        event = {"s": "bd", "n": 3, "out": osc}
+        stream.send_superdirt_message(event, None, cps=0.5, cycle=2.0, delta=0.25)
+        packet, values = bytearray(receiver.recv(1024)), {}
+        _parse_packet(packet, 0, len(packet), values, {})
+        expected = ("s", "bd", "n", 3, "cps", 0.5, "cycle", 2.0, "delta", 0.25)
+        assert values == {"/dirt/play": expected}
+        assert output._targets == [osc] and output._addresses == ["/dirt/play"]
+    finally:
+        output.close()
+        osc._stop(None)
+        receiver.close()